@@ -4,14 +4,24 @@ Enhanced File Operations Toolkit
 --------------------------------------------------
 A powerful, interactive terminal utility for advanced file management.
 Features include:
-  • Copying files/directories with real-time progress tracking
+  • Copying files/directories with a parallel worker pool and real-time progress
+  • Resumable, checkpointed copies that continue after an interruption
+  • Sparse-aware copies (SEEK_DATA/SEEK_HOLE) that keep VM images sparse
   • Moving files/directories with cross-device detection
   • Deleting files/directories with interactive confirmation
   • Finding files using pattern matching and detailed listings
-  • Compressing files/directories into tar.gz with compression feedback
+  • Persistent, incrementally refreshed filename index for instant searches
+  • Parallel content search (grep mode) over memory-mapped files
+  • Compressing files/directories into tar archives with multi-threaded gzip/xz/zstd
+  • Streaming archive creation and parallel extraction (multi-member or sharded)
   • Calculating file checksums (MD5, SHA1, SHA256, SHA512) with progress
-  • Analyzing disk usage with visual summary tables
-  • Batch operations for efficient workflows
+  • Generating and verifying sha256sum-style checksum manifests in parallel
+  • Analyzing disk usage incrementally with cached totals and drill-down
+  • Finding duplicate files (size → partial hash → full hash) with cleanup actions
+  • Batch operations planned up front and run as one concurrent pipeline
+  • Directory comparison and delta sync (rsync-like) with a dry-run report
+  • Parallel recursive delete with live files/s progress
+  • Reproducible benchmark suite (copy, hash, compress, walk) with JSON history
 
 Note: Some operations may require root privileges.
 Version: 2.0.0
@@ -19,26 +29,67 @@ Version: 2.0.0
 
 import atexit
 import datetime
+import errno
+import fcntl
+import gzip
 import hashlib
+import heapq
+import io
+import json
+import lzma
+import math
+import mmap
+import multiprocessing
 import os
+import queue
+import random
 import re
+import resource
 import shutil
 import signal
+import sqlite3
 import stat
 import subprocess
 import sys
 import tarfile
+import tempfile
 import threading
 import time
+import zlib
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from functools import lru_cache
+from dataclasses import dataclass, field
 from datetime import datetime as dt
 from pathlib import Path
-from typing import List, Tuple, Dict, Optional, Any
+from typing import (
+    BinaryIO,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Tuple,
+    Dict,
+    Optional,
+    Any,
+    Set,
+)
 
 import pyfiglet
 from rich.align import Align
 from rich.columns import Columns
 from rich.console import Console
 from rich.live import Live
+from rich.markup import escape
 from rich.panel import Panel
 from rich.progress import (
     Progress,
@@ -46,6 +97,7 @@ from rich.progress import (
     BarColumn,
     TextColumn,
     TimeRemainingColumn,
+    TransferSpeedColumn,
     TaskID,
 )
 from rich.prompt import Prompt, Confirm, IntPrompt
@@ -55,6 +107,11 @@ from rich.traceback import install as install_rich_traceback
 from rich.style import Style
 from rich.theme import Theme
 
+try:
+    import zstandard
+except ImportError:  # Optional: enables the zstd compression backend
+    zstandard = None
+
 # Install rich traceback handler for improved error reporting.
 install_rich_traceback(show_locals=True)
 
@@ -74,8 +131,45 @@ HOSTNAME = (
 CHUNK_SIZE = 1024 * 1024  # 1 MB (used for checksum/compression progress)
 DEFAULT_BUFFER_SIZE = 8192  # Buffer for copy operations
 COMPRESSION_LEVEL = 9  # tar.gz compression level
+COMPRESSION_BLOCK_SIZE = 4 * 1024 * 1024  # Input bytes per independently compressed block
+DEFAULT_COMPRESSION_THREADS = os.cpu_count() or 1
+COMPRESSION_BENCH_SAMPLE = 256 * 1024 * 1024  # Max bytes read for the benchmark sample
 LARGE_FILE_THRESHOLD = 100 * 1024 * 1024  # 100 MB
 
+# Parallel copy settings
+DEFAULT_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)  # I/O bound, so oversubscribe
+MAX_COPY_WORKERS = 128
+COPY_QUEUE_FACTOR = 4  # In-flight files per worker before submission blocks
+
+# Resumable copy settings
+RESUME_SUFFIX = ".part"  # Partial data is written to <dest>.part
+RESUME_CHECKPOINT_SUFFIX = ".part.json"  # Checkpoint stored next to the partial file
+RESUME_CHECKPOINT_INTERVAL = 64 * 1024 * 1024  # Bytes copied between checkpoints
+RESUME_HASH_ALGORITHM = "sha256"
+
+# Sparse copy settings
+SPARSE_BLOCK_SIZE = 64 * 1024  # All-zero blocks of this size are left as holes
+ZERO_BLOCK = bytes(SPARSE_BLOCK_SIZE)
+
+# Tree walk settings
+DEFAULT_WALK_WORKERS = min(16, (os.cpu_count() or 1) * 2)  # Directories scanned at once
+
+# Parallel delete settings
+DEFAULT_DELETE_WORKERS = min(64, (os.cpu_count() or 1) * 8)  # Unlinks are latency bound
+
+# Kernel-side copy settings
+FICLONE = 0x40049409  # ioctl request for reflink clones (btrfs, xfs)
+# errno values meaning "this transfer method is unsupported here, try the next one"
+FALLBACK_ERRNOS = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.ENOTTY,
+    errno.EBADF,
+    errno.EPERM,
+}
+
 # File category extensions
 DOCUMENT_EXTENSIONS = {".pdf", ".doc", ".docx", ".txt", ".rtf", ".odt"}
 IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".svg", ".tiff"}
@@ -83,7 +177,100 @@ VIDEO_EXTENSIONS = {".mp4", ".avi", ".mkv", ".mov", ".wmv", ".flv"}
 AUDIO_EXTENSIONS = {".mp3", ".wav", ".ogg", ".flac", ".m4a", ".aac"}
 ARCHIVE_EXTENSIONS = {".zip", ".tar", ".gz", ".rar", ".7z", ".bz2"}
 CODE_EXTENSIONS = {".py", ".js", ".java", ".c", ".cpp", ".h", ".php", ".html", ".css"}
+VM_IMAGE_EXTENSIONS = {".qcow2", ".img", ".raw", ".vmdk", ".vdi", ".vhd", ".vhdx"}
 CHECKSUM_ALGORITHMS = ["md5", "sha1", "sha256", "sha512"]
+MMAP_THRESHOLD = 64 * 1024 * 1024  # Hash files at least this large through mmap
+# Hex digest length -> algorithm, used to detect a manifest's algorithm
+DIGEST_LENGTHS = {32: "md5", 40: "sha1", 64: "sha256", 128: "sha512"}
+
+# Duplicate detection
+DUPLICATE_HASH_ALGORITHM = "blake2b"
+DUPLICATE_SAMPLE_SIZE = 64 * 1024  # Bytes hashed from each end for the partial hash
+DEFAULT_HASH_WORKERS = os.cpu_count() or 1
+
+# Disk usage analysis
+DISK_USAGE_TOP_FILES = 20  # Largest files tracked per directory and overall
+
+# Compression backends: archive extensions, default level and valid level range
+COMPRESSION_BACKENDS: Dict[str, Dict[str, Any]] = {
+    "gzip": {
+        "extensions": (".tar.gz", ".tgz"),
+        "level": COMPRESSION_LEVEL,
+        "range": (1, 9),
+        "magic": b"\x1f\x8b",
+        "member_magic": b"\x1f\x8b\x08\x00",  # Header of each compress_block member
+    },
+    "xz": {
+        "extensions": (".tar.xz", ".txz"),
+        "level": 6,
+        "range": (0, 9),
+        "magic": b"\xfd7zXZ\x00",
+        "member_magic": b"\xfd7zXZ\x00",
+    },
+    "zstd": {
+        "extensions": (".tar.zst", ".tzst"),
+        "level": 3,
+        "range": (1, 22),
+        "magic": b"\x28\xb5\x2f\xfd",
+        "member_magic": b"\x28\xb5\x2f\xfd",
+    },
+}
+
+# Archive streaming & extraction
+WALK_QUEUE_LIMIT = 1_000_000  # Walk records buffered ahead of the archiver
+EXTRACT_MAX_PIECE = 4 * COMPRESSION_BLOCK_SIZE  # Larger members decompress serially
+EXTRACT_INLINE_LIMIT = 8 * 1024 * 1024  # Smaller files are written on the pool
+DEFAULT_EXTRACT_WORKERS = DEFAULT_COPY_WORKERS
+
+# Directory sync
+SYNC_HASH_ALGORITHM = "blake2b"
+
+# Content search
+GREP_MAX_FILE_SIZE = 100 * 1024 * 1024  # Larger files are skipped by default
+GREP_BINARY_SNIFF = 8192  # Files with a NUL byte in this prefix count as binary
+GREP_BATCH_SIZE = 64  # Files handed to a worker process per task
+GREP_MAX_MATCHES_PER_FILE = 100
+GREP_MAX_RESULTS = 1000  # Stop the whole search after this many matching lines
+GREP_LINE_WIDTH = 200  # Matched lines are truncated to this many characters
+
+# Persistent filename index
+INDEX_DIR = Path.home() / ".cache" / "file_toolkit"
+INDEX_BATCH_SIZE = 5000  # Rows written per transaction while indexing
+
+# Benchmark suite
+BENCH_RESULTS_DIR = INDEX_DIR / "benchmarks"
+BENCH_SEED = 42  # Same seed, same synthetic trees
+BENCH_FILES_PER_DIR = 100
+BENCH_SPARSE_STRIDE = 64 * 1024 * 1024  # One data extent per stride in sparse files
+# Synthetic tree profiles; "scale" says whether the scale factor multiplies the
+# number of files or their size. Mixed sizes are drawn log-uniformly.
+BENCH_PROFILES: Dict[str, Dict[str, Any]] = {
+    "small": {
+        "files": 5000,
+        "min_size": 1024,
+        "max_size": 16 * 1024,
+        "scale": "files",
+    },
+    "huge": {
+        "files": 2,
+        "min_size": 256 * 1024 * 1024,
+        "max_size": 256 * 1024 * 1024,
+        "scale": "size",
+    },
+    "mixed": {
+        "files": 1000,
+        "min_size": 0,
+        "max_size": 16 * 1024 * 1024,
+        "scale": "files",
+    },
+    "sparse": {
+        "files": 1,
+        "min_size": 1024 * 1024 * 1024,
+        "max_size": 1024 * 1024 * 1024,
+        "scale": "size",
+        "sparse": True,
+    },
+}
 
 # Terminal width for formatting
 TERM_WIDTH = shutil.get_terminal_size().columns
@@ -261,6 +448,24 @@ def format_time(seconds: float) -> str:
         return f"{int(h)}h {int(m)}m {int(s)}s"
 
 
+def get_file_category(path: str) -> str:
+    """Return the display category for a file based on its extension."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in DOCUMENT_EXTENSIONS:
+        return "Document"
+    elif ext in IMAGE_EXTENSIONS:
+        return "Image"
+    elif ext in VIDEO_EXTENSIONS:
+        return "Video"
+    elif ext in AUDIO_EXTENSIONS:
+        return "Audio"
+    elif ext in ARCHIVE_EXTENSIONS:
+        return "Archive"
+    elif ext in CODE_EXTENSIONS:
+        return "Code"
+    return "Other"
+
+
 def get_user_input(prompt_text: str, default: str = "") -> str:
     """Prompt for user input with styling."""
     return Prompt.ask(f"[bold {NordColors.FROST_2}]{prompt_text}[/]", default=default)
@@ -279,18 +484,19 @@ class ProgressManager:
     A context manager that wraps a Rich Progress for uniform progress tracking.
     """
 
-    def __init__(self):
-        self.progress = Progress(
+    def __init__(self, show_speed: bool = False):
+        columns = [
             SpinnerColumn(style=f"bold {NordColors.FROST_1}"),
             TextColumn("[bold {task.fields[color]}]{task.description}"),
             BarColumn(
                 complete_style=NordColors.FROST_2, finished_style=NordColors.GREEN
             ),
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeRemainingColumn(),
-            console=console,
-            expand=True,
-        )
+        ]
+        if show_speed:
+            columns.append(TransferSpeedColumn())
+        columns.append(TimeRemainingColumn())
+        self.progress = Progress(*columns, console=console, expand=True)
 
     def __enter__(self):
         self.progress.start()
@@ -364,263 +570,2110 @@ def ensure_root() -> None:
 
 
 # ----------------------------------------------------------------
-# File Operation Functions
+# Data Transfer Helpers
 # ----------------------------------------------------------------
-def copy_item(src: str, dest: str) -> bool:
+def _reflink(fin: BinaryIO, fout: BinaryIO) -> bool:
+    """Clone the source extents into the destination (same filesystem only)."""
+    try:
+        fcntl.ioctl(fout.fileno(), FICLONE, fin.fileno())
+        return True
+    except OSError as e:
+        if e.errno in FALLBACK_ERRNOS:
+            return False
+        raise
+
+
+def _copy_file_range(
+    fin: BinaryIO, fout: BinaryIO, advance: Callable[[int], None]
+) -> Optional[int]:
     """
-    Copy a file or directory with progress feedback.
+    Copy with os.copy_file_range in CHUNK_SIZE steps.
+    Returns the number of bytes copied, or None if the method is unsupported
+    and nothing has been copied yet.
+    """
+    if not hasattr(os, "copy_file_range"):
+        return None
+    copied = 0
+    while True:
+        try:
+            n = os.copy_file_range(fin.fileno(), fout.fileno(), CHUNK_SIZE)
+        except OSError as e:
+            if copied == 0 and e.errno in FALLBACK_ERRNOS:
+                return None
+            raise
+        if n == 0:
+            return copied
+        copied += n
+        advance(n)
+
+
+def _sendfile(
+    fin: BinaryIO, fout: BinaryIO, advance: Callable[[int], None]
+) -> Optional[int]:
+    """
+    Copy with os.sendfile in CHUNK_SIZE steps.
+    Returns the number of bytes copied, or None if the method is unsupported
+    and nothing has been copied yet.
+    """
+    if not hasattr(os, "sendfile"):
+        return None
+    copied = 0
+    while True:
+        try:
+            n = os.sendfile(fout.fileno(), fin.fileno(), None, CHUNK_SIZE)
+        except OSError as e:
+            if copied == 0 and e.errno in FALLBACK_ERRNOS:
+                return None
+            raise
+        if n == 0:
+            return copied
+        copied += n
+        advance(n)
+
+
+def transfer_file_data(
+    fin: BinaryIO, fout: BinaryIO, advance: Callable[[int], None]
+) -> Tuple[int, str]:
+    """
+    Copy all data from fin to fout using the cheapest method the filesystem supports:
+    reflink clone, then copy_file_range, then sendfile, then a buffered read/write loop.
+    Both files must be freshly opened (offset 0, destination empty).
     Args:
-        src: Source path.
-        dest: Destination path.
+        fin: Source file opened for binary reading.
+        fout: Destination file opened for binary writing.
+        advance: Callback receiving the number of bytes copied per chunk.
     Returns:
-        True if the copy succeeds; otherwise False.
+        A (bytes copied, method name) tuple.
     """
-    print_section(f"Copying: {Path(src).name}")
-    if not Path(src).exists():
-        print_error(f"Source not found: {src}")
-        return False
+    size = os.fstat(fin.fileno()).st_size
+    # Zero-sized files may be pseudo-files (procfs, sysfs) that only yield data
+    # to read(), so the kernel paths are only used for regular non-empty files.
+    if size > 0:
+        if _reflink(fin, fout):
+            advance(size)
+            return size, "reflink"
+        copied = _copy_file_range(fin, fout, advance)
+        if copied is not None:
+            return copied, "copy_file_range"
+        copied = _sendfile(fin, fout, advance)
+        if copied is not None:
+            return copied, "sendfile"
+    copied = 0
+    pending = 0
+    while buf := fin.read(DEFAULT_BUFFER_SIZE):
+        fout.write(buf)
+        copied += len(buf)
+        pending += len(buf)
+        if pending >= CHUNK_SIZE:
+            advance(pending)
+            pending = 0
+    if pending:
+        advance(pending)
+    return copied, "buffered"
+
+
+# ----------------------------------------------------------------
+# Concurrency Helpers
+# ----------------------------------------------------------------
+def run_bounded(
+    pool: Executor,
+    func: Callable[..., Any],
+    arg_tuples: Iterable[Tuple[Any, ...]],
+    max_pending: int,
+) -> Iterator[Any]:
+    """
+    Submit func(*args) for each args tuple, keeping at most max_pending tasks
+    queued so huge inputs are consumed lazily, and yield results as they complete.
+    If a task raises (or the caller stops iterating), queued tasks are cancelled.
+    """
+    pending: Set[Future] = set()
     try:
-        if Path(src).is_dir():
-            total_size = sum(
-                f.stat().st_size for f in Path(src).rglob("*") if f.is_file()
-            )
-            if total_size == 0:
-                print_warning("Directory is empty; nothing to copy.")
-                return True
-            start_time = time.time()
-            with ProgressManager() as progress:
-                task = progress.add_task(
-                    "Copying directory", total=total_size, color=NordColors.FROST_2
-                )
-                for root, dirs, files in os.walk(src):
-                    rel = os.path.relpath(root, src)
-                    target = Path(dest) / rel if rel != "." else Path(dest)
-                    target.mkdir(parents=True, exist_ok=True)
-                    for file in files:
-                        src_file = Path(root) / file
-                        dst_file = target / file
-                        with src_file.open("rb") as fin, dst_file.open("wb") as fout:
-                            while buf := fin.read(DEFAULT_BUFFER_SIZE):
-                                fout.write(buf)
-                                progress.update(task, advance=len(buf))
-                        shutil.copystat(src_file, dst_file)
-            elapsed = time.time() - start_time
-            print_success(
-                f"Copied directory ({format_size(total_size)}) in {format_time(elapsed)}"
-            )
-        else:
-            file_size = Path(src).stat().st_size
-            start_time = time.time()
-            with ProgressManager() as progress:
-                task = progress.add_task(
-                    f"Copying {Path(src).name}",
-                    total=file_size,
-                    color=NordColors.FROST_2,
-                )
-                with open(src, "rb") as fin, open(dest, "wb") as fout:
-                    while buf := fin.read(DEFAULT_BUFFER_SIZE):
-                        fout.write(buf)
-                        progress.update(task, advance=len(buf))
-            shutil.copystat(src, dest)
-            elapsed = time.time() - start_time
-            print_success(
-                f"Copied file ({format_size(file_size)}) in {format_time(elapsed)}"
-            )
-        return True
-    except Exception as e:
-        print_error(f"Error copying {src}: {e}")
-        return False
+        for args in arg_tuples:
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(pool.submit(func, *args))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
 
 
-def move_item(src: str, dest: str) -> bool:
+# ----------------------------------------------------------------
+# Tree Walking
+# ----------------------------------------------------------------
+class WalkEntry(NamedTuple):
+    """A single record produced by walk_tree."""
+
+    path: str
+    size: int
+    mtime: float
+    is_dir: bool
+
+
+def _scan_directory(
+    directory: str, follow_symlinks: bool
+) -> Tuple[List[WalkEntry], List[str]]:
     """
-    Move a file or directory. If source and destination are on different filesystems,
-    perform a copy then delete.
-    Args:
-        src: Source path.
-        dest: Destination path.
+    List one directory with os.scandir, using each DirEntry's cached stat.
+    Unreadable directories and entries are skipped, as os.walk does.
     Returns:
-        True if move succeeds; otherwise False.
+        The entries found and the subdirectories to descend into.
     """
-    print_section(f"Moving: {Path(src).name}")
-    if not Path(src).exists():
-        print_error(f"Source not found: {src}")
-        return False
+    entries: List[WalkEntry] = []
+    subdirs: List[str] = []
     try:
-        same_fs = os.stat(src).st_dev == os.stat(Path(dest).parent or ".").st_dev
-        start_time = time.time()
-        if same_fs:
-            os.rename(src, dest)
-            print_success(
-                f"Moved {src} to {dest} in {format_time(time.time() - start_time)}"
-            )
-        else:
-            print_message(
-                "Different filesystem detected: copying then deleting source...",
-                NordColors.FROST_2,
-                "➜",
-            )
-            if not copy_item(src, dest):
-                return False
-            if Path(src).is_dir():
-                shutil.rmtree(src)
-            else:
-                os.remove(src)
-            print_success(f"Moved {src} to {dest} by copying and deleting source")
-        return True
-    except Exception as e:
-        print_error(f"Error moving {src}: {e}")
-        return False
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        st = entry.stat(follow_symlinks=False)
+                        entries.append(WalkEntry(entry.path, 0, st.st_mtime, True))
+                        subdirs.append(entry.path)
+                    elif follow_symlinks:
+                        if entry.is_file():
+                            st = entry.stat()
+                            entries.append(
+                                WalkEntry(entry.path, st.st_size, st.st_mtime, False)
+                            )
+                    else:
+                        st = entry.stat(follow_symlinks=False)
+                        size = st.st_size if stat.S_ISREG(st.st_mode) else 0
+                        entries.append(WalkEntry(entry.path, size, st.st_mtime, False))
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return entries, subdirs
 
 
-def delete_item(path: str, force: bool = False) -> bool:
+def walk_tree(
+    root: str,
+    workers: int = DEFAULT_WALK_WORKERS,
+    follow_symlinks: bool = True,
+    sort: bool = False,
+    on_scanned: Optional[Callable[[], None]] = None,
+) -> Iterator[WalkEntry]:
     """
-    Delete a file or directory after confirmation.
+    Walk a directory tree in a single pass with one stat per entry.
+    Subdirectories are scanned concurrently on a thread pool when workers > 1,
+    so records arrive in no particular order, but a directory's record is always
+    yielded before anything inside it. The root itself is not yielded.
     Args:
-        path: Path to delete.
-        force: If True, skip confirmation.
-    Returns:
-        True if deletion succeeds; otherwise False.
+        root: Directory to walk.
+        workers: Number of directories scanned concurrently.
+        follow_symlinks: If True, yield regular files and symlinks to files (sized
+            by their target) and skip other entries. If False, yield every
+            non-directory entry as is, with a size of 0 for non-regular files.
+            Symlinks to directories are never descended into.
+        sort: Walk serially, depth first, in name order, so the same tree always
+            yields the same sequence (workers is ignored).
+        on_scanned: Called once for every directory listed, empty ones included,
+            after its records have been yielded.
+    Yields:
+        WalkEntry records of (path, size, mtime, is_dir).
     """
-    print_section(f"Deleting: {Path(path).name}")
-    if not Path(path).exists():
-        print_error(f"Path not found: {path}")
-        return False
-    if not force and not get_user_confirmation(
-        f"Are you sure you want to delete {path}?"
+    if workers <= 1 or sort:
+        stack = [root]
+        while stack:
+            entries, subdirs = _scan_directory(stack.pop(), follow_symlinks)
+            if sort:
+                entries.sort()
+                subdirs.sort(reverse=True)
+            yield from entries
+            if on_scanned:
+                on_scanned()
+            stack.extend(subdirs)
+        return
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="walk") as pool:
+        pending = {pool.submit(_scan_directory, root, follow_symlinks)}
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    entries, subdirs = future.result()
+                    for subdir in subdirs:
+                        pending.add(
+                            pool.submit(_scan_directory, subdir, follow_symlinks)
+                        )
+                    yield from entries
+                    if on_scanned:
+                        on_scanned()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+class StreamingWalk:
+    """
+    Run walk_tree on a background thread and hand its records to a consumer
+    as they are found, while keeping a running estimate of the tree's size.
+    The estimate extrapolates the average bytes per directory scanned so far to
+    the directories found but not yet scanned, and is exact once the walk ends.
+    """
+
+    _DONE = object()
+
+    def __init__(
+        self,
+        root: str,
+        workers: int = DEFAULT_WALK_WORKERS,
+        follow_symlinks: bool = True,
+        max_queued: int = WALK_QUEUE_LIMIT,
+        sort: bool = False,
     ):
-        print_message("Deletion cancelled", NordColors.FROST_2, "➜")
+        self.root = root
+        self.workers = workers
+        self.follow_symlinks = follow_symlinks
+        self.sort = sort
+        self.queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queued)
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+        self.error: Optional[BaseException] = None
+        self.done = False
+        self.bytes_found = 0
+        self.files_found = 0
+        self.dirs_found = 0
+        self.scanned_dirs = 0
+
+    def _put(self, item: Any) -> bool:
+        while not self.stop_event.is_set():
+            try:
+                self.queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
         return False
+
+    def _scanned(self) -> None:
+        with self.lock:
+            self.scanned_dirs += 1
+
+    def _run(self) -> None:
+        try:
+            for entry in walk_tree(
+                self.root,
+                self.workers,
+                self.follow_symlinks,
+                self.sort,
+                on_scanned=self._scanned,
+            ):
+                with self.lock:
+                    if entry.is_dir:
+                        self.dirs_found += 1
+                    else:
+                        self.files_found += 1
+                        self.bytes_found += entry.size
+                if not self._put(entry):
+                    return
+        except BaseException as e:
+            self.error = e
+        finally:
+            with self.lock:
+                self.done = True
+            self._put(self._DONE)
+
+    def start(self) -> "StreamingWalk":
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        return self
+
+    def estimate(self) -> int:
+        """Return the current estimate of the tree's total size in bytes."""
+        with self.lock:
+            if self.done:
+                return self.bytes_found
+            scanned = max(1, self.scanned_dirs)
+            unscanned = max(0, self.dirs_found + 1 - scanned)
+            return self.bytes_found + self.bytes_found // scanned * unscanned
+
+    def __iter__(self) -> Iterator[WalkEntry]:
+        while True:
+            item = self.queue.get()
+            if item is self._DONE:
+                break
+            yield item
+        if self.error:
+            raise self.error
+
+    def close(self) -> None:
+        """Stop the walk thread if the consumer finished early."""
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+# ----------------------------------------------------------------
+# Content Search
+# ----------------------------------------------------------------
+@lru_cache(maxsize=8)
+def _compile_search(
+    pattern: str, is_regex: bool, ignore_case: bool
+) -> "re.Pattern[bytes]":
+    """Compile a search pattern to a bytes regex (cached per worker process)."""
+    raw = pattern.encode("utf-8", "surrogateescape")
+    if not is_regex:
+        raw = re.escape(raw)
+    return re.compile(raw, re.MULTILINE | (re.IGNORECASE if ignore_case else 0))
+
+
+def _init_worker_process() -> None:
+    """Leave Ctrl+C handling to the parent process."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _grep_file(
+    path: str,
+    regex: "re.Pattern[bytes]",
+    max_size: int,
+) -> Tuple[str, List[Tuple[int, str]], Optional[str]]:
+    """
+    Search one file through a read-only mmap, one hit per line like grep.
+    Stops after GREP_MAX_MATCHES_PER_FILE matching lines.
+    Returns:
+        (path, [(line number, line text)], skip reason or None).
+    """
     try:
-        start_time = time.time()
-        if Path(path).is_dir():
-            shutil.rmtree(path)
-        else:
-            os.remove(path)
-        print_success(f"Deleted {path} in {format_time(time.time() - start_time)}")
-        return True
-    except Exception as e:
-        print_error(f"Error deleting {path}: {e}")
-        return False
+        with open(path, "rb") as fin:
+            size = os.fstat(fin.fileno()).st_size
+            if size == 0:
+                return path, [], None
+            if size > max_size:
+                return path, [], "large"
+            with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b"\0", 0, GREP_BINARY_SNIFF) != -1:
+                    return path, [], "binary"
+                hits: List[Tuple[int, str]] = []
+                line_no = 1
+                counted_to = 0
+                pos = 0
+                while len(hits) < GREP_MAX_MATCHES_PER_FILE:
+                    match = regex.search(mm, pos)
+                    if match is None:
+                        break
+                    start = match.start()
+                    line_start = mm.rfind(b"\n", 0, start) + 1
+                    line_end = mm.find(b"\n", start)
+                    if line_end == -1:
+                        line_end = size
+                    with memoryview(mm)[counted_to:line_start] as gap:
+                        line_no += bytes(gap).count(b"\n")
+                    counted_to = line_start
+                    text = mm[line_start:line_end].decode("utf-8", "replace")
+                    hits.append((line_no, text.rstrip("\r")[:GREP_LINE_WIDTH]))
+                    pos = line_end + 1
+                    if pos >= size:
+                        break
+                return path, hits, None
+    except (OSError, ValueError) as e:
+        return path, [], f"error: {e}"
 
 
-def find_files() -> None:
+def _grep_batch(
+    paths: List[str], pattern: str, is_regex: bool, ignore_case: bool, max_size: int
+) -> List[Tuple[str, List[Tuple[int, str]], Optional[str]]]:
+    """Search a batch of files in a worker process."""
+    regex = _compile_search(pattern, is_regex, ignore_case)
+    return [_grep_file(path, regex, max_size) for path in paths]
+
+
+def _batched(items: Iterable[str], size: int) -> Iterator[List[str]]:
+    batch: List[str] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def search_contents(
+    directory: str,
+    pattern: str,
+    is_regex: bool = False,
+    ignore_case: bool = True,
+    extensions: Optional[Set[str]] = None,
+    max_size: int = GREP_MAX_FILE_SIZE,
+    workers: int = DEFAULT_HASH_WORKERS,
+) -> Iterator[Tuple[str, List[Tuple[int, str]], Optional[str]]]:
     """
-    Search for files matching a pattern in a directory.
-    Offers an option to display detailed file information.
+    Search file contents under directory on a process pool, yielding
+    (path, hits, skip reason) per file as batches complete. Stop iterating to
+    end the search early; queued batches are cancelled.
+    Args:
+        directory: Directory to search.
+        pattern: Literal text, or a regular expression if is_regex.
+        is_regex: Treat pattern as a regular expression.
+        ignore_case: Case-insensitive matching.
+        extensions: Only search files with these extensions (None for all).
+        max_size: Skip files larger than this many bytes.
+        workers: Number of worker processes.
     """
-    directory = get_user_input("Enter directory to search")
-    if not directory or not Path(directory).exists():
-        print_error("Invalid directory")
-        return
-    pattern = get_user_input("Enter search pattern (wildcards allowed)", ".*")
-    details = get_user_confirmation("Show detailed file information?")
-    print_section(f"Searching in {directory}")
-    regex = re.compile(pattern.replace("*", ".*").replace("?", "."), re.IGNORECASE)
-    matches = []
-    with Spinner("Searching for files"):
-        for root, _, files in os.walk(directory):
-            for file in files:
-                if regex.search(file):
-                    matches.append(str(Path(root) / file))
-    print_success(f"Found {len(matches)} matching files")
-    if details and matches:
-        table = Table(
-            title="Search Results",
-            title_style=f"bold {NordColors.FROST_1}",
-            border_style=NordColors.FROST_3,
-            highlight=True,
+    _compile_search(pattern, is_regex, ignore_case)  # Fail fast on a bad regex
+    paths = (
+        entry.path
+        for entry in walk_tree(directory)
+        if not entry.is_dir
+        and (
+            extensions is None
+            or os.path.splitext(entry.path)[1].lower() in extensions
         )
-        table.add_column("File Path", style=NordColors.SNOW_STORM_1)
-        table.add_column("Size", style=NordColors.FROST_2, justify="right")
-        table.add_column("Modified", style=NordColors.FROST_1)
-        table.add_column("Type", style=NordColors.FROST_3)
-        for match in matches[:100]:
-            try:
-                p = Path(match)
-                size = format_size(p.stat().st_size)
-                modified = dt.fromtimestamp(p.stat().st_mtime).strftime(
-                    "%Y-%m-%d %H:%M:%S"
-                )
-                ext = p.suffix.lower()
-                if ext in DOCUMENT_EXTENSIONS:
-                    ftype = "Document"
-                elif ext in IMAGE_EXTENSIONS:
-                    ftype = "Image"
-                elif ext in VIDEO_EXTENSIONS:
-                    ftype = "Video"
-                elif ext in AUDIO_EXTENSIONS:
-                    ftype = "Audio"
-                elif ext in ARCHIVE_EXTENSIONS:
-                    ftype = "Archive"
-                elif ext in CODE_EXTENSIONS:
-                    ftype = "Code"
-                else:
-                    ftype = "Other"
-                table.add_row(str(p), size, modified, ftype)
-            except Exception as e:
-                print_error(f"Error reading {match}: {e}")
-        console.print(table)
-        if len(matches) > 100:
-            print_warning(f"Showing first 100 of {len(matches)} matches")
-    else:
-        for match in matches[:100]:
-            console.print(
-                f"[{NordColors.SNOW_STORM_1}]{match}[/{NordColors.SNOW_STORM_1}]"
-            )
-        if len(matches) > 100:
-            print_warning(f"Showing first 100 of {len(matches)} matches")
+    )
+    workers = max(1, workers)
+    # Workers are started lazily while walk_tree's threads are running, so
+    # they must not be forked from this multithreaded process.
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("forkserver"),
+        initializer=_init_worker_process,
+    ) as pool:
+        for results in run_bounded(
+            pool,
+            _grep_batch,
+            (
+                (batch, pattern, is_regex, ignore_case, max_size)
+                for batch in _batched(paths, GREP_BATCH_SIZE)
+            ),
+            workers * 2,
+        ):
+            yield from results
 
 
-def compress_files() -> bool:
+def content_search() -> bool:
     """
-    Compress a file or directory into a tar.gz archive with progress tracking.
+    Interactively search file contents and stream matches with line numbers.
     Returns:
-        True if compression succeeds; otherwise False.
+        True if the search runs; otherwise False.
     """
-    src = get_user_input("Enter source file/directory to compress")
-    if not src or not Path(src).exists():
-        print_error("Invalid source path")
+    directory = get_user_input("Enter directory to search")
+    if not directory or not Path(directory).is_dir():
+        print_error("Invalid directory")
         return False
-    dest = get_user_input("Enter destination archive path (without extension)")
-    if not dest:
-        print_error("Destination path cannot be empty")
+    pattern = get_user_input("Enter text to search for")
+    if not pattern:
+        print_error("Search text cannot be empty")
         return False
-    if not dest.endswith((".tar.gz", ".tgz")):
-        dest = f"{dest}.tar.gz"
-    print_section(f"Compressing: {Path(src).name}")
-    total_size = 0
-    if Path(src).is_dir():
-        with Spinner("Calculating total size"):
-            total_size = sum(
-                f.stat().st_size for f in Path(src).rglob("*") if f.is_file()
-            )
-    else:
-        total_size = Path(src).stat().st_size
-    if total_size == 0:
-        print_warning("No data to compress.")
-        return True
+    is_regex = get_user_confirmation("Treat the search text as a regular expression?")
+    ignore_case = get_user_confirmation("Ignore case?")
+    filters = [
+        ("1", "All files"),
+        ("2", "Code files"),
+        ("3", "Documents"),
+        ("4", "Code and documents"),
+    ]
+    console.print(create_menu_table("File Filter", filters))
+    choice = get_user_input("Select filter (1-4)", "1")
+    extensions = {
+        "2": CODE_EXTENSIONS,
+        "3": DOCUMENT_EXTENSIONS,
+        "4": CODE_EXTENSIONS | DOCUMENT_EXTENSIONS,
+    }.get(choice)
+    default_mb = str(GREP_MAX_FILE_SIZE // (1024 * 1024))
+    try:
+        max_size = int(get_user_input("Skip files larger than (MB)", default_mb))
+        max_size *= 1024 * 1024
+    except ValueError:
+        max_size = GREP_MAX_FILE_SIZE
+    try:
+        _compile_search(pattern, is_regex, ignore_case)
+    except re.error as e:
+        print_error(f"Invalid regular expression: {e}")
+        return False
+    print_section(f"Searching contents of {directory}")
+    scanned = matched_files = results = 0
+    skipped: Dict[str, int] = {}
     start_time = time.time()
     try:
-        with ProgressManager() as progress:
-            task = progress.add_task(
-                "Compressing files", total=total_size, color=NordColors.FROST_2
-            )
-            with (
-                open(dest, "wb") as fout,
-                tarfile.open(
-                    fileobj=fout, mode="w:gz", compresslevel=COMPRESSION_LEVEL
-                ) as tar,
-            ):
+        for path, hits, reason in search_contents(
+            directory, pattern, is_regex, ignore_case, extensions, max_size
+        ):
+            scanned += 1
+            if reason:
+                key = "error" if reason.startswith("error") else reason
+                skipped[key] = skipped.get(key, 0) + 1
+                continue
+            if not hits:
+                continue
+            matched_files += 1
+            console.print(f"[bold {NordColors.FROST_2}]{escape(path)}[/]")
+            for line_no, text in hits:
+                console.print(
+                    f"  [{NordColors.YELLOW}]{line_no:>6}[/]: "
+                    f"[{NordColors.SNOW_STORM_1}]{escape(text)}[/]"
+                )
+            results += len(hits)
+            if results >= GREP_MAX_RESULTS:
+                print_warning(f"Stopped after {GREP_MAX_RESULTS} matching lines")
+                break
+    except KeyboardInterrupt:
+        print_warning("Search interrupted")
+    elapsed = time.time() - start_time
+    print_success(
+        f"{results} matching lines in {matched_files} of {scanned} files "
+        f"({format_time(elapsed)})"
+    )
+    if skipped:
+        print_message(
+            "Skipped: " + ", ".join(f"{n} {k}" for k, n in sorted(skipped.items())),
+            NordColors.FROST_3,
+        )
+    return True
 
-                def progress_filter(ti):
-                    if ti.size:
-                        progress.update(task, advance=ti.size)
-                    return ti
 
-                tar.add(src, arcname=Path(src).name, filter=progress_filter)
+# ----------------------------------------------------------------
+# Persistent File Index
+# ----------------------------------------------------------------
+class FileIndex:
+    """
+    SQLite-backed index of file paths, sizes, mtimes and categories under a root.
+    Refreshes are incremental: a directory is only re-listed when its mtime
+    changed, which is the case whenever entries are added, removed or renamed.
+    In-place edits to existing files do not touch the directory mtime, so their
+    size and mtime are refreshed the next time the directory itself changes.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+        CREATE TABLE IF NOT EXISTS dirs (
+            path TEXT PRIMARY KEY, parent TEXT, mtime_ns INTEGER
+        );
+        CREATE TABLE IF NOT EXISTS files (
+            path TEXT PRIMARY KEY, dir TEXT, name TEXT,
+            size INTEGER, mtime REAL, category TEXT
+        );
+        CREATE INDEX IF NOT EXISTS dirs_parent ON dirs (parent);
+        CREATE INDEX IF NOT EXISTS files_dir ON files (dir);
+    """
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        self.db_path = self.path_for(self.root)
+        INDEX_DIR.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.executescript(self.SCHEMA)
+        self.conn.execute(
+            "INSERT OR REPLACE INTO meta VALUES ('root', ?)", (self.root,)
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def path_for(root: str) -> Path:
+        """Return the index database location for a root directory."""
+        digest = hashlib.sha1(os.path.abspath(root).encode()).hexdigest()[:16]
+        return INDEX_DIR / f"index-{digest}.db"
+
+    @classmethod
+    def find(cls, directory: str) -> Optional["FileIndex"]:
+        """Return an existing index covering directory (or an ancestor), if any."""
+        current = os.path.abspath(directory)
+        while True:
+            if cls.path_for(current).exists():
+                return cls(current)
+            parent = os.path.dirname(current)
+            if parent == current:
+                return None
+            current = parent
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @staticmethod
+    def _subtree_bounds(path: str) -> Tuple[str, str]:
+        # Every descendant of path sorts in [path + "/", path + "0") since "0"
+        # is the character right after "/".
+        base = path.rstrip("/")
+        return base + "/", base + "0"
+
+    def _forget_dir(self, path: str) -> None:
+        """Drop a directory and everything below it from the index."""
+        lo, hi = self._subtree_bounds(path)
+        self.conn.execute(
+            "DELETE FROM dirs WHERE path = ? OR (path >= ? AND path < ?)",
+            (path, lo, hi),
+        )
+        self.conn.execute(
+            "DELETE FROM files WHERE dir = ? OR (dir >= ? AND dir < ?)",
+            (path, lo, hi),
+        )
+
+    def refresh(self, start: Optional[str] = None) -> Tuple[int, int]:
+        """
+        Bring the index up to date for start (default: the whole root).
+        Returns:
+            A (directories re-listed, directories checked) tuple.
+        """
+        start = os.path.abspath(start or self.root)
+        rescanned = checked = 0
+        pending_rows = 0
+        stack = [start]
+        while stack:
+            directory = stack.pop()
+            checked += 1
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except OSError:
+                self._forget_dir(directory)
+                continue
+            row = self.conn.execute(
+                "SELECT mtime_ns FROM dirs WHERE path = ?", (directory,)
+            ).fetchone()
+            if row and row[0] == mtime_ns:
+                stack.extend(
+                    r[0]
+                    for r in self.conn.execute(
+                        "SELECT path FROM dirs WHERE parent = ?", (directory,)
+                    )
+                )
+                continue
+            rescanned += 1
+            file_rows = []
+            subdirs = []
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.path)
+                            elif entry.is_file():
+                                st = entry.stat()
+                                file_rows.append(
+                                    (
+                                        entry.path,
+                                        directory,
+                                        entry.name,
+                                        st.st_size,
+                                        st.st_mtime,
+                                        get_file_category(entry.name),
+                                    )
+                                )
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+            known = {
+                r[0]
+                for r in self.conn.execute(
+                    "SELECT path FROM dirs WHERE parent = ?", (directory,)
+                )
+            }
+            for gone in known.difference(subdirs):
+                self._forget_dir(gone)
+            self.conn.execute("DELETE FROM files WHERE dir = ?", (directory,))
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)", file_rows
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO dirs VALUES (?, ?, ?)",
+                (directory, os.path.dirname(directory), mtime_ns),
+            )
+            stack.extend(subdirs)
+            pending_rows += len(file_rows) + 1
+            if pending_rows >= INDEX_BATCH_SIZE:
+                self.conn.commit()
+                pending_rows = 0
+        self.conn.commit()
+        return rescanned, checked
+
+    def search(
+        self, regex: "re.Pattern[str]", directory: Optional[str] = None
+    ) -> List[Tuple[str, int, float, str]]:
+        """
+        Return (path, size, mtime, category) rows whose file name matches regex,
+        optionally restricted to a subdirectory of the root.
+        """
+        self.conn.create_function(
+            "REGEXP", 2, lambda expr, item: regex.search(item) is not None
+        )
+        sql = "SELECT path, size, mtime, category FROM files WHERE name REGEXP ?"
+        params: List[Any] = [regex.pattern]
+        if directory and os.path.abspath(directory) != self.root:
+            directory = os.path.abspath(directory)
+            lo, hi = self._subtree_bounds(directory)
+            sql += " AND (dir = ? OR (dir >= ? AND dir < ?))"
+            params += [directory, lo, hi]
+        return self.conn.execute(sql + " ORDER BY path", params).fetchall()
+
+
+# ----------------------------------------------------------------
+# Parallel Compression
+# ----------------------------------------------------------------
+def available_backends() -> List[str]:
+    """Return the compression backends usable in this environment."""
+    return [b for b in COMPRESSION_BACKENDS if b != "zstd" or zstandard is not None]
+
+
+def compress_block(backend: str, level: int, data: bytes) -> bytes:
+    """
+    Compress one block as a complete, standalone stream (gzip member, xz stream
+    or zstd frame). Concatenating these yields a valid stream for each format.
+    The underlying compressors release the GIL, so blocks compress in parallel.
+    """
+    if backend == "gzip":
+        return gzip.compress(data, compresslevel=level, mtime=0)
+    if backend == "xz":
+        return lzma.compress(data, preset=level)
+    if backend == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd backend requires: pip install zstandard")
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    raise ValueError(f"Unknown compression backend: {backend}")
+
+
+class ParallelCompressor:
+    """
+    A writable file object that splits its input into COMPRESSION_BLOCK_SIZE
+    blocks, compresses them on a thread pool and writes the results in order,
+    pigz-style. At most threads * 2 blocks are in flight at once.
+    """
+
+    def __init__(
+        self,
+        fileobj: BinaryIO,
+        backend: str = "gzip",
+        level: Optional[int] = None,
+        threads: int = DEFAULT_COMPRESSION_THREADS,
+        block_size: int = COMPRESSION_BLOCK_SIZE,
+    ):
+        if backend not in COMPRESSION_BACKENDS:
+            raise ValueError(f"Unknown compression backend: {backend}")
+        self.fileobj = fileobj
+        self.backend = backend
+        self.level = COMPRESSION_BACKENDS[backend]["level"] if level is None else level
+        self.block_size = block_size
+        self.threads = max(1, threads)
+        self.max_pending = self.threads * 2
+        self.pool = ThreadPoolExecutor(
+            max_workers=self.threads, thread_name_prefix="compress"
+        )
+        self.pending: Deque[Future] = deque()
+        self.buffer = bytearray()
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.closed = False
+
+    def _submit(self, block: bytes) -> None:
+        if len(self.pending) >= self.max_pending:
+            self._write_out(self.pending.popleft().result())
+        self.pending.append(
+            self.pool.submit(compress_block, self.backend, self.level, block)
+        )
+
+    def _write_out(self, data: bytes) -> None:
+        self.fileobj.write(data)
+        self.bytes_out += len(data)
+
+    def write(self, data: bytes) -> int:
+        self.buffer += data
+        self.bytes_in += len(data)
+        while len(self.buffer) >= self.block_size:
+            self._submit(bytes(self.buffer[: self.block_size]))
+            del self.buffer[: self.block_size]
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        """Compress any buffered input and write all remaining blocks."""
+        if self.closed:
+            return
+        try:
+            if self.buffer or self.bytes_in == 0:
+                self._submit(bytes(self.buffer))
+                self.buffer.clear()
+            while self.pending:
+                self._write_out(self.pending.popleft().result())
+        finally:
+            self.closed = True
+            self.pool.shutdown(cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.closed = True
+            self.pool.shutdown(cancel_futures=True)
+
+
+class _CountingSink:
+    """A write-only file object that discards data and counts bytes."""
+
+    def __init__(self):
+        self.bytes_written = 0
+
+    def write(self, data: bytes) -> int:
+        self.bytes_written += len(data)
+        return len(data)
+
+
+def create_archive(
+    src: str,
+    dest: str,
+    members: Iterable[WalkEntry],
+    backend: str = "gzip",
+    level: Optional[int] = None,
+    threads: int = DEFAULT_COMPRESSION_THREADS,
+    progress_filter: Optional[Callable[[tarfile.TarInfo], tarfile.TarInfo]] = None,
+) -> int:
+    """
+    Write src and the given walk records into a tar archive compressed by
+    ParallelCompressor. members is consumed lazily, so it can be a StreamingWalk
+    that is still discovering the tree; each record's parent must come first.
+    Returns:
+        The compressed size in bytes.
+    """
+    arcname = Path(src).name
+    with (
+        open(dest, "wb") as fout,
+        ParallelCompressor(fout, backend, level, threads) as compressor,
+        tarfile.open(fileobj=compressor, mode="w|") as tar,
+    ):
+        tar.add(src, arcname=arcname, recursive=False, filter=progress_filter)
+        for entry in members:
+            tar.add(
+                entry.path,
+                arcname=os.path.join(arcname, os.path.relpath(entry.path, src)),
+                recursive=False,
+                filter=progress_filter,
+            )
+    return compressor.bytes_out
+
+
+def detect_backend(path: str) -> Optional[str]:
+    """Return the compression backend of an archive from its magic bytes, or None."""
+    with open(path, "rb") as f:
+        head = f.read(8)
+    for backend, info in COMPRESSION_BACKENDS.items():
+        if head.startswith(info["magic"]):
+            return backend
+    return None
+
+
+def _member_decompressor(backend: str) -> Any:
+    """Return a one-member decompressor with decompress(), eof and unused_data."""
+    if backend == "gzip":
+        return zlib.decompressobj(wbits=31)
+    if backend == "xz":
+        return lzma.LZMADecompressor()
+    if backend == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd backend requires: pip install zstandard")
+        return zstandard.ZstdDecompressor().decompressobj()
+    raise ValueError(f"Unknown compression backend: {backend}")
+
+
+def decompress_member(backend: str, data: bytes) -> Optional[bytes]:
+    """
+    Decompress data that should hold exactly one complete member.
+    Returns:
+        The decompressed bytes, or None if data is not exactly one member (the
+        split point was a false match of the member header).
+    """
+    try:
+        decompressor = _member_decompressor(backend)
+        out = decompressor.decompress(data)
+    except Exception:
+        return None
+    if not decompressor.eof or decompressor.unused_data:
+        return None
+    return out
+
+
+class ParallelDecompressor:
+    """
+    A readable file object over a compressed archive that decompresses members
+    in parallel, the counterpart of ParallelCompressor.
+    The file is split at each member header (one per compress_block call), and up
+    to threads * 2 members are decompressed ahead of the reader. If a split turns
+    out to be a false match, or a member is larger than EXTRACT_MAX_PIECE (e.g. a
+    single-member archive from another tool), the rest is decompressed serially.
+    """
+
+    def __init__(
+        self, path: str, backend: str, threads: int = DEFAULT_COMPRESSION_THREADS
+    ):
+        self.backend = backend
+        self.member_magic = COMPRESSION_BACKENDS[backend]["member_magic"]
+        self.file = open(path, "rb")
+        self.size = os.fstat(self.file.fileno()).st_size
+        self.mm = (
+            mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            if self.size
+            else b""
+        )
+        self.threads = max(1, threads)
+        self.pool = ThreadPoolExecutor(
+            max_workers=self.threads, thread_name_prefix="decompress"
+        )
+        self.pending: Deque[Tuple[int, int, Future]] = deque()
+        self.next_piece = 0
+        self.serial_pos: Optional[int] = None
+        self.serial_decompressor: Any = None
+        self.buffer = bytearray()
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def _schedule(self) -> None:
+        while (
+            self.serial_pos is None
+            and len(self.pending) < self.threads * 2
+            and self.next_piece < self.size
+        ):
+            start = self.next_piece
+            end = self.mm.find(self.member_magic, start + 1)
+            if end == -1:
+                end = self.size
+            if end - start > EXTRACT_MAX_PIECE:
+                self.serial_pos = start
+                return
+            self.pending.append(
+                (
+                    start,
+                    end,
+                    self.pool.submit(
+                        decompress_member, self.backend, self.mm[start:end]
+                    ),
+                )
+            )
+            self.next_piece = end
+
+    def _fill_serial(self) -> bool:
+        if self.serial_pos >= self.size:
+            if self.serial_decompressor is not None:
+                raise EOFError("Compressed archive ended before the end of a member")
+            return False
+        data = self.mm[self.serial_pos : self.serial_pos + CHUNK_SIZE]
+        self.serial_pos += len(data)
+        self.bytes_in = self.serial_pos
+        while data:
+            if self.serial_decompressor is None:
+                self.serial_decompressor = _member_decompressor(self.backend)
+            self.buffer += self.serial_decompressor.decompress(data)
+            if self.serial_decompressor.eof:
+                data = self.serial_decompressor.unused_data
+                self.serial_decompressor = None
+            else:
+                data = b""
+        return True
+
+    def _fill(self) -> bool:
+        """Append the next decompressed piece to the buffer; False at the end."""
+        self._schedule()
+        if self.pending:
+            start, end, future = self.pending.popleft()
+            out = future.result()
+            if out is not None:
+                self.buffer += out
+                self.bytes_in = end
+                return True
+            for _, _, later in self.pending:
+                later.cancel()
+            self.pending.clear()
+            self.serial_pos = start
+        if self.serial_pos is not None:
+            return self._fill_serial()
+        return False
+
+    def read(self, size: int = -1) -> bytes:
+        while (size < 0 or len(self.buffer) < size) and self._fill():
+            pass
+        if size < 0:
+            size = len(self.buffer)
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        self.bytes_out += len(data)
+        return data
+
+    def close(self) -> None:
+        self.pool.shutdown(cancel_futures=True)
+        if self.size:
+            self.mm.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _safe_extract_path(root: str, name: str) -> str:
+    """
+    Resolve an archive member name under root, refusing absolute paths, ".."
+    components and parents that are symlinks pointing outside root.
+    """
+    target = os.path.normpath(os.path.join(root, name))
+    if target == root:
+        return root
+    parent = os.path.realpath(os.path.dirname(target))
+    if os.path.commonpath([root, parent]) != root:
+        raise ValueError(f"Refusing to extract outside the destination: {name}")
+    return os.path.join(parent, os.path.basename(target))
+
+
+def _write_member_file(target: str, source: Any, mode: int, mtime: float) -> int:
+    """Write one regular file from bytes or a readable object and set its metadata."""
+    written = 0
+    with open(target, "wb") as fout:
+        if isinstance(source, bytes):
+            written = fout.write(source)
+        else:
+            while chunk := source.read(CHUNK_SIZE):
+                written += fout.write(chunk)
+    os.chmod(target, mode & 0o777)
+    os.utime(target, (mtime, mtime))
+    return written
+
+
+def _apply_dir_attrs(dir_attrs: List[Tuple[str, int, float]]) -> None:
+    """Set directory modes and mtimes, deepest first, once their contents exist."""
+    for target, mode, mtime in sorted(dir_attrs, reverse=True):
+        try:
+            os.chmod(target, mode & 0o777)
+            os.utime(target, (mtime, mtime))
+        except OSError:
+            pass
+
+
+def _extract_stream(
+    fileobj: Any,
+    dest: str,
+    workers: int,
+    advance: Callable[[int], None],
+    dir_attrs: Optional[List[Tuple[str, int, float]]] = None,
+) -> Dict[str, int]:
+    """
+    Extract a tar stream in a single pass. Members must be read in order, but
+    small files are buffered and written by a thread pool so many writes (and
+    their open/close round trips) are in flight at once; large files are
+    streamed straight to disk. Directory metadata is applied last, or left in
+    dir_attrs for the caller to apply when one is passed in.
+    """
+    root = os.path.realpath(dest)
+    os.makedirs(root, exist_ok=True)
+    deferred = dir_attrs is not None
+    dir_attrs = dir_attrs if deferred else []
+    pending: Set[Future] = set()
+    members = files = total_bytes = 0
+    last_in = 0
+    extract_kwargs = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+
+    def collect(done: Set[Future]) -> None:
+        nonlocal total_bytes
+        for future in done:
+            total_bytes += future.result()
+
+    with (
+        tarfile.open(fileobj=fileobj, mode="r|") as tar,
+        ThreadPoolExecutor(max_workers=workers, thread_name_prefix="extract") as pool,
+    ):
+        try:
+            for member in tar:
+                members += 1
+                target = _safe_extract_path(root, member.name)
+                if member.isdir():
+                    os.makedirs(target, exist_ok=True)
+                    dir_attrs.append((target, member.mode, member.mtime))
+                elif member.isreg():
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    if os.path.islink(target):
+                        os.unlink(target)
+                    files += 1
+                    source = tar.extractfile(member)
+                    if member.size <= EXTRACT_INLINE_LIMIT:
+                        if len(pending) >= workers * COPY_QUEUE_FACTOR:
+                            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                            collect(done)
+                        pending.add(
+                            pool.submit(
+                                _write_member_file,
+                                target,
+                                source.read(),
+                                member.mode,
+                                member.mtime,
+                            )
+                        )
+                    else:
+                        total_bytes += _write_member_file(
+                            target, source, member.mode, member.mtime
+                        )
+                else:
+                    # Hard links need their target on disk, so finish queued writes.
+                    collect(wait(pending).done)
+                    pending = set()
+                    tar.extract(member, root, **extract_kwargs)
+                bytes_in = getattr(fileobj, "bytes_in", None)
+                if bytes_in is None:
+                    bytes_in = fileobj.tell()
+                advance(bytes_in - last_in)
+                last_in = bytes_in
+            collect(wait(pending).done)
+        finally:
+            for future in pending:
+                future.cancel()
+    if not deferred:
+        _apply_dir_attrs(dir_attrs)
+    return {"members": members, "files": files, "bytes": total_bytes}
+
+
+def list_shards(directory: str) -> List[str]:
+    """Return the tar archives (compressed or not) directly inside directory."""
+    extensions = (".tar",) + tuple(
+        ext for info in COMPRESSION_BACKENDS.values() for ext in info["extensions"]
+    )
+    return sorted(
+        entry.path
+        for entry in os.scandir(directory)
+        if entry.is_file() and entry.name.endswith(extensions)
+    )
+
+
+def extract_archive(
+    archive: str,
+    dest: str,
+    threads: int = DEFAULT_COMPRESSION_THREADS,
+    workers: int = DEFAULT_EXTRACT_WORKERS,
+    advance: Optional[Callable[[int], None]] = None,
+    dir_attrs: Optional[List[Tuple[str, int, float]]] = None,
+) -> Dict[str, int]:
+    """
+    Extract a tar archive (plain, gzip, xz or zstd) into dest.
+    If archive is a directory, every shard archive in it is extracted
+    concurrently, up to threads at a time, and directory metadata is applied
+    once all shards have finished.
+    Args:
+        archive: Archive file, or a directory of per-shard archives.
+        dest: Destination directory.
+        threads: Decompression threads (or concurrent shards).
+        workers: File writer threads.
+        advance: Called with compressed bytes consumed; may be called from
+            several threads when extracting shards.
+        dir_attrs: If given, directory metadata is collected here instead of
+            being applied.
+    Returns:
+        Totals of members, regular files and bytes written.
+    """
+    advance = advance or (lambda n: None)
+    if os.path.isdir(archive):
+        shards = list_shards(archive)
+        totals = {"members": 0, "files": 0, "bytes": 0}
+        if not shards:
+            return totals
+        concurrent = max(1, min(threads, len(shards)))
+        shard_dirs: List[Tuple[str, int, float]] = []
+        with ThreadPoolExecutor(
+            max_workers=concurrent, thread_name_prefix="shard"
+        ) as pool:
+            for result in run_bounded(
+                pool,
+                extract_archive,
+                (
+                    (shard, dest, 1, max(1, workers // concurrent), advance, shard_dirs)
+                    for shard in shards
+                ),
+                concurrent * 2,
+            ):
+                for key in totals:
+                    totals[key] += result[key]
+        _apply_dir_attrs(shard_dirs)
+        return totals
+    backend = detect_backend(archive)
+    if backend is None:
+        with open(archive, "rb") as f:
+            return _extract_stream(f, dest, workers, advance, dir_attrs)
+    with ParallelDecompressor(archive, backend, threads) as reader:
+        return _extract_stream(reader, dest, workers, advance, dir_attrs)
+
+
+def run_compression_benchmark(
+    data: bytes, configs: List[Tuple[str, int, int]]
+) -> List[Dict[str, Any]]:
+    """
+    Compress the same sample with each (backend, level, threads) configuration.
+    Returns:
+        One result dict per configuration with throughput and ratio.
+    """
+    results = []
+    for backend, level, threads in configs:
+        sink = _CountingSink()
+        start_time = time.perf_counter()
+        with ParallelCompressor(sink, backend, level, threads) as compressor:
+            for offset in range(0, len(data), CHUNK_SIZE):
+                compressor.write(data[offset : offset + CHUNK_SIZE])
+        elapsed = time.perf_counter() - start_time
+        results.append(
+            {
+                "backend": backend,
+                "level": level,
+                "threads": threads,
+                "input_bytes": len(data),
+                "output_bytes": sink.bytes_written,
+                "seconds": elapsed,
+                "mb_per_s": len(data) / elapsed / (1024 * 1024) if elapsed else 0.0,
+                "ratio": sink.bytes_written / len(data) if data else 0.0,
+            }
+        )
+    return results
+
+
+def build_sample_tar(directory: str, limit: int = COMPRESSION_BENCH_SAMPLE) -> bytes:
+    """Return an uncompressed tar of files under directory, up to about limit bytes."""
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w|") as tar:
+        for entry in sorted(walk_tree(directory)):
+            if entry.is_dir:
+                continue
+            if buf.tell() + entry.size > limit:
+                break
+            try:
+                tar.add(entry.path, arcname=os.path.relpath(entry.path, directory))
+            except OSError:
+                continue
+    return buf.getvalue()
+
+
+def benchmark_compression() -> bool:
+    """
+    Compare throughput and ratio of the compression backends on a sample tree.
+    Returns:
+        True if the benchmark runs; otherwise False.
+    """
+    directory = get_user_input("Enter sample directory")
+    if not directory or not Path(directory).is_dir():
+        print_error("Invalid directory")
+        return False
+    try:
+        threads = int(get_user_input("Threads", str(DEFAULT_COMPRESSION_THREADS)))
+    except ValueError:
+        threads = DEFAULT_COMPRESSION_THREADS
+    print_section("Compression Benchmark")
+    with Spinner("Reading sample"):
+        data = build_sample_tar(directory)
+    if not data:
+        print_warning("No data found in sample directory.")
+        return False
+    print_message(f"Sample size: {format_size(len(data))}", NordColors.FROST_3)
+    configs = [("gzip", COMPRESSION_LEVEL, 1)]
+    for backend in available_backends():
+        configs.append((backend, COMPRESSION_BACKENDS[backend]["level"], threads))
+    with Spinner("Running benchmark"):
+        results = run_compression_benchmark(data, configs)
+    table = Table(
+        title="Compression Backends",
+        title_style=f"bold {NordColors.FROST_1}",
+        border_style=NordColors.FROST_3,
+    )
+    table.add_column("Backend", style=NordColors.FROST_2)
+    table.add_column("Level", justify="right")
+    table.add_column("Threads", justify="right")
+    table.add_column("Throughput", style=NordColors.GREEN, justify="right")
+    table.add_column("Output", justify="right")
+    table.add_column("Ratio", style=NordColors.FROST_1, justify="right")
+    for r in results:
+        table.add_row(
+            r["backend"],
+            str(r["level"]),
+            str(r["threads"]),
+            f"{r['mb_per_s']:.1f} MB/s",
+            format_size(r["output_bytes"]),
+            f"{r['ratio'] * 100:.1f}%",
+        )
+    console.print(table)
+    if zstandard is None:
+        print_message(
+            "Install 'zstandard' to enable the zstd backend", NordColors.FROST_3
+        )
+    return True
+
+
+def compress_menu() -> None:
+    """Interactive menu for archive creation, extraction and compression benchmarks."""
+    clear_screen()
+    console.print(create_header())
+    print_section("Compress Files/Directories")
+    options = [
+        ("1", "Create compressed archive"),
+        ("2", "Benchmark compression backends"),
+        ("3", "Extract archive (file or directory of shards)"),
+        ("0", "Back to Main Menu"),
+    ]
+    console.print(create_menu_table("Compression", options))
+    choice = get_user_input("Select operation (0-3)", "1")
+    if choice == "1":
+        compress_files()
+    elif choice == "2":
+        benchmark_compression()
+    elif choice == "3":
+        extract_files()
+
+
+# ----------------------------------------------------------------
+# File Operation Functions
+# ----------------------------------------------------------------
+def _copy_file_contents(
+    src_file: Path, dst_file: Path, advance: Callable[[int], None]
+) -> int:
+    """
+    Copy a single file's data and metadata, reporting progress in CHUNK_SIZE steps.
+    Args:
+        src_file: Source file path.
+        dst_file: Destination file path.
+        advance: Callback receiving the number of bytes copied since the last call.
+    Returns:
+        The number of bytes copied.
+    """
+    with src_file.open("rb") as fin, dst_file.open("wb") as fout:
+        copied, _ = transfer_file_data(fin, fout, advance)
+    shutil.copystat(src_file, dst_file)
+    return copied
+
+
+def _write_checkpoint(path: Path, data: Dict[str, Any]) -> None:
+    """Atomically replace a resume checkpoint file."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w") as fout:
+        json.dump(data, fout)
+        fout.flush()
+        os.fsync(fout.fileno())
+    os.replace(tmp, path)
+
+
+def _load_checkpoint(
+    checkpoint: Path, partial: Path, src: str, src_stat: os.stat_result
+) -> Tuple[int, Any]:
+    """
+    Validate a resume checkpoint against the source and the partial file.
+    The source must be the same file (resolved path), unchanged (size and
+    mtime), and the partial file's prefix must hash to the recorded digest.
+    Returns:
+        The offset to resume from and a hash object primed with the prefix,
+        or (0, fresh hash) if the checkpoint is missing or does not match.
+    """
+    hash_func = hashlib.new(RESUME_HASH_ALGORITHM)
+    try:
+        with open(checkpoint) as fin:
+            data = json.load(fin)
+        offset = int(data["offset"])
+        if (
+            data["src"] != src
+            or data["size"] != src_stat.st_size
+            or data["mtime_ns"] != src_stat.st_mtime_ns
+            or data["algorithm"] != RESUME_HASH_ALGORITHM
+            or partial.stat().st_size < offset
+        ):
+            return 0, hash_func
+        with open(partial, "rb") as fin:
+            remaining = offset
+            while remaining and (chunk := fin.read(min(CHUNK_SIZE, remaining))):
+                hash_func.update(chunk)
+                remaining -= len(chunk)
+        if remaining or hash_func.hexdigest() != data["hash"]:
+            return 0, hashlib.new(RESUME_HASH_ALGORITHM)
+        return offset, hash_func
+    except (OSError, ValueError, KeyError, TypeError):
+        return 0, hashlib.new(RESUME_HASH_ALGORITHM)
+
+
+def resume_offset(dest: str) -> int:
+    """Return the checkpointed offset of an interrupted copy to dest, or 0."""
+    try:
+        with open(dest + RESUME_CHECKPOINT_SUFFIX) as fin:
+            return int(json.load(fin)["offset"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return 0
+
+
+def resumable_copy_file(
+    src_file: Path, dst_file: Path, advance: Callable[[int], None]
+) -> int:
+    """
+    Copy a file so that an interrupted copy can be continued later.
+    Data goes to a sibling <dest>.part file. Every RESUME_CHECKPOINT_INTERVAL
+    bytes the partial file is fsynced and a checkpoint with the offset and a
+    running hash of the copied prefix is written. Reissuing the same copy
+    verifies that prefix and continues from the checkpoint. The finished file is
+    renamed into place atomically and the checkpoint removed.
+    Args:
+        src_file: Source file path.
+        dst_file: Final destination path.
+        advance: Progress callback; resumed bytes are reported up front.
+    Returns:
+        The number of bytes copied in this run.
+    """
+    partial = dst_file.with_name(dst_file.name + RESUME_SUFFIX)
+    checkpoint = dst_file.with_name(dst_file.name + RESUME_CHECKPOINT_SUFFIX)
+    src = str(src_file.resolve())
+    src_stat = src_file.stat()
+    offset, hash_func = 0, hashlib.new(RESUME_HASH_ALGORITHM)
+    if partial.exists() and checkpoint.exists():
+        offset, hash_func = _load_checkpoint(checkpoint, partial, src, src_stat)
+    if offset:
+        advance(offset)
+    copied = 0
+    since_checkpoint = 0
+    with src_file.open("rb") as fin, open(partial, "r+b" if offset else "wb") as fout:
+        fin.seek(offset)
+        fout.seek(offset)
+        fout.truncate()
+        while chunk := fin.read(CHUNK_SIZE):
+            fout.write(chunk)
+            hash_func.update(chunk)
+            copied += len(chunk)
+            since_checkpoint += len(chunk)
+            advance(len(chunk))
+            if since_checkpoint >= RESUME_CHECKPOINT_INTERVAL:
+                fout.flush()
+                os.fsync(fout.fileno())
+                _write_checkpoint(
+                    checkpoint,
+                    {
+                        "src": src,
+                        "size": src_stat.st_size,
+                        "mtime_ns": src_stat.st_mtime_ns,
+                        "algorithm": RESUME_HASH_ALGORITHM,
+                        "offset": offset + copied,
+                        "hash": hash_func.hexdigest(),
+                    },
+                )
+                since_checkpoint = 0
+        fout.flush()
+        os.fsync(fout.fileno())
+    shutil.copystat(src_file, partial)
+    os.replace(partial, dst_file)
+    if checkpoint.exists():
+        checkpoint.unlink()
+    return copied
+
+
+def is_sparse(path: str) -> bool:
+    """Return True if a file has fewer allocated bytes than its apparent size."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return hasattr(st, "st_blocks") and st.st_blocks * 512 < st.st_size
+
+
+def _data_extents(fd: int, size: int) -> Iterator[Tuple[int, int]]:
+    """
+    Yield (start, end) ranges of a file that hold data, using SEEK_DATA and
+    SEEK_HOLE. Filesystems without hole reporting yield the whole file.
+    """
+    if not hasattr(os, "SEEK_DATA"):
+        yield 0, size
+        return
+    offset = 0
+    while offset < size:
+        try:
+            start = os.lseek(fd, offset, os.SEEK_DATA)
+        except OSError as e:
+            if e.errno == errno.ENXIO:  # No data after offset
+                return
+            if offset == 0 and e.errno in FALLBACK_ERRNOS:
+                yield 0, size
+                return
+            raise
+        end = min(os.lseek(fd, start, os.SEEK_HOLE), size)
+        yield start, end
+        offset = end
+
+
+def sparse_copy_file(
+    src_file: Path,
+    dst_file: Path,
+    advance: Callable[[int], None],
+    on_physical: Optional[Callable[[int], None]] = None,
+) -> int:
+    """
+    Copy a file while preserving holes. Only the source's data extents are
+    read, and all-zero SPARSE_BLOCK_SIZE blocks inside them are skipped too, so
+    the destination is at least as sparse as the source.
+    Args:
+        src_file: Source file path.
+        dst_file: Destination file path.
+        advance: Callback receiving logical bytes processed (holes included).
+        on_physical: Optional callback receiving bytes actually written.
+    Returns:
+        The logical size of the file.
+    """
+    with src_file.open("rb") as fin, dst_file.open("wb") as fout:
+        in_fd, out_fd = fin.fileno(), fout.fileno()
+        size = os.fstat(in_fd).st_size
+        position = 0
+        for start, end in _data_extents(in_fd, size):
+            if start > position:
+                advance(start - position)
+            offset = start
+            while offset < end:
+                block = os.pread(in_fd, min(SPARSE_BLOCK_SIZE, end - offset), offset)
+                if not block:
+                    break
+                if block != ZERO_BLOCK[: len(block)]:
+                    os.pwrite(out_fd, block, offset)
+                    if on_physical:
+                        on_physical(len(block))
+                offset += len(block)
+                advance(len(block))
+            position = offset
+        if size > position:
+            advance(size - position)
+        os.ftruncate(out_fd, size)
+    shutil.copystat(src_file, dst_file)
+    return size
+
+
+def _is_copied(src_file: Path, dst_file: Path) -> bool:
+    """Return True if dst_file already matches src_file by size and mtime."""
+    try:
+        s, d = src_file.stat(), dst_file.stat()
+    except OSError:
+        return False
+    return s.st_size == d.st_size and s.st_mtime_ns == d.st_mtime_ns
+
+
+def _copy_tree_parallel(
+    files: List[Tuple[Path, Path]],
+    workers: int,
+    advance: Callable[[int], None],
+    copy_func: Callable[[Path, Path, Callable[[int], None]], int] = _copy_file_contents,
+) -> int:
+    """
+    Copy a list of (source, destination) files on a bounded thread pool.
+    Destination directories must already exist. At most workers * COPY_QUEUE_FACTOR
+    files are queued at once; the first failure cancels the remaining work.
+    Args:
+        files: Pairs of source and destination file paths.
+        workers: Number of worker threads.
+        advance: Thread-safe progress callback (bytes copied).
+        copy_func: Function copying a single file.
+    Returns:
+        Total number of bytes copied.
+    """
+    copied = 0
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="copy") as pool:
+        for n in run_bounded(
+            pool,
+            copy_func,
+            ((src_file, dst_file, advance) for src_file, dst_file in files),
+            workers * COPY_QUEUE_FACTOR,
+        ):
+            copied += n
+    return copied
+
+
+def copy_item(
+    src: str,
+    dest: str,
+    workers: int = DEFAULT_COPY_WORKERS,
+    resumable: bool = False,
+    sparse: bool = False,
+) -> bool:
+    """
+    Copy a file or directory with progress feedback.
+    Directory copies create the destination tree first and then copy files
+    concurrently on a pool of worker threads.
+    Args:
+        src: Source path.
+        dest: Destination path.
+        workers: Number of parallel copy workers for directory copies.
+        resumable: Copy through checkpointed .part files so an interrupted copy
+            continues where it stopped; files already copied are skipped.
+        sparse: Skip holes and zero blocks so sparse files (VM images) stay
+            sparse; progress then also reports the physical bytes written.
+    Returns:
+        True if the copy succeeds; otherwise False.
+    """
+    print_section(f"Copying: {Path(src).name}")
+    if not Path(src).exists():
+        print_error(f"Source not found: {src}")
+        return False
+    workers = max(1, min(workers, MAX_COPY_WORKERS))
+    physical = 0
+    physical_lock = threading.Lock()
+
+    def add_physical(n: int) -> None:
+        nonlocal physical
+        with physical_lock:
+            physical += n
+
+    def sparse_copy(src_file: Path, dst_file: Path, advance: Callable[[int], None]):
+        return sparse_copy_file(src_file, dst_file, advance, add_physical)
+
+    try:
+        if Path(src).is_dir():
+            files: List[Tuple[Path, Path]] = []
+            total_size = 0
+            directories: List[Path] = [Path(dest)]
+            for entry in walk_tree(src):
+                target = Path(dest) / os.path.relpath(entry.path, src)
+                if entry.is_dir:
+                    directories.append(target)
+                else:
+                    total_size += entry.size
+                    files.append((Path(entry.path), target))
+            if total_size == 0:
+                print_warning("Directory is empty; nothing to copy.")
+                return True
+            for target in directories:
+                target.mkdir(parents=True, exist_ok=True)
+            copy_func = _copy_file_contents
+            done_size = 0
+            if resumable:
+                copy_func = resumable_copy_file
+                pending = [(s, d) for s, d in files if not _is_copied(s, d)]
+                if len(pending) < len(files):
+                    done_size = total_size - sum(s.stat().st_size for s, _ in pending)
+                    print_message(
+                        f"Skipping {len(files) - len(pending)} files already copied",
+                        NordColors.FROST_3,
+                    )
+                files = pending
+            elif sparse:
+                copy_func = sparse_copy
+            start_time = time.time()
+            with ProgressManager(show_speed=True) as progress:
+                task = progress.add_task(
+                    f"Copying directory ({workers} workers)",
+                    total=total_size,
+                    completed=done_size,
+                    color=NordColors.FROST_2,
+                )
+                _copy_tree_parallel(
+                    files,
+                    workers,
+                    lambda n: progress.update(task, advance=n),
+                    copy_func,
+                )
+            elapsed = time.time() - start_time
+            rate = total_size / elapsed if elapsed > 0 else 0
+            print_success(
+                f"Copied {len(files)} files ({format_size(total_size)}) in "
+                f"{format_time(elapsed)} ({format_size(rate)}/s)"
+            )
+            if sparse:
+                print_message(
+                    f"Physical bytes written: {format_size(physical)}",
+                    NordColors.FROST_3,
+                )
+        else:
+            file_size = Path(src).stat().st_size
+            start_time = time.time()
+            with ProgressManager(show_speed=True) as progress:
+                task = progress.add_task(
+                    f"Copying {Path(src).name}",
+                    total=file_size,
+                    color=NordColors.FROST_2,
+                )
+
+                def advance(n: int) -> None:
+                    if sparse:
+                        progress.update(
+                            task,
+                            advance=n,
+                            description=f"Copying {Path(src).name} "
+                            f"(written {format_size(physical)})",
+                        )
+                    else:
+                        progress.update(task, advance=n)
+
+                if sparse:
+                    sparse_copy(Path(src), Path(dest), advance)
+                elif resumable:
+                    resumable_copy_file(Path(src), Path(dest), advance)
+                else:
+                    _copy_file_contents(Path(src), Path(dest), advance)
+            elapsed = time.time() - start_time
+            print_success(
+                f"Copied file ({format_size(file_size)}) in {format_time(elapsed)}"
+            )
+            if sparse:
+                print_message(
+                    f"Logical size: {format_size(file_size)}, physical bytes written: "
+                    f"{format_size(physical)}",
+                    NordColors.FROST_3,
+                )
+        return True
+    except Exception as e:
+        print_error(f"Error copying {src}: {e}")
+        return False
+
+
+def move_item(src: str, dest: str) -> bool:
+    """
+    Move a file or directory. If source and destination are on different filesystems,
+    perform a copy then delete.
+    Args:
+        src: Source path.
+        dest: Destination path.
+    Returns:
+        True if move succeeds; otherwise False.
+    """
+    print_section(f"Moving: {Path(src).name}")
+    if not Path(src).exists():
+        print_error(f"Source not found: {src}")
+        return False
+    try:
+        same_fs = os.stat(src).st_dev == os.stat(Path(dest).parent or ".").st_dev
+        start_time = time.time()
+        if same_fs:
+            os.rename(src, dest)
+            print_success(
+                f"Moved {src} to {dest} in {format_time(time.time() - start_time)}"
+            )
+        else:
+            print_message(
+                "Different filesystem detected: copying then deleting source...",
+                NordColors.FROST_2,
+                "➜",
+            )
+            if not copy_item(src, dest):
+                return False
+            if Path(src).is_dir():
+                shutil.rmtree(src)
+            else:
+                os.remove(src)
+            print_success(f"Moved {src} to {dest} by copying and deleting source")
+        return True
+    except Exception as e:
+        print_error(f"Error moving {src}: {e}")
+        return False
+
+
+def _remove_path(path: str, is_dir: bool) -> Optional[str]:
+    """Unlink a file or remove an empty directory, returning an error message."""
+    try:
+        if is_dir:
+            os.rmdir(path)
+        else:
+            os.unlink(path)
+        return None
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        return f"{path}: {e.strerror}"
+
+
+def parallel_delete(
+    root: str,
+    workers: int = DEFAULT_DELETE_WORKERS,
+    on_found: Optional[Callable[[int], None]] = None,
+    advance: Optional[Callable[[int], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Recursively delete a directory tree using a pool of unlink workers.
+    Files are unlinked as soon as the scandir walk finds them, then directories
+    are removed bottom-up, one depth level at a time so siblings go in parallel.
+    Symlinks are removed, never followed.
+    Args:
+        root: Directory to delete (the directory itself is removed too).
+        workers: Number of concurrent unlink/rmdir calls.
+        on_found: Called with 1 for each entry discovered by the walk.
+        advance: Called with 1 for each entry removed.
+    Returns:
+        A summary with files and directories removed, errors and elapsed time.
+    """
+    on_found = on_found or (lambda n: None)
+    advance = advance or (lambda n: None)
+    workers = max(1, min(workers, MAX_COPY_WORKERS))
+    errors: List[str] = []
+    dirs_by_depth: Dict[int, List[str]] = {}
+    files = dirs = 0
+    start_time = time.time()
+
+    def file_args() -> Iterator[Tuple[str, bool]]:
+        for entry in walk_tree(
+            root, min(workers, DEFAULT_WALK_WORKERS), follow_symlinks=False
+        ):
+            on_found(1)
+            if entry.is_dir:
+                depth = entry.path.count(os.sep)
+                dirs_by_depth.setdefault(depth, []).append(entry.path)
+            else:
+                yield entry.path, False
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="delete") as pool:
+        for error in run_bounded(
+            pool, _remove_path, file_args(), workers * COPY_QUEUE_FACTOR
+        ):
+            if error:
+                errors.append(error)
+            else:
+                files += 1
+            advance(1)
+        for depth in sorted(dirs_by_depth, reverse=True):
+            for error in run_bounded(
+                pool,
+                _remove_path,
+                ((path, True) for path in dirs_by_depth[depth]),
+                workers * COPY_QUEUE_FACTOR,
+            ):
+                if error:
+                    errors.append(error)
+                else:
+                    dirs += 1
+                advance(1)
+    error = _remove_path(root, True)
+    if error:
+        errors.append(error)
+    else:
+        dirs += 1
+    return {
+        "files": files,
+        "dirs": dirs,
+        "errors": errors,
+        "elapsed": time.time() - start_time,
+    }
+
+
+def delete_item(
+    path: str, force: bool = False, workers: int = DEFAULT_DELETE_WORKERS
+) -> bool:
+    """
+    Delete a file or directory after confirmation.
+    Directories are removed with parallel_delete, showing live files/s progress.
+    Args:
+        path: Path to delete.
+        force: If True, skip confirmation.
+        workers: Number of concurrent unlink workers for directories.
+    Returns:
+        True if deletion succeeds; otherwise False.
+    """
+    print_section(f"Deleting: {Path(path).name}")
+    if not Path(path).exists() and not Path(path).is_symlink():
+        print_error(f"Path not found: {path}")
+        return False
+    if not force and not get_user_confirmation(
+        f"Are you sure you want to delete {path}?"
+    ):
+        print_message("Deletion cancelled", NordColors.FROST_2, "➜")
+        return False
+    try:
+        start_time = time.time()
+        if not Path(path).is_dir() or Path(path).is_symlink():
+            os.remove(path)
+            print_success(f"Deleted {path} in {format_time(time.time() - start_time)}")
+            return True
+        found = removed = 0
+        with ProgressManager() as progress:
+            task = progress.add_task("Deleting", total=1, color=NordColors.FROST_2)
+
+            def on_found(n: int) -> None:
+                nonlocal found
+                found += n
+                progress.update(task, total=found)
+
+            def advance(n: int) -> None:
+                nonlocal removed
+                removed += n
+                rate = removed / max(time.time() - start_time, 1e-6)
+                progress.update(
+                    task,
+                    completed=removed,
+                    description=f"Deleting {removed:,} entries ({rate:,.0f}/s)",
+                )
+
+            summary = parallel_delete(path, workers, on_found, advance)
+        elapsed = summary["elapsed"]
+        rate = (summary["files"] + summary["dirs"]) / max(elapsed, 1e-6)
+        if summary["errors"]:
+            for error in summary["errors"][:10]:
+                print_error(error)
+            if len(summary["errors"]) > 10:
+                print_warning(f"...and {len(summary['errors']) - 10} more errors")
+            return False
+        print_success(
+            f"Deleted {path} ({summary['files']:,} files, {summary['dirs']:,} "
+            f"directories) in {format_time(elapsed)} at {rate:,.0f} entries/s"
+        )
+        return True
+    except Exception as e:
+        print_error(f"Error deleting {path}: {e}")
+        return False
+
+
+def find_files() -> None:
+    """
+    Search for files matching a pattern in a directory.
+    Uses the persistent file index when one covers the directory (refreshing it
+    incrementally first) and offers to build one otherwise.
+    Offers an option to display detailed file information.
+    """
+    directory = get_user_input("Enter directory to search")
+    if not directory or not Path(directory).exists():
+        print_error("Invalid directory")
+        return
+    pattern = get_user_input("Enter search pattern (wildcards allowed)", ".*")
+    details = get_user_confirmation("Show detailed file information?")
+    print_section(f"Searching in {directory}")
+    regex = re.compile(pattern.replace("*", ".*").replace("?", "."), re.IGNORECASE)
+    matches: List[str] = []
+    file_info: Dict[str, Tuple[int, float, str]] = {}
+    index = FileIndex.find(directory)
+    if index is None and get_user_confirmation(
+        "No file index found. Build one for faster repeat searches?"
+    ):
+        index = FileIndex(directory)
+    if index is not None:
+        with index:
+            with Spinner("Refreshing file index"):
+                rescanned, checked = index.refresh(directory)
+            print_message(
+                f"Index refreshed: {rescanned} of {checked} directories changed",
+                NordColors.FROST_3,
+            )
+            start_time = time.time()
+            for path, size, mtime, category in index.search(regex, directory):
+                matches.append(path)
+                file_info[path] = (size, mtime, category)
+            print_message(
+                f"Index query took {(time.time() - start_time) * 1000:.1f} ms",
+                NordColors.FROST_3,
+            )
+    else:
+        with Spinner("Searching for files"):
+            for entry in walk_tree(directory):
+                name = os.path.basename(entry.path)
+                if not entry.is_dir and regex.search(name):
+                    matches.append(entry.path)
+                    file_info[entry.path] = (
+                        entry.size,
+                        entry.mtime,
+                        get_file_category(name),
+                    )
+    print_success(f"Found {len(matches)} matching files")
+    if details and matches:
+        table = Table(
+            title="Search Results",
+            title_style=f"bold {NordColors.FROST_1}",
+            border_style=NordColors.FROST_3,
+            highlight=True,
+        )
+        table.add_column("File Path", style=NordColors.SNOW_STORM_1)
+        table.add_column("Size", style=NordColors.FROST_2, justify="right")
+        table.add_column("Modified", style=NordColors.FROST_1)
+        table.add_column("Type", style=NordColors.FROST_3)
+        for match in matches[:100]:
+            try:
+                if match in file_info:
+                    size_bytes, mtime, ftype = file_info[match]
+                else:
+                    st = os.stat(match)
+                    size_bytes, mtime = st.st_size, st.st_mtime
+                    ftype = get_file_category(match)
+                modified = dt.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S")
+                table.add_row(match, format_size(size_bytes), modified, ftype)
+            except Exception as e:
+                print_error(f"Error reading {match}: {e}")
+        console.print(table)
+        if len(matches) > 100:
+            print_warning(f"Showing first 100 of {len(matches)} matches")
+    else:
+        for match in matches[:100]:
+            console.print(
+                f"[{NordColors.SNOW_STORM_1}]{match}[/{NordColors.SNOW_STORM_1}]"
+            )
+        if len(matches) > 100:
+            print_warning(f"Showing first 100 of {len(matches)} matches")
+
+
+def compress_files() -> bool:
+    """
+    Compress a file or directory into a tar archive with progress tracking.
+    The source is walked and archived in one pass: the progress total starts as
+    an estimate that StreamingWalk refines while the walk runs ahead.
+    Blocks are compressed in parallel with the selected backend and thread count.
+    Returns:
+        True if compression succeeds; otherwise False.
+    """
+    src = get_user_input("Enter source file/directory to compress")
+    if not src or not Path(src).exists():
+        print_error("Invalid source path")
+        return False
+    backends = available_backends()
+    backend = get_user_input(f"Compression backend ({'/'.join(backends)})", "gzip")
+    if backend not in backends:
+        print_warning("Unknown or unavailable backend; using gzip")
+        backend = "gzip"
+    info = COMPRESSION_BACKENDS[backend]
+    try:
+        level = int(
+            get_user_input(f"Compression level {info['range']}", str(info["level"]))
+        )
+    except ValueError:
+        print_warning(f"Invalid compression level; using {info['level']}")
+        level = info["level"]
+    try:
+        threads = int(
+            get_user_input("Compression threads", str(DEFAULT_COMPRESSION_THREADS))
+        )
+    except ValueError:
+        print_warning(f"Invalid thread count; using {DEFAULT_COMPRESSION_THREADS}")
+        threads = DEFAULT_COMPRESSION_THREADS
+    low, high = info["range"]
+    level = max(low, min(level, high))
+    dest = get_user_input("Enter destination archive path (without extension)")
+    if not dest:
+        print_error("Destination path cannot be empty")
+        return False
+    if not dest.endswith(info["extensions"]):
+        dest = f"{dest}{info['extensions'][0]}"
+    print_section(f"Compressing: {Path(src).name}")
+    # A sorted walk keeps member order, and so the archive, reproducible.
+    walker = (
+        StreamingWalk(src, follow_symlinks=False, sort=True)
+        if Path(src).is_dir()
+        else None
+    )
+    total_size = 0 if walker else Path(src).stat().st_size
+    start_time = time.time()
+    try:
+        with ProgressManager(show_speed=True) as progress:
+            task = progress.add_task(
+                f"Compressing files ({backend}, {threads} threads)",
+                total=max(total_size, 1),
+                color=NordColors.FROST_2,
+            )
+            done = 0
+
+            def progress_filter(ti):
+                nonlocal done
+                done += ti.size
+                estimate = walker.estimate() if walker else total_size
+                progress.update(task, completed=done, total=max(estimate, done, 1))
+                return ti
+
+            if walker:
+                with walker:
+                    out_size = create_archive(
+                        src, dest, walker, backend, level, threads, progress_filter
+                    )
+                total_size = walker.bytes_found
+            else:
+                out_size = create_archive(
+                    src, dest, [], backend, level, threads, progress_filter
+                )
         elapsed = time.time() - start_time
-        out_size = Path(dest).stat().st_size
         ratio = (total_size - out_size) / total_size * 100 if total_size > 0 else 0
         panel = Panel(
             Text.from_markup(
@@ -630,167 +2683,1238 @@ def compress_files() -> bool:
             ),
             title=f"[bold {NordColors.GREEN}]Compression Complete[/]",
             border_style=NordColors.FROST_3,
-            padding=(1, 2),
+            padding=(1, 2),
+        )
+        console.print(panel)
+        print_success(f"Compressed to {dest} in {format_time(elapsed)}")
+        return True
+    except Exception as e:
+        print_error(f"Error compressing {src}: {e}")
+        if Path(dest).exists():
+            try:
+                Path(dest).unlink()
+            except Exception:
+                pass
+        return False
+
+
+def extract_files() -> bool:
+    """
+    Extract a tar archive, or a directory of shard archives, with progress
+    tracking. Multi-member archives (as written by compress_files) are
+    decompressed in parallel and files are written by a pool of workers.
+    Returns:
+        True if extraction succeeds; otherwise False.
+    """
+    archive = get_user_input("Enter archive file (or directory of shard archives)")
+    if not archive or not Path(archive).exists():
+        print_error("Invalid archive path")
+        return False
+    dest = get_user_input("Enter destination directory", ".")
+    try:
+        threads = int(
+            get_user_input("Decompression threads", str(DEFAULT_COMPRESSION_THREADS))
+        )
+    except ValueError:
+        print_warning("Invalid number; using defaults")
+        threads = DEFAULT_COMPRESSION_THREADS
+    if Path(archive).is_dir():
+        shards = list_shards(archive)
+        if not shards:
+            print_error("No archives found in directory")
+            return False
+        total_size = sum(Path(shard).stat().st_size for shard in shards)
+        description = f"Extracting {len(shards)} shards"
+    else:
+        total_size = Path(archive).stat().st_size
+        description = f"Extracting ({detect_backend(archive) or 'tar'})"
+    print_section(f"Extracting: {Path(archive).name}")
+    start_time = time.time()
+    try:
+        with ProgressManager(show_speed=True) as progress:
+            task = progress.add_task(
+                description, total=max(total_size, 1), color=NordColors.FROST_2
+            )
+            result = extract_archive(
+                archive,
+                dest,
+                threads,
+                advance=lambda n: progress.update(task, advance=n),
+            )
+        elapsed = time.time() - start_time
+        print_success(
+            f"Extracted {result['members']:,} members ({result['files']:,} files, "
+            f"{format_size(result['bytes'])}) to {dest} in {format_time(elapsed)}"
+        )
+        return True
+    except Exception as e:
+        print_error(f"Error extracting {archive}: {e}")
+        return False
+
+
+def hash_file(
+    path: str,
+    algorithm: str,
+    advance: Optional[Callable[[int], None]] = None,
+    use_mmap: bool = True,
+) -> str:
+    """
+    Return the hex digest of a file. Files of at least MMAP_THRESHOLD bytes are
+    hashed through a read-only mmap, avoiding a copy into Python buffers.
+    Args:
+        path: File to hash.
+        algorithm: Any hashlib algorithm name.
+        advance: Optional callback receiving bytes hashed per CHUNK_SIZE step.
+        use_mmap: Set to False to always use buffered reads.
+    """
+    hash_func = hashlib.new(algorithm)
+    with open(path, "rb") as fin:
+        size = os.fstat(fin.fileno()).st_size
+        if use_mmap and size >= MMAP_THRESHOLD:
+            with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, "madvise"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                with memoryview(mm) as view:
+                    for offset in range(0, size, CHUNK_SIZE):
+                        with view[offset : offset + CHUNK_SIZE] as chunk:
+                            hash_func.update(chunk)
+                            if advance:
+                                advance(len(chunk))
+        else:
+            while chunk := fin.read(CHUNK_SIZE):
+                hash_func.update(chunk)
+                if advance:
+                    advance(len(chunk))
+    return hash_func.hexdigest()
+
+
+def calculate_checksum() -> bool:
+    """
+    Calculate and display the checksum of a file using a chosen algorithm.
+    Returns:
+        True if checksum calculation succeeds; otherwise False.
+    """
+    path = get_user_input("Enter file path for checksum calculation")
+    if not path or not Path(path).exists() or Path(path).is_dir():
+        print_error("Invalid file path")
+        return False
+    algo_options = [
+        (str(i + 1), algo.upper()) for i, algo in enumerate(CHECKSUM_ALGORITHMS)
+    ]
+    console.print(create_menu_table("Select Checksum Algorithm", algo_options))
+    choice = get_user_input("Select algorithm (1-4)", "1")
+    try:
+        algorithm = CHECKSUM_ALGORITHMS[int(choice) - 1]
+    except (ValueError, IndexError):
+        print_error("Invalid selection. Defaulting to MD5.")
+        algorithm = "md5"
+    print_section(f"Calculating {algorithm.upper()} checksum for {Path(path).name}")
+    try:
+        file_size = Path(path).stat().st_size
+        start_time = time.time()
+        with ProgressManager() as progress:
+            task = progress.add_task(
+                "Reading file", total=file_size, color=NordColors.FROST_2
+            )
+            checksum = hash_file(
+                path, algorithm, lambda n: progress.update(task, advance=n)
+            )
+        elapsed = time.time() - start_time
+        panel = Panel(
+            Text.from_markup(f"[bold {NordColors.FROST_2}]{checksum}[/]"),
+            title=f"[bold {NordColors.FROST_1}]{algorithm.upper()} Checksum[/]",
+            border_style=NordColors.GREEN,
+            padding=(1, 2),
+        )
+        console.print(panel)
+        console.print(f"Time taken: {format_time(elapsed)}")
+        return True
+    except Exception as e:
+        print_error(f"Error calculating checksum: {e}")
+        return False
+
+
+def disk_usage() -> bool:
+    """
+    Analyze disk usage for a given directory, display a summary and offer an
+    interactive drill-down. Directory records are cached, so repeat scans only
+    revisit directories that changed.
+    Returns:
+        True if analysis succeeds; otherwise False.
+    """
+    directory = get_user_input("Enter directory to analyze")
+    if not directory or not Path(directory).is_dir():
+        print_error("Invalid directory")
+        return False
+    threshold_mb = get_user_input("Size threshold in MB (highlight if exceeded)", "100")
+    try:
+        threshold = int(threshold_mb) * 1024 * 1024
+    except ValueError:
+        print_warning("Invalid threshold; using default (100 MB)")
+        threshold = LARGE_FILE_THRESHOLD
+    cache = DiskUsageCache(directory)
+    use_cache = bool(cache.records) and not get_user_confirmation(
+        "Cached results found. Force a full rescan?"
+    )
+    print_section(f"Analyzing disk usage in {directory}")
+    try:
+        with Spinner("Analyzing directory"):
+            report = cache.scan(use_cache)
+        cache.save()
+    except Exception as e:
+        print_error(f"Error analyzing {directory}: {e}")
+        return False
+    print_message(
+        f"Rescanned {report.rescanned} of {report.directories} directories",
+        NordColors.FROST_3,
+    )
+    total_size = report.tree.size
+    summary = Table(
+        title="Disk Usage Summary",
+        title_style=f"bold {NordColors.FROST_1}",
+        border_style=NordColors.FROST_3,
+    )
+    summary.add_column("Metric", style=NordColors.FROST_2)
+    summary.add_column("Value", style=NordColors.SNOW_STORM_1)
+    summary.add_row("Total files", str(report.tree.files))
+    summary.add_row("Total directories", str(report.directories))
+    summary.add_row("Total size", format_size(total_size))
+    console.print(summary)
+    if report.categories:
+        cat_table = Table(
+            title="Size by File Type",
+            title_style=f"bold {NordColors.FROST_1}",
+            border_style=NordColors.FROST_3,
         )
-        console.print(panel)
-        print_success(f"Compressed to {dest} in {format_time(elapsed)}")
-        return True
-    except Exception as e:
-        print_error(f"Error compressing {src}: {e}")
-        if Path(dest).exists():
+        cat_table.add_column("Category", style=NordColors.FROST_2)
+        cat_table.add_column("Size", style=NordColors.SNOW_STORM_1, justify="right")
+        cat_table.add_column("Percentage", style=NordColors.FROST_1, justify="right")
+        for cat, size in sorted(
+            report.categories.items(), key=lambda x: x[1], reverse=True
+        ):
+            perc = (size / total_size * 100) if total_size > 0 else 0
+            cat_table.add_row(cat, format_size(size), f"{perc:.1f}%")
+        console.print(cat_table)
+    if report.top_files:
+        lf_table = Table(
+            title=f"Largest Files (red: >{format_size(threshold)})",
+            title_style=f"bold {NordColors.FROST_1}",
+            border_style=NordColors.FROST_3,
+        )
+        lf_table.add_column("File", style=NordColors.SNOW_STORM_1)
+        lf_table.add_column("Size", justify="right")
+        for size, file_path in report.top_files[:10]:
+            style = NordColors.RED if size > threshold else NordColors.SNOW_STORM_1
+            lf_table.add_row(file_path, f"[{style}]{format_size(size)}[/]")
+        console.print(lf_table)
+    if report.tree.children and get_user_confirmation("Browse directories by size?"):
+        browse_usage(report, threshold)
+    if get_user_confirmation("Export the usage report as JSON?"):
+        prompt_usage_export(report)
+    return True
+
+
+# ----------------------------------------------------------------
+# Disk Usage Engine
+# ----------------------------------------------------------------
+@dataclass
+class DirUsage:
+    """Aggregate disk usage of a directory subtree."""
+
+    path: str
+    size: int = 0
+    files: int = 0
+    children: List["DirUsage"] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "size": self.size,
+            "files": self.files,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+@dataclass
+class UsageReport:
+    """Result of a disk usage scan."""
+
+    tree: DirUsage
+    categories: Dict[str, int]
+    top_files: List[Tuple[int, str]]
+    directories: int
+    rescanned: int
+
+
+class DiskUsageCache:
+    """
+    Per-directory usage records (own file sizes, counts, categories and largest
+    files) cached on disk and keyed by directory mtime. A rescan only lists
+    directories whose mtime changed; subtree totals are then re-aggregated from
+    the records in memory. Files that grow in place do not change their
+    directory's mtime, so use a full rescan when exact figures matter.
+    """
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        digest = hashlib.sha1(self.root.encode()).hexdigest()[:16]
+        self.path = INDEX_DIR / f"usage-{digest}.json"
+        self.records: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
             try:
-                Path(dest).unlink()
-            except Exception:
-                pass
+                with open(self.path) as fin:
+                    self.records = json.load(fin)
+            except (OSError, ValueError):
+                self.records = {}
+
+    def save(self) -> None:
+        INDEX_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w") as fout:
+            json.dump(self.records, fout, separators=(",", ":"))
+        os.replace(tmp, self.path)
+
+    @staticmethod
+    def _scan_dir(directory: str, mtime_ns: int) -> Dict[str, Any]:
+        """List one directory and summarize the files directly inside it."""
+        size = files = 0
+        categories: Dict[str, int] = {}
+        top: List[Tuple[int, str]] = []
+        subdirs: List[str] = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.name)
+                        elif entry.is_file():
+                            st_size = entry.stat().st_size
+                            size += st_size
+                            files += 1
+                            cat = get_file_category(entry.name)
+                            categories[cat] = categories.get(cat, 0) + st_size
+                            if len(top) < DISK_USAGE_TOP_FILES:
+                                heapq.heappush(top, (st_size, entry.path))
+                            elif st_size > top[0][0]:
+                                heapq.heapreplace(top, (st_size, entry.path))
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return {
+            "mtime_ns": mtime_ns,
+            "size": size,
+            "files": files,
+            "categories": categories,
+            "top": top,
+            "subdirs": subdirs,
+        }
+
+    def scan(self, use_cache: bool = True) -> UsageReport:
+        """Scan the root, reusing cached records for unchanged directories."""
+        records: Dict[str, Dict[str, Any]] = {}
+        nodes: Dict[str, DirUsage] = {}
+        order: List[str] = []
+        rescanned = 0
+        stack = [self.root]
+        while stack:
+            directory = stack.pop()
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+            record = self.records.get(directory) if use_cache else None
+            if record is None or record["mtime_ns"] != mtime_ns:
+                record = self._scan_dir(directory, mtime_ns)
+                rescanned += 1
+            records[directory] = record
+            node = DirUsage(directory, record["size"], record["files"])
+            nodes[directory] = node
+            parent = nodes.get(os.path.dirname(directory))
+            if parent is not None and directory != self.root:
+                parent.children.append(node)
+            order.append(directory)
+            stack.extend(os.path.join(directory, name) for name in record["subdirs"])
+
+        categories: Dict[str, int] = {}
+        top: List[Tuple[int, str]] = []
+        # Pre-order puts every directory after its parent, so walking it backwards
+        # folds each subtree's totals into its parent exactly once.
+        for directory in reversed(order):
+            node = nodes[directory]
+            record = records[directory]
+            for child in node.children:
+                node.size += child.size
+                node.files += child.files
+            node.children.sort(key=lambda c: c.size, reverse=True)
+            for cat, size in record["categories"].items():
+                categories[cat] = categories.get(cat, 0) + size
+            for item in record["top"]:
+                item = (item[0], item[1])
+                if len(top) < DISK_USAGE_TOP_FILES:
+                    heapq.heappush(top, item)
+                elif item[0] > top[0][0]:
+                    heapq.heapreplace(top, item)
+        self.records = records
+        return UsageReport(
+            tree=nodes[self.root],
+            categories=categories,
+            top_files=sorted(top, reverse=True),
+            directories=len(order),
+            rescanned=rescanned,
+        )
+
+
+def export_usage_json(report: UsageReport, dest: str) -> None:
+    """Write a disk usage report, including the full directory tree, as JSON."""
+    data = {
+        "generated": dt.now().isoformat(),
+        "total_size": report.tree.size,
+        "total_files": report.tree.files,
+        "categories": report.categories,
+        "top_files": [{"path": path, "size": size} for size, path in report.top_files],
+        "tree": report.tree.to_dict(),
+    }
+    with open(dest, "w") as fout:
+        json.dump(data, fout)
+
+
+def prompt_usage_export(report: UsageReport) -> None:
+    """Ask for an output path and export the usage report there."""
+    dest = get_user_input("Enter JSON output path", "disk_usage.json")
+    try:
+        export_usage_json(report, dest)
+        print_success(f"Exported usage tree to {dest}")
+    except OSError as e:
+        print_error(f"Error exporting usage tree: {e}")
+
+
+def browse_usage(report: UsageReport, threshold: int) -> None:
+    """Interactively drill down through the directory tree by size."""
+    trail: List[DirUsage] = [report.tree]
+    while True:
+        node = trail[-1]
+        table = Table(
+            title=f"{node.path} ({format_size(node.size)}, {node.files} files)",
+            title_style=f"bold {NordColors.FROST_1}",
+            border_style=NordColors.FROST_3,
+        )
+        table.add_column("#", style=f"bold {NordColors.FROST_3}", justify="right")
+        table.add_column("Directory", style=NordColors.SNOW_STORM_1)
+        table.add_column("Size", justify="right")
+        table.add_column("Share", style=NordColors.FROST_1, justify="right")
+        table.add_column("Files", style=NordColors.FROST_2, justify="right")
+        for i, child in enumerate(node.children[:30], 1):
+            share = child.size / node.size * 100 if node.size else 0
+            style = (
+                NordColors.RED if child.size > threshold else NordColors.SNOW_STORM_1
+            )
+            bar = "█" * int(share / 5)
+            table.add_row(
+                str(i),
+                os.path.basename(child.path),
+                f"[{style}]{format_size(child.size)}[/]",
+                f"{bar} {share:.1f}%",
+                str(child.files),
+            )
+        console.print(table)
+        if len(node.children) > 30:
+            print_warning(f"Showing largest 30 of {len(node.children)} directories")
+        choice = get_user_input(
+            "Directory # to open, '..' to go up, 'e' to export JSON, 'q' to quit", "q"
+        ).strip()
+        if choice == "q":
+            return
+        if choice == "..":
+            if len(trail) > 1:
+                trail.pop()
+        elif choice == "e":
+            prompt_usage_export(report)
+        elif choice.isdigit() and 1 <= int(choice) <= min(len(node.children), 30):
+            trail.append(node.children[int(choice) - 1])
+        else:
+            print_error("Invalid selection")
+
+
+# ----------------------------------------------------------------
+# Duplicate Detection
+# ----------------------------------------------------------------
+class DuplicateSet(NamedTuple):
+    """A group of files with identical content."""
+
+    size: int
+    digest: str
+    paths: List[str]
+
+    @property
+    def reclaimable(self) -> int:
+        return self.size * (len(self.paths) - 1)
+
+
+def _partial_hash(path: str, size: int) -> Tuple[str, Tuple[int, int], str]:
+    """
+    Hash the first and last DUPLICATE_SAMPLE_SIZE bytes of a file. Files no larger
+    than two samples are hashed completely, so the result is already final.
+    Returns:
+        The path, its (device, inode) identity and the hex digest.
+    """
+    hash_func = hashlib.new(DUPLICATE_HASH_ALGORITHM)
+    with open(path, "rb") as fin:
+        st = os.fstat(fin.fileno())
+        if size <= 2 * DUPLICATE_SAMPLE_SIZE:
+            hash_func.update(fin.read())
+        else:
+            hash_func.update(fin.read(DUPLICATE_SAMPLE_SIZE))
+            fin.seek(-DUPLICATE_SAMPLE_SIZE, os.SEEK_END)
+            hash_func.update(fin.read(DUPLICATE_SAMPLE_SIZE))
+    return path, (st.st_dev, st.st_ino), hash_func.hexdigest()
+
+
+def _full_hash(path: str) -> Tuple[str, str]:
+    """Hash an entire file in CHUNK_SIZE reads and return (path, hex digest)."""
+    hash_func = hashlib.new(DUPLICATE_HASH_ALGORITHM)
+    with open(path, "rb") as fin:
+        while chunk := fin.read(CHUNK_SIZE):
+            hash_func.update(chunk)
+    return path, hash_func.hexdigest()
+
+
+def _guarded_hash(func: Callable[..., Any], size: int, *args: Any) -> Tuple[int, Any]:
+    """Run a duplicate-stage hash, returning (size, None) for unreadable files."""
+    try:
+        return size, func(*args)
+    except OSError:
+        return size, None
+
+
+def find_duplicates(
+    directory: str,
+    min_size: int = 1,
+    workers: int = DEFAULT_HASH_WORKERS,
+    advance: Optional[Callable[[str, int], None]] = None,
+) -> List[DuplicateSet]:
+    """
+    Find files with identical content in three narrowing stages: group by size,
+    then by a hash of the first and last blocks, then by a full content hash for
+    files that still collide. Hashing runs on a thread pool (hashlib releases the
+    GIL). Paths that are already hard links to the same inode count only once.
+    Args:
+        directory: Directory to scan.
+        min_size: Ignore files smaller than this many bytes.
+        workers: Number of hashing threads.
+        advance: Optional callback receiving (stage, bytes hashed) as work completes,
+            where stage is "partial" or "full".
+    Returns:
+        Duplicate sets sorted by reclaimable bytes, largest first.
+    """
+    by_size: Dict[int, List[str]] = {}
+    for entry in walk_tree(directory):
+        if not entry.is_dir and entry.size >= max(min_size, 1):
+            by_size.setdefault(entry.size, []).append(entry.path)
+    candidates = {size: paths for size, paths in by_size.items() if len(paths) > 1}
+
+    by_partial: Dict[Tuple[int, str], List[str]] = {}
+    partials: List[Tuple[str, Tuple[int, int], int, str]] = []
+    max_pending = max(1, workers) * COPY_QUEUE_FACTOR
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for size, result in run_bounded(
+            pool,
+            _guarded_hash,
+            (
+                (_partial_hash, size, path, size)
+                for size, paths in candidates.items()
+                for path in paths
+            ),
+            max_pending,
+        ):
+            if result is None:
+                continue
+            if advance:
+                advance("partial", min(size, 2 * DUPLICATE_SAMPLE_SIZE))
+            path, inode, digest = result
+            partials.append((path, inode, size, digest))
+        # Results arrive in completion order; keep the first path of each inode
+        # in path order so hard-link handling stays deterministic.
+        seen_inodes: Set[Tuple[int, int]] = set()
+        for path, inode, size, digest in sorted(partials):
+            if inode in seen_inodes:
+                continue
+            seen_inodes.add(inode)
+            by_partial.setdefault((size, digest), []).append(path)
+        del partials
+
+        duplicates: List[DuplicateSet] = []
+        full_candidates: Dict[str, int] = {}
+        for (size, digest), paths in by_partial.items():
+            if len(paths) < 2:
+                continue
+            if size <= 2 * DUPLICATE_SAMPLE_SIZE:
+                duplicates.append(DuplicateSet(size, digest, sorted(paths)))
+            else:
+                full_candidates.update({path: size for path in paths})
+
+        by_full: Dict[Tuple[int, str], List[str]] = {}
+        for size, result in run_bounded(
+            pool,
+            _guarded_hash,
+            ((_full_hash, size, path) for path, size in full_candidates.items()),
+            max_pending,
+        ):
+            if result is None:
+                continue
+            if advance:
+                advance("full", size)
+            path, digest = result
+            by_full.setdefault((size, digest), []).append(path)
+    duplicates.extend(
+        DuplicateSet(size, digest, sorted(paths))
+        for (size, digest), paths in by_full.items()
+        if len(paths) > 1
+    )
+    duplicates.sort(key=lambda d: d.reclaimable, reverse=True)
+    return duplicates
+
+
+def hardlink_duplicates(duplicates: List[DuplicateSet]) -> Tuple[int, List[str]]:
+    """
+    Replace every duplicate with a hard link to the first path of its set.
+    The link is created under a temporary name and renamed over the duplicate,
+    so a failure never leaves a path missing.
+    Returns:
+        The number of files linked and a list of error messages.
+    """
+    linked = 0
+    errors: List[str] = []
+    for dup in duplicates:
+        keep = dup.paths[0]
+        for path in dup.paths[1:]:
+            tmp = f"{path}.ftk-link"
+            try:
+                os.link(keep, tmp)
+                os.replace(tmp, path)
+                linked += 1
+            except OSError as e:
+                errors.append(f"{path}: {e}")
+                if os.path.lexists(tmp):
+                    os.remove(tmp)
+    return linked, errors
+
+
+def delete_duplicates(duplicates: List[DuplicateSet]) -> Tuple[int, List[str]]:
+    """
+    Delete every duplicate, keeping the first path of each set.
+    Returns:
+        The number of files deleted and a list of error messages.
+    """
+    deleted = 0
+    errors: List[str] = []
+    for dup in duplicates:
+        for path in dup.paths[1:]:
+            try:
+                os.remove(path)
+                deleted += 1
+            except OSError as e:
+                errors.append(f"{path}: {e}")
+    return deleted, errors
+
+
+def export_duplicates(duplicates: List[DuplicateSet], dest: str) -> None:
+    """Write duplicate sets to a JSON file."""
+    data = {
+        "generated": dt.now().isoformat(),
+        "algorithm": DUPLICATE_HASH_ALGORITHM,
+        "reclaimable_bytes": sum(d.reclaimable for d in duplicates),
+        "sets": [
+            {
+                "size": d.size,
+                "digest": d.digest,
+                "reclaimable_bytes": d.reclaimable,
+                "paths": d.paths,
+            }
+            for d in duplicates
+        ],
+    }
+    with open(dest, "w") as fout:
+        json.dump(data, fout, indent=2)
+
+
+def duplicate_finder() -> bool:
+    """
+    Interactively find duplicate files and optionally hardlink, delete or export them.
+    Returns:
+        True if the scan succeeds; otherwise False.
+    """
+    directory = get_user_input("Enter directory to scan for duplicates")
+    if not directory or not Path(directory).is_dir():
+        print_error("Invalid directory")
+        return False
+    try:
+        min_size = int(get_user_input("Minimum file size in KB", "1")) * 1024
+    except ValueError:
+        print_warning("Invalid size; using 1 KB")
+        min_size = 1024
+    print_section(f"Finding duplicates in {directory}")
+    start_time = time.time()
+    hashed = {"partial": 0, "full": 0}
+
+    def advance(stage: str, n: int) -> None:
+        hashed[stage] += n
+        progress.update(tasks[stage], advance=n)
+
+    try:
+        with ProgressManager(show_speed=True) as progress:
+            tasks = {
+                "partial": progress.add_task(
+                    "Partial hashing", total=None, color=NordColors.FROST_2
+                ),
+                "full": progress.add_task(
+                    "Full hashing", total=None, color=NordColors.FROST_3
+                ),
+            }
+            duplicates = find_duplicates(directory, min_size, advance=advance)
+            for stage, task in tasks.items():
+                done = hashed[stage] or 1
+                progress.update(task, total=done, completed=done)
+    except Exception as e:
+        print_error(f"Error scanning for duplicates: {e}")
         return False
+    elapsed = time.time() - start_time
+    reclaimable = sum(d.reclaimable for d in duplicates)
+    print_success(
+        f"Found {len(duplicates)} duplicate sets in {format_time(elapsed)}; "
+        f"{format_size(reclaimable)} reclaimable"
+    )
+    if not duplicates:
+        return True
+    table = Table(
+        title="Duplicate Sets",
+        title_style=f"bold {NordColors.FROST_1}",
+        border_style=NordColors.FROST_3,
+    )
+    table.add_column("Copies", style=NordColors.FROST_2, justify="right")
+    table.add_column("Size", style=NordColors.SNOW_STORM_1, justify="right")
+    table.add_column("Reclaimable", style=NordColors.RED, justify="right")
+    table.add_column("Files", style=NordColors.SNOW_STORM_1)
+    for dup in duplicates[:20]:
+        table.add_row(
+            str(len(dup.paths)),
+            format_size(dup.size),
+            format_size(dup.reclaimable),
+            "\n".join(dup.paths),
+        )
+    console.print(table)
+    if len(duplicates) > 20:
+        print_warning(f"Showing top 20 of {len(duplicates)} duplicate sets")
+    options = [
+        ("1", "Replace duplicates with hard links"),
+        ("2", "Delete duplicates (keep first file of each set)"),
+        ("3", "Export duplicate sets as JSON"),
+        ("0", "Done"),
+    ]
+    console.print(create_menu_table("Actions", options))
+    choice = get_user_input("Select action (0-3)", "0")
+    if choice == "1":
+        if get_user_confirmation("Replace all duplicates with hard links?"):
+            count, errors = hardlink_duplicates(duplicates)
+            print_success(f"Linked {count} files")
+            for err in errors[:5]:
+                print_error(err)
+    elif choice == "2":
+        if get_user_confirmation(
+            f"Permanently delete {sum(len(d.paths) - 1 for d in duplicates)} files?"
+        ):
+            count, errors = delete_duplicates(duplicates)
+            print_success(f"Deleted {count} files")
+            for err in errors[:5]:
+                print_error(err)
+    elif choice == "3":
+        dest = get_user_input("Enter JSON output path", "duplicates.json")
+        try:
+            export_duplicates(duplicates, dest)
+            print_success(f"Exported {len(duplicates)} sets to {dest}")
+        except OSError as e:
+            print_error(f"Error exporting duplicates: {e}")
+    return True
+
+
+# ----------------------------------------------------------------
+# Checksum Manifests
+# ----------------------------------------------------------------
+@dataclass
+class ManifestReport:
+    """Outcome of verifying a checksum manifest."""
+
+    ok: int = 0
+    bytes_hashed: int = 0
+    elapsed: float = 0.0
+    missing: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    extra: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def throughput(self) -> float:
+        return self.bytes_hashed / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def format_manifest_line(digest: str, rel_path: str) -> str:
+    """Format one manifest line, escaping names as GNU sha256sum does."""
+    if "\\" in rel_path or "\n" in rel_path:
+        escaped = rel_path.replace("\\", "\\\\").replace("\n", "\\n")
+        return f"\\{digest}  {escaped}\n"
+    return f"{digest}  {rel_path}\n"
+
+
+def parse_manifest_line(line: str) -> Optional[Tuple[str, str]]:
+    """Parse a sha256sum-style line into (digest, path), or None if malformed."""
+    line = line.rstrip("\n")
+    escaped = line.startswith("\\")
+    if escaped:
+        line = line[1:]
+    digest, sep, rel_path = line.partition(" ")
+    if not sep or len(digest) not in DIGEST_LENGTHS or not rel_path:
+        return None
+    if rel_path[0] in " *":  # Text (" ") or binary ("*") mode marker
+        rel_path = rel_path[1:]
+    if escaped:
+        rel_path = re.sub(
+            r"\\(.)", lambda m: "\n" if m.group(1) == "n" else m.group(1), rel_path
+        )
+    return digest.lower(), rel_path
+
+
+def _hash_for_manifest(
+    path: str, algorithm: str, advance: Callable[[int], None]
+) -> Tuple[str, Optional[str], int, Optional[str]]:
+    """Hash one file for a manifest, returning (path, digest, size, error)."""
+    try:
+        size = os.path.getsize(path)
+        return path, hash_file(path, algorithm, advance), size, None
+    except FileNotFoundError:
+        return path, None, 0, None
+    except OSError as e:
+        return path, None, 0, str(e)
+
+
+def generate_manifest(
+    directory: str,
+    manifest_path: str,
+    algorithm: str = "sha256",
+    workers: int = DEFAULT_HASH_WORKERS,
+    advance: Optional[Callable[[int], None]] = None,
+) -> Tuple[int, int, List[str]]:
+    """
+    Hash every file under directory in parallel and stream the results to a
+    sha256sum-compatible manifest, with paths relative to directory. Lines are
+    written as hashes complete, so memory use does not grow with the result set.
+    Returns:
+        The number of files written, bytes hashed and a list of error messages.
+    """
+    manifest_abs = os.path.abspath(manifest_path)
+    advance = advance or (lambda n: None)
+    files = (
+        (entry.path, algorithm, advance)
+        for entry in walk_tree(directory)
+        if not entry.is_dir and os.path.abspath(entry.path) != manifest_abs
+    )
+    count = total = 0
+    errors: List[str] = []
+    with (
+        open(manifest_path, "w", encoding="utf-8", errors="surrogateescape") as fout,
+        ThreadPoolExecutor(max_workers=max(1, workers)) as pool,
+    ):
+        for path, digest, size, error in run_bounded(
+            pool, _hash_for_manifest, files, max(1, workers) * COPY_QUEUE_FACTOR
+        ):
+            if digest is None:
+                errors.append(f"{path}: {error or 'file disappeared'}")
+                continue
+            fout.write(format_manifest_line(digest, os.path.relpath(path, directory)))
+            count += 1
+            total += size
+    return count, total, errors
+
+
+def verify_manifest(
+    manifest_path: str,
+    directory: str,
+    workers: int = DEFAULT_HASH_WORKERS,
+    advance: Optional[Callable[[int], None]] = None,
+) -> ManifestReport:
+    """
+    Re-hash the files listed in a manifest in parallel and compare digests.
+    Files on disk that the manifest does not list are reported as extra, and
+    repeated entries for the same path (e.g. concatenated manifests) as errors.
+    The algorithm is inferred from the digest length.
+    """
+    report = ManifestReport()
+    listed: Set[str] = set()
+    expected: Dict[str, str] = {}
+    advance = advance or (lambda n: None)
+    start_time = time.time()
+
+    def jobs() -> Iterator[Tuple[str, str, Callable[[int], None]]]:
+        with open(manifest_path, encoding="utf-8", errors="surrogateescape") as fin:
+            for line in fin:
+                parsed = parse_manifest_line(line)
+                if parsed is None:
+                    if line.strip():
+                        report.errors.append(f"Malformed line: {line.strip()}")
+                    continue
+                digest, rel_path = parsed
+                path = os.path.normpath(os.path.join(directory, rel_path))
+                if os.path.abspath(path) in listed:
+                    report.errors.append(f"Duplicate entry: {rel_path}")
+                    continue
+                listed.add(os.path.abspath(path))
+                expected[path] = digest
+                yield path, DIGEST_LENGTHS[len(digest)], advance
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for path, digest, size, error in run_bounded(
+            pool, _hash_for_manifest, jobs(), max(1, workers) * COPY_QUEUE_FACTOR
+        ):
+            want = expected.pop(path)
+            if error:
+                report.errors.append(f"{path}: {error}")
+            elif digest is None:
+                report.missing.append(path)
+            elif digest != want:
+                report.changed.append(path)
+                report.bytes_hashed += size
+            else:
+                report.ok += 1
+                report.bytes_hashed += size
+    # Absolute paths, as generate_manifest uses to skip the manifest itself.
+    listed.add(os.path.abspath(manifest_path))
+    for entry in walk_tree(directory):
+        if not entry.is_dir and os.path.abspath(entry.path) not in listed:
+            report.extra.append(os.path.normpath(entry.path))
+    report.elapsed = time.time() - start_time
+    for paths in (report.missing, report.changed, report.extra):
+        paths.sort()
+    return report
+
+
+def checksum_manifest_menu() -> None:
+    """Interactive menu for generating and verifying checksum manifests."""
+    clear_screen()
+    console.print(create_header())
+    print_section("Checksum Manifests")
+    options = [
+        ("1", "Generate manifest for a directory"),
+        ("2", "Verify directory against a manifest"),
+        ("0", "Back to Main Menu"),
+    ]
+    console.print(create_menu_table("Manifest Operations", options))
+    choice = get_user_input("Select operation (0-2)", "0")
+    if choice not in ("1", "2"):
+        return
+    directory = get_user_input("Enter directory")
+    if not directory or not Path(directory).is_dir():
+        print_error("Invalid directory")
+        return
+    if choice == "1":
+        algorithm = get_user_input(
+            f"Algorithm ({', '.join(CHECKSUM_ALGORITHMS)})", "sha256"
+        ).lower()
+        if algorithm not in CHECKSUM_ALGORITHMS:
+            print_warning("Unknown algorithm; using sha256")
+            algorithm = "sha256"
+        manifest = get_user_input(
+            "Manifest output path", str(Path(directory) / f"{algorithm.upper()}SUMS")
+        )
+    else:
+        manifest = get_user_input("Manifest path", str(Path(directory) / "SHA256SUMS"))
+        if not Path(manifest).is_file():
+            print_error(f"Manifest not found: {manifest}")
+            return
+    print_section(f"{'Generating' if choice == '1' else 'Verifying'} manifest")
+    start_time = time.time()
+    hashed = 0
+
+    def advance(n: int) -> None:
+        nonlocal hashed
+        hashed += n
+        progress.update(task, advance=n)
+
+    try:
+        with ProgressManager(show_speed=True) as progress:
+            task = progress.add_task(
+                "Hashing files", total=None, color=NordColors.FROST_2
+            )
+            if choice == "1":
+                count, total, errors = generate_manifest(
+                    directory, manifest, algorithm, advance=advance
+                )
+            else:
+                report = verify_manifest(manifest, directory, advance=advance)
+            progress.update(task, total=hashed or 1, completed=hashed or 1)
+    except Exception as e:
+        print_error(f"Manifest operation failed: {e}")
+        return
+    elapsed = time.time() - start_time
+    if choice == "1":
+        rate = total / elapsed if elapsed > 0 else 0
+        print_success(
+            f"Wrote {count} entries ({format_size(total)}) to {manifest} in "
+            f"{format_time(elapsed)} ({format_size(rate)}/s)"
+        )
+        for err in errors[:10]:
+            print_error(err)
+        return
+    summary = Table(
+        title="Verification Summary",
+        title_style=f"bold {NordColors.FROST_1}",
+        border_style=NordColors.FROST_3,
+    )
+    summary.add_column("Result", style=NordColors.FROST_2)
+    summary.add_column("Count", style=NordColors.SNOW_STORM_1, justify="right")
+    summary.add_row("OK", str(report.ok))
+    summary.add_row("Changed", str(len(report.changed)))
+    summary.add_row("Missing", str(len(report.missing)))
+    summary.add_row("Extra (not in manifest)", str(len(report.extra)))
+    summary.add_row("Errors", str(len(report.errors)))
+    summary.add_row("Throughput", f"{format_size(report.throughput)}/s")
+    console.print(summary)
+    for label, paths in (
+        ("Changed", report.changed),
+        ("Missing", report.missing),
+        ("Extra", report.extra),
+        ("Error", report.errors),
+    ):
+        for path in paths[:10]:
+            print_warning(f"{label}: {path}")
+        if len(paths) > 10:
+            print_warning(f"...and {len(paths) - 10} more {label.lower()} entries")
+    if report.changed or report.missing or report.errors:
+        print_error("Verification FAILED")
+    else:
+        print_success("Verification passed")
+
+
+# ----------------------------------------------------------------
+# Batch Operation Functions
+# ----------------------------------------------------------------
+@dataclass
+class BatchJob:
+    """A single unit of work in a batch pipeline."""
+
+    kind: str  # "copy", "special", "rename" or "delete"
+    item: int  # Index of the source this job belongs to
+    src: str
+    dest: Optional[str] = None
+    size: int = 0
+
+
+@dataclass
+class BatchPlan:
+    """All work for a batch, planned before anything runs."""
+
+    action: str
+    sources: List[str]
+    directories: List[Path] = field(default_factory=list)
+    jobs: List[BatchJob] = field(default_factory=list)
+    # Sources that must be removed once all their copy jobs succeed (cross-device moves)
+    remove_after_copy: Set[int] = field(default_factory=set)
+    # Sources that could not be planned, with the reason
+    failures: List[Tuple[int, str]] = field(default_factory=list)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(job.size for job in self.jobs)
+
+
+def plan_batch(action: str, sources: List[str], dest: Optional[str]) -> BatchPlan:
+    """
+    Expand a batch of copy, move or delete requests into file-level jobs.
+    Directory copies become one job per file, same-device moves a single rename,
+    and cross-device moves a copy followed by removal of the source. Moves walk
+    without following symlinks, so links, FIFOs and device nodes are recreated
+    rather than lost when the source is removed. Sources that cannot be read
+    are recorded in plan.failures instead of aborting the batch.
+    """
+    plan = BatchPlan(action, sources)
+    for item, src in enumerate(sources):
+        planned_jobs, planned_dirs = len(plan.jobs), len(plan.directories)
+        try:
+            _plan_batch_item(plan, action, item, src, dest)
+        except OSError as e:
+            del plan.jobs[planned_jobs:], plan.directories[planned_dirs:]
+            plan.remove_after_copy.discard(item)
+            plan.failures.append((item, str(e)))
+    return plan
+
+
+def _plan_batch_item(
+    plan: BatchPlan, action: str, item: int, src: str, dest: Optional[str]
+) -> None:
+    if action == "delete":
+        if Path(src).is_dir() and not Path(src).is_symlink():
+            size = sum(e.size for e in walk_tree(src) if not e.is_dir)
+        else:
+            size = os.lstat(src).st_size
+        plan.jobs.append(BatchJob("delete", item, src, size=size))
+        return
+    target = str(Path(dest) / Path(src).name)
+    if action == "move" and os.lstat(src).st_dev == os.stat(dest).st_dev:
+        size = os.lstat(src).st_size if not Path(src).is_dir() else 0
+        plan.jobs.append(BatchJob("rename", item, src, target, size))
+        return
+    follow = action != "move"
+    if action == "move":
+        plan.remove_after_copy.add(item)
+    if Path(src).is_dir() and (follow or not Path(src).is_symlink()):
+        plan.directories.append(Path(target))
+        for entry in walk_tree(src, follow_symlinks=follow):
+            entry_target = os.path.join(target, os.path.relpath(entry.path, src))
+            if entry.is_dir:
+                plan.directories.append(Path(entry_target))
+            else:
+                kind = "copy" if follow or _is_regular(entry.path) else "special"
+                plan.jobs.append(
+                    BatchJob(kind, item, entry.path, entry_target, entry.size)
+                )
+    elif follow or _is_regular(src):
+        plan.jobs.append(BatchJob("copy", item, src, target, os.stat(src).st_size))
+    else:
+        plan.jobs.append(BatchJob("special", item, src, target))
+
+
+def _is_regular(path: str) -> bool:
+    return stat.S_ISREG(os.lstat(path).st_mode)
+
+
+def _recreate_special(src: str, dest: str) -> None:
+    """Recreate a symlink, FIFO or device node at dest with the source's metadata."""
+    st = os.lstat(src)
+    if stat.S_ISLNK(st.st_mode):
+        os.symlink(os.readlink(src), dest)
+    elif stat.S_ISFIFO(st.st_mode):
+        os.mkfifo(dest, stat.S_IMODE(st.st_mode))
+    elif stat.S_ISCHR(st.st_mode) or stat.S_ISBLK(st.st_mode):
+        os.mknod(dest, st.st_mode, st.st_rdev)
+    else:
+        raise OSError(f"Cannot recreate special file: {src}")
+    shutil.copystat(src, dest, follow_symlinks=False)
 
 
-def calculate_checksum() -> bool:
-    """
-    Calculate and display the checksum of a file using a chosen algorithm.
-    Returns:
-        True if checksum calculation succeeds; otherwise False.
-    """
-    path = get_user_input("Enter file path for checksum calculation")
-    if not path or not Path(path).exists() or Path(path).is_dir():
-        print_error("Invalid file path")
-        return False
-    algo_options = [
-        (str(i + 1), algo.upper()) for i, algo in enumerate(CHECKSUM_ALGORITHMS)
-    ]
-    console.print(create_menu_table("Select Checksum Algorithm", algo_options))
-    choice = get_user_input("Select algorithm (1-4)", "1")
-    try:
-        algorithm = CHECKSUM_ALGORITHMS[int(choice) - 1]
-    except (ValueError, IndexError):
-        print_error("Invalid selection. Defaulting to MD5.")
-        algorithm = "md5"
-    print_section(f"Calculating {algorithm.upper()} checksum for {Path(path).name}")
+def _run_batch_job(
+    job: BatchJob, advance: Callable[[int], None]
+) -> Tuple[BatchJob, Optional[str]]:
+    """Run one batch job, returning it with an error message on failure."""
     try:
-        file_size = Path(path).stat().st_size
-        hash_func = hashlib.new(algorithm)
-        start_time = time.time()
-        with ProgressManager() as progress:
-            task = progress.add_task(
-                "Reading file", total=file_size, color=NordColors.FROST_2
-            )
-            with open(path, "rb") as fin:
-                while chunk := fin.read(CHUNK_SIZE):
-                    hash_func.update(chunk)
-                    progress.update(task, advance=len(chunk))
-        checksum = hash_func.hexdigest()
-        elapsed = time.time() - start_time
-        panel = Panel(
-            Text.from_markup(f"[bold {NordColors.FROST_2}]{checksum}[/]"),
-            title=f"[bold {NordColors.FROST_1}]{algorithm.upper()} Checksum[/]",
-            border_style=NordColors.GREEN,
-            padding=(1, 2),
-        )
-        console.print(panel)
-        console.print(f"Time taken: {format_time(elapsed)}")
-        return True
+        if job.kind == "copy":
+            _copy_file_contents(Path(job.src), Path(job.dest), advance)
+        elif job.kind == "special":
+            _recreate_special(job.src, job.dest)
+        elif job.kind == "rename":
+            os.rename(job.src, job.dest)
+            advance(job.size)
+        elif job.kind == "delete":
+            if Path(job.src).is_dir() and not Path(job.src).is_symlink():
+                shutil.rmtree(job.src)
+            else:
+                os.remove(job.src)
+            advance(job.size)
+        return job, None
     except Exception as e:
-        print_error(f"Error calculating checksum: {e}")
-        return False
+        return job, str(e)
 
 
-def disk_usage() -> bool:
+def run_batch(
+    plan: BatchPlan,
+    workers: int = DEFAULT_COPY_WORKERS,
+    stop_on_error: bool = False,
+    advance: Optional[Callable[[int], None]] = None,
+    on_job_done: Optional[Callable[[BatchJob, Optional[str]], None]] = None,
+) -> Dict[str, Any]:
     """
-    Analyze disk usage for a given directory and display a summary.
+    Execute a batch plan on a bounded worker pool.
+    Destination directories are created first; cross-device move sources are
+    removed only after every one of their copy jobs succeeded.
     Returns:
-        True if analysis succeeds; otherwise False.
+        A summary with job counts, bytes processed, elapsed time and failures.
     """
-    directory = get_user_input("Enter directory to analyze")
-    if not directory or not Path(directory).exists():
-        print_error("Invalid directory")
-        return False
-    threshold_mb = get_user_input("Size threshold in MB (highlight if exceeded)", "100")
-    try:
-        threshold = int(threshold_mb) * 1024 * 1024
-    except ValueError:
-        print_warning("Invalid threshold; using default (100 MB)")
-        threshold = LARGE_FILE_THRESHOLD
-    print_section(f"Analyzing disk usage in {directory}")
-    total_size = 0
-    file_count = 0
-    large_files = []
-    category_sizes: Dict[str, int] = {}
-    with Spinner("Analyzing directory"):
-        for root, _, files in os.walk(directory):
-            for file in files:
-                try:
-                    fp = Path(root) / file
-                    size = fp.stat().st_size
-                    total_size += size
-                    file_count += 1
-                    ext = fp.suffix.lower()
-                    if ext in DOCUMENT_EXTENSIONS:
-                        cat = "Document"
-                    elif ext in IMAGE_EXTENSIONS:
-                        cat = "Image"
-                    elif ext in VIDEO_EXTENSIONS:
-                        cat = "Video"
-                    elif ext in AUDIO_EXTENSIONS:
-                        cat = "Audio"
-                    elif ext in ARCHIVE_EXTENSIONS:
-                        cat = "Archive"
-                    elif ext in CODE_EXTENSIONS:
-                        cat = "Code"
-                    else:
-                        cat = "Other"
-                    category_sizes[cat] = category_sizes.get(cat, 0) + size
-                    if size > threshold:
-                        large_files.append((str(fp), size))
-                except Exception:
-                    continue
-    summary = Table(
-        title="Disk Usage Summary",
+    advance = advance or (lambda n: None)
+    failures = [(plan.sources[item], error) for item, error in plan.failures]
+    failed_items = {item for item, _ in plan.failures}
+    completed = 0
+    done_bytes = 0
+    stopped = False
+    start_time = time.time()
+    for directory in plan.directories:
+        directory.mkdir(parents=True, exist_ok=True)
+    workers = max(1, min(workers, MAX_COPY_WORKERS))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch") as pool:
+        for job, error in run_bounded(
+            pool,
+            _run_batch_job,
+            ((job, advance) for job in plan.jobs),
+            workers * COPY_QUEUE_FACTOR,
+        ):
+            if on_job_done:
+                on_job_done(job, error)
+            if error:
+                failures.append((job.src, error))
+                failed_items.add(job.item)
+                if stop_on_error:
+                    stopped = True
+                    break
+            else:
+                completed += 1
+                done_bytes += job.size
+    if not stopped:
+        for item in sorted(plan.remove_after_copy - failed_items):
+            src = plan.sources[item]
+            try:
+                if Path(src).is_dir() and not Path(src).is_symlink():
+                    shutil.rmtree(src)
+                else:
+                    os.remove(src)
+            except OSError as e:
+                failures.append((src, f"copied but not removed: {e}"))
+                failed_items.add(item)
+    elapsed = time.time() - start_time
+    return {
+        "jobs": len(plan.jobs),
+        "completed": completed,
+        "failed": len(failures),
+        "stopped": stopped,
+        "bytes": done_bytes,
+        "elapsed": elapsed,
+        "throughput": done_bytes / elapsed if elapsed > 0 else 0.0,
+        "failed_items": sorted(failed_items),
+        "failures": failures,
+    }
+
+
+def print_batch_summary(plan: BatchPlan, summary: Dict[str, Any]) -> None:
+    """Display the outcome of a batch run."""
+    table = Table(
+        title="Batch Summary",
         title_style=f"bold {NordColors.FROST_1}",
         border_style=NordColors.FROST_3,
     )
-    summary.add_column("Metric", style=NordColors.FROST_2)
-    summary.add_column("Value", style=NordColors.SNOW_STORM_1)
-    summary.add_row("Total files", str(file_count))
-    summary.add_row("Total size", format_size(total_size))
-    summary.add_row(f"Files > {format_size(threshold)}", str(len(large_files)))
-    console.print(summary)
-    if category_sizes:
-        cat_table = Table(
-            title="Size by File Type",
-            title_style=f"bold {NordColors.FROST_1}",
-            border_style=NordColors.FROST_3,
-        )
-        cat_table.add_column("Category", style=NordColors.FROST_2)
-        cat_table.add_column("Size", style=NordColors.SNOW_STORM_1, justify="right")
-        cat_table.add_column("Percentage", style=NordColors.FROST_1, justify="right")
-        for cat, size in sorted(
-            category_sizes.items(), key=lambda x: x[1], reverse=True
-        ):
-            perc = (size / total_size * 100) if total_size > 0 else 0
-            cat_table.add_row(cat, format_size(size), f"{perc:.1f}%")
-        console.print(cat_table)
-    if large_files:
-        large_files.sort(key=lambda x: x[1], reverse=True)
-        lf_table = Table(
-            title=f"Large Files (>{format_size(threshold)})",
-            title_style=f"bold {NordColors.FROST_1}",
-            border_style=NordColors.FROST_3,
-        )
-        lf_table.add_column("File", style=NordColors.SNOW_STORM_1)
-        lf_table.add_column("Size", style=NordColors.RED, justify="right")
-        for file_path, size in large_files[:10]:
-            lf_table.add_row(file_path, format_size(size))
-        console.print(lf_table)
-        if len(large_files) > 10:
-            print_warning(f"Showing top 10 of {len(large_files)} large files")
-    return True
+    table.add_column("Metric", style=NordColors.FROST_2)
+    table.add_column("Value", style=NordColors.SNOW_STORM_1, justify="right")
+    table.add_row("Sources", str(len(plan.sources)))
+    table.add_row("Jobs completed", f"{summary['completed']} / {summary['jobs']}")
+    table.add_row("Failures", str(summary["failed"]))
+    table.add_row("Data processed", format_size(summary["bytes"]))
+    table.add_row("Elapsed", format_time(summary["elapsed"]))
+    table.add_row("Throughput", f"{format_size(summary['throughput'])}/s")
+    console.print(table)
+    for src, error in summary["failures"][:10]:
+        print_error(f"{src}: {error}")
+    if summary["failed"] > 10:
+        print_warning(f"...and {summary['failed'] - 10} more failures")
+    if summary["stopped"]:
+        print_warning("Batch stopped at the first error; remaining jobs were skipped.")
 
 
-# ----------------------------------------------------------------
-# Batch Operation Functions
-# ----------------------------------------------------------------
 def batch_operation_menu() -> None:
-    """Handle batch file operations (copy, move, delete)."""
+    """Handle batch file operations (copy, move, delete) as a single pipeline."""
     clear_screen()
     console.print(create_header())
     print_section("Batch Operations")
@@ -802,8 +3926,9 @@ def batch_operation_menu() -> None:
     ]
     console.print(create_menu_table("Operations", options))
     choice = get_user_input("Select operation type (0-3)", "0")
-    if choice == "0":
+    if choice not in ("1", "2", "3"):
         return
+    action = {"1": "copy", "2": "move", "3": "delete"}[choice]
     sources: List[str] = []
     print_section("Enter Source Paths (empty line to finish)")
     while True:
@@ -817,7 +3942,8 @@ def batch_operation_menu() -> None:
     if not sources:
         print_error("No valid source paths provided.")
         return
-    if choice in ("1", "2"):
+    dest = None
+    if action in ("copy", "move"):
         dest = get_user_input("Enter destination directory")
         if not dest:
             print_error("Destination cannot be empty.")
@@ -827,20 +3953,595 @@ def batch_operation_menu() -> None:
                 Path(dest).mkdir(parents=True, exist_ok=True)
             else:
                 return
-        for src in sources:
-            target = str(Path(dest) / Path(src).name)
-            if choice == "1":
-                if not copy_item(src, target):
-                    print_warning(f"Failed to copy {src}")
-            else:
-                if not move_item(src, target):
-                    print_warning(f"Failed to move {src}")
-    elif choice == "3":
-        force = get_user_confirmation("Skip confirmation for each file?")
-        for src in sources:
-            if not delete_item(src, force):
-                print_warning(f"Failed to delete {src}")
-    print_success("Batch operation completed.")
+    try:
+        workers = int(
+            get_user_input("Number of parallel workers", str(DEFAULT_COPY_WORKERS))
+        )
+    except ValueError:
+        workers = DEFAULT_COPY_WORKERS
+        print_warning(f"Invalid worker count; using default ({workers})")
+    stop_on_error = get_user_confirmation("Stop the batch at the first error?")
+    with Spinner("Planning batch"):
+        plan = plan_batch(action, sources, dest)
+    print_message(
+        f"Planned {len(plan.jobs)} jobs for {len(sources)} sources "
+        f"({format_size(plan.total_bytes)})",
+        NordColors.FROST_3,
+    )
+    if action == "delete" and not get_user_confirmation(
+        f"Permanently delete {len(sources)} items ({format_size(plan.total_bytes)})?"
+    ):
+        print_message("Deletion cancelled", NordColors.FROST_2, "➜")
+        return
+    print_section(f"Batch {action}")
+    done_jobs = 0
+
+    def on_job_done(job: BatchJob, error: Optional[str]) -> None:
+        nonlocal done_jobs
+        done_jobs += 1
+        progress.update(
+            task, description=f"Batch {action}: {done_jobs}/{len(plan.jobs)} jobs"
+        )
+
+    with ProgressManager(show_speed=True) as progress:
+        task = progress.add_task(
+            f"Batch {action}: 0/{len(plan.jobs)} jobs",
+            total=plan.total_bytes or 1,
+            color=NordColors.FROST_2,
+        )
+        summary = run_batch(
+            plan,
+            workers,
+            stop_on_error,
+            lambda n: progress.update(task, advance=n),
+            on_job_done,
+        )
+    print_batch_summary(plan, summary)
+    if summary["failed"]:
+        print_warning("Batch operation completed with errors.")
+    else:
+        print_success("Batch operation completed.")
+
+
+# ----------------------------------------------------------------
+# Directory Compare & Sync
+# ----------------------------------------------------------------
+@dataclass
+class SyncReport:
+    """Differences between a source and destination tree, plus the plan to sync them."""
+
+    plan: BatchPlan
+    new: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    extra: List[str] = field(default_factory=list)
+    conflicts: List[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def change_count(self) -> int:
+        return len(self.plan.jobs)
+
+
+def _same_content(src_file: str, dst_file: str) -> bool:
+    """Return True if two files hash identically."""
+    try:
+        return hash_file(src_file, SYNC_HASH_ALGORITHM) == hash_file(
+            dst_file, SYNC_HASH_ALGORITHM
+        )
+    except OSError:
+        return False
+
+
+def _inside_any(rel: str, directories: Set[str]) -> bool:
+    """True if any parent of the relative path rel is in directories."""
+    return any(str(parent) in directories for parent in Path(rel).parents)
+
+
+def plan_sync(
+    src: str,
+    dest: str,
+    use_hash: bool = False,
+    delete_extra: bool = False,
+    workers: int = DEFAULT_HASH_WORKERS,
+) -> SyncReport:
+    """
+    Compare two trees and plan the copies (and optional deletions) that make
+    dest match src. Files differ when their size or whole-second mtime differs;
+    with use_hash, same-size files are compared by content hash instead of mtime.
+    Entries that are a file on one side and a directory on the other are
+    reported as conflicts and left alone, together with everything below them.
+    """
+    src_entries = {os.path.relpath(e.path, src): e for e in walk_tree(src)}
+    dest_entries = (
+        {os.path.relpath(e.path, dest): e for e in walk_tree(dest)}
+        if os.path.isdir(dest)
+        else {}
+    )
+    report = SyncReport(BatchPlan("sync", [src], directories=[Path(dest)]))
+    to_hash: List[str] = []
+    conflicts: Set[str] = set()
+    for rel, entry in sorted(src_entries.items()):
+        other = dest_entries.get(rel)
+        if _inside_any(rel, conflicts):
+            continue
+        if other is not None and other.is_dir != entry.is_dir:
+            report.conflicts.append(rel)
+            conflicts.add(rel)
+        elif entry.is_dir:
+            if other is None:
+                report.plan.directories.append(Path(dest) / rel)
+        elif other is None:
+            report.new.append(rel)
+        elif other.size != entry.size:
+            report.changed.append(rel)
+        elif use_hash:
+            to_hash.append(rel)
+        elif int(other.mtime) != int(entry.mtime):
+            report.changed.append(rel)
+        else:
+            report.unchanged += 1
+    if to_hash:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for rel, same in run_bounded(
+                pool,
+                lambda rel: (
+                    rel,
+                    _same_content(os.path.join(src, rel), os.path.join(dest, rel)),
+                ),
+                ((rel,) for rel in to_hash),
+                max(1, workers) * COPY_QUEUE_FACTOR,
+            ):
+                if same:
+                    report.unchanged += 1
+                else:
+                    report.changed.append(rel)
+        report.changed.sort()
+    for rel in report.new + report.changed:
+        report.plan.jobs.append(
+            BatchJob(
+                "copy",
+                0,
+                os.path.join(src, rel),
+                os.path.join(dest, rel),
+                src_entries[rel].size,
+            )
+        )
+    extra_dirs: Set[str] = set()
+    for rel, entry in sorted(dest_entries.items()):
+        if rel in src_entries or _inside_any(rel, conflicts):
+            continue
+        # Entries inside an extra directory go with it.
+        if _inside_any(rel, extra_dirs):
+            continue
+        report.extra.append(rel)
+        if entry.is_dir:
+            extra_dirs.add(rel)
+    if delete_extra:
+        for rel in report.extra:
+            entry = dest_entries[rel]
+            report.plan.jobs.append(
+                BatchJob("delete", 0, os.path.join(dest, rel), size=entry.size)
+            )
+    return report
+
+
+def print_sync_report(report: SyncReport, delete_extra: bool) -> None:
+    """Display the dry-run summary of a sync plan."""
+    table = Table(
+        title="Sync Plan (dry run)",
+        title_style=f"bold {NordColors.FROST_1}",
+        border_style=NordColors.FROST_3,
+    )
+    table.add_column("Change", style=NordColors.FROST_2)
+    table.add_column("Count", style=NordColors.SNOW_STORM_1, justify="right")
+    table.add_row("New files to copy", str(len(report.new)))
+    table.add_row("Changed files to copy", str(len(report.changed)))
+    table.add_row(
+        "Extra entries to delete" if delete_extra else "Extra entries (kept)",
+        str(len(report.extra)),
+    )
+    table.add_row("Conflicts (skipped)", str(len(report.conflicts)))
+    table.add_row("Unchanged files", str(report.unchanged))
+    copy_bytes = sum(j.size for j in report.plan.jobs if j.kind == "copy")
+    table.add_row("Data to copy", format_size(copy_bytes))
+    console.print(table)
+    for label, items in (
+        ("+", report.new),
+        ("~", report.changed),
+        ("-" if delete_extra else "?", report.extra),
+        ("!", report.conflicts),
+    ):
+        for rel in items[:10]:
+            console.print(f"  [{NordColors.FROST_3}]{label}[/] {escape(rel)}")
+        if len(items) > 10:
+            console.print(f"  [dim]...and {len(items) - 10} more[/]")
+
+
+def sync_menu() -> None:
+    """Interactive directory compare and one-way delta sync."""
+    clear_screen()
+    console.print(create_header())
+    print_section("Compare & Sync Directories")
+    src = get_user_input("Enter source directory")
+    if not src or not Path(src).is_dir():
+        print_error("Invalid source directory.")
+        return
+    dest = get_user_input("Enter destination directory")
+    if not dest:
+        print_error("Destination cannot be empty.")
+        return
+    if Path(dest).exists() and not Path(dest).is_dir():
+        print_error("Destination exists and is not a directory.")
+        return
+    use_hash = get_user_confirmation("Compare same-size files by content hash?")
+    delete_extra = get_user_confirmation(
+        "Delete destination files that no longer exist in the source?"
+    )
+    try:
+        workers = int(
+            get_user_input("Number of parallel workers", str(DEFAULT_COPY_WORKERS))
+        )
+    except ValueError:
+        workers = DEFAULT_COPY_WORKERS
+    with Spinner("Comparing directories"):
+        report = plan_sync(src, dest, use_hash, delete_extra, workers)
+    print_sync_report(report, delete_extra)
+    # directories always starts with dest itself, which may still be missing.
+    if (
+        not report.plan.jobs
+        and len(report.plan.directories) <= 1
+        and os.path.isdir(dest)
+    ):
+        print_success("Destination is already in sync.")
+        return
+    if not get_user_confirmation(f"Apply {report.change_count} changes to {dest}?"):
+        print_message("Sync cancelled", NordColors.FROST_2, "➜")
+        return
+    print_section("Syncing")
+    with ProgressManager(show_speed=True) as progress:
+        task = progress.add_task(
+            f"Syncing {report.change_count} changes",
+            total=report.plan.total_bytes or 1,
+            color=NordColors.FROST_2,
+        )
+        summary = run_batch(
+            report.plan, workers, advance=lambda n: progress.update(task, advance=n)
+        )
+    print_batch_summary(report.plan, summary)
+    if summary["failed"]:
+        print_warning("Sync completed with errors.")
+    else:
+        print_success("Sync completed.")
+
+
+# ----------------------------------------------------------------
+# Benchmark Suite
+# ----------------------------------------------------------------
+def _bench_blocks(rng: random.Random) -> Tuple[bytes, bytes]:
+    """Return one incompressible and one compressible CHUNK_SIZE block."""
+    words = [bytes(rng.choice(b"abcdefghij") for _ in range(6)) for _ in range(512)]
+    text = b" ".join(rng.choice(words) for _ in range(CHUNK_SIZE // 6))
+    return rng.randbytes(CHUNK_SIZE), text[:CHUNK_SIZE]
+
+
+def _write_bench_file(
+    path: Path, size: int, blocks: Tuple[bytes, bytes], offset: int, sparse: bool
+) -> None:
+    """Write size bytes alternating random and text blocks, or sparse extents."""
+    with open(path, "wb") as f:
+        if sparse:
+            f.truncate(size)
+            for position in range(0, size, BENCH_SPARSE_STRIDE):
+                f.seek(position)
+                f.write(blocks[0][: min(CHUNK_SIZE, size - position)])
+            return
+        written = 0
+        index = offset
+        while written < size:
+            block = blocks[index % 2]
+            start = offset % len(block)
+            chunk = (block[start:] + block[:start])[: size - written]
+            f.write(chunk)
+            written += len(chunk)
+            index += 1
+
+
+def generate_bench_tree(
+    root: str, profile: str, scale: float = 1.0, seed: int = BENCH_SEED
+) -> Dict[str, int]:
+    """
+    Create a reproducible synthetic tree for a benchmark profile.
+    Args:
+        root: Directory to create the tree in (created if missing).
+        profile: A BENCH_PROFILES key.
+        scale: Multiplies the profile's file count or file size.
+        seed: Random seed; the same seed always yields the same tree.
+    Returns:
+        The number of files and their total (logical) size in bytes.
+    """
+    spec = BENCH_PROFILES[profile]
+    rng = random.Random(f"{seed}-{profile}")
+    blocks = _bench_blocks(rng)
+    files = spec["files"]
+    min_size, max_size = spec["min_size"], spec["max_size"]
+    if spec["scale"] == "files":
+        files = max(1, round(files * scale))
+    else:
+        min_size, max_size = int(min_size * scale), int(max_size * scale)
+    total = 0
+    for i in range(files):
+        if min_size == max_size:
+            size = max_size
+        else:
+            low, high = math.log(min_size + 1), math.log(max_size + 1)
+            size = int(math.exp(rng.uniform(low, high))) - 1
+        directory = Path(root) / f"d{i // BENCH_FILES_PER_DIR:04d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        _write_bench_file(
+            directory / f"f{i:06d}.bin", size, blocks, i, spec.get("sparse", False)
+        )
+        total += size
+    return {"files": files, "bytes": total}
+
+
+def _reset_peak_rss() -> None:
+    """Reset the kernel's peak RSS counter (VmHWM) where supported."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _peak_rss() -> int:
+    """Return peak resident memory in bytes since the last reset."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _drop_page_cache() -> bool:
+    """Flush and drop the page cache so reads come from disk (root only)."""
+    try:
+        os.sync()
+        with open("/proc/sys/vm/drop_caches", "w") as f:
+            f.write("3")
+        return True
+    except OSError:
+        return False
+
+
+def _bench_walk(src: str, workers: int) -> None:
+    for _ in walk_tree(src, workers):
+        pass
+
+
+def _bench_hash(src: str) -> None:
+    for entry in walk_tree(src):
+        if not entry.is_dir:
+            hash_file(entry.path, "sha256")
+
+
+def _bench_archive(src: str, dest: str) -> None:
+    with StreamingWalk(src, follow_symlinks=False, sort=True) as walker:
+        create_archive(src, dest, walker, "gzip")
+
+
+def run_benchmark_suite(
+    profiles: List[str],
+    workdir: str,
+    scale: float = 1.0,
+    repeats: int = 1,
+    drop_caches: bool = False,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Generate each profile's tree under workdir and time the toolkit's copy,
+    hash, compress, extract and walk operations on it.
+    Each operation runs repeats times and the fastest run is kept. Console
+    output is silenced while an operation is timed. An operation that reports
+    failure (copy_item returning False, or extraction writing fewer files than
+    the tree holds) is recorded as failed rather than timed.
+    Returns:
+        A dict with run metadata and one result record per (profile, operation).
+    """
+    report: Dict[str, Any] = {
+        "meta": {
+            "version": VERSION,
+            "timestamp": dt.now().isoformat(timespec="seconds"),
+            "hostname": HOSTNAME,
+            "python": sys.version.split()[0],
+            "cpu_count": os.cpu_count(),
+            "scale": scale,
+            "repeats": repeats,
+            "seed": BENCH_SEED,
+            "page_cache": "cold" if drop_caches else "warm",
+            "settings": {
+                "CHUNK_SIZE": CHUNK_SIZE,
+                "COMPRESSION_BLOCK_SIZE": COMPRESSION_BLOCK_SIZE,
+                "DEFAULT_COPY_WORKERS": DEFAULT_COPY_WORKERS,
+                "DEFAULT_WALK_WORKERS": DEFAULT_WALK_WORKERS,
+                "DEFAULT_COMPRESSION_THREADS": DEFAULT_COMPRESSION_THREADS,
+            },
+        },
+        "results": [],
+    }
+    for profile in profiles:
+        src = os.path.join(workdir, profile, "src")
+        copy_dest = os.path.join(workdir, profile, "copy")
+        archive = os.path.join(workdir, profile, "tree.tar.gz")
+        extract_dest = os.path.join(workdir, profile, "extract")
+        tree = generate_bench_tree(src, profile, scale)
+        operations: List[Tuple[str, Callable[[], Any], Optional[str]]] = [
+            ("walk_tree (serial)", lambda: _bench_walk(src, 1), None),
+            (
+                f"walk_tree ({DEFAULT_WALK_WORKERS} workers)",
+                lambda: _bench_walk(src, DEFAULT_WALK_WORKERS),
+                None,
+            ),
+            ("copy_item", lambda: copy_item(src, copy_dest), copy_dest),
+            ("hash_file (sha256)", lambda: _bench_hash(src), None),
+            ("create_archive (gzip)", lambda: _bench_archive(src, archive), None),
+            (
+                "extract_archive",
+                lambda: extract_archive(archive, extract_dest)["files"]
+                == tree["files"],
+                extract_dest,
+            ),
+        ]
+        if BENCH_PROFILES[profile].get("sparse"):
+            operations.insert(
+                3,
+                (
+                    "copy_item (sparse)",
+                    lambda: copy_item(src, copy_dest, sparse=True),
+                    copy_dest,
+                ),
+            )
+        for name, func, output in operations:
+            best: Optional[Dict[str, Any]] = None
+            for _ in range(max(1, repeats)):
+                if output and os.path.exists(output):
+                    shutil.rmtree(output)
+                if drop_caches:
+                    _drop_page_cache()
+                _reset_peak_rss()
+                console.quiet = True
+                try:
+                    start_time = time.perf_counter()
+                    ok = func()
+                    elapsed = max(time.perf_counter() - start_time, 1e-9)
+                finally:
+                    console.quiet = False
+                if ok is False:
+                    best = {"profile": profile, "operation": name, "failed": True}
+                    break
+                if best is None or elapsed < best["seconds"]:
+                    best = {
+                        "profile": profile,
+                        "operation": name,
+                        "seconds": elapsed,
+                        "bytes": tree["bytes"],
+                        "files": tree["files"],
+                        "mb_per_s": tree["bytes"] / elapsed / (1024 * 1024),
+                        "files_per_s": tree["files"] / elapsed,
+                        "peak_rss": _peak_rss(),
+                    }
+            report["results"].append(best)
+            if on_result:
+                on_result(best)
+        shutil.rmtree(os.path.join(workdir, profile), ignore_errors=True)
+    return report
+
+
+def save_benchmark_results(report: Dict[str, Any]) -> Path:
+    """Write a benchmark report to BENCH_RESULTS_DIR and return its path."""
+    BENCH_RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    stamp = report["meta"]["timestamp"].replace(":", "")
+    path = BENCH_RESULTS_DIR / f"bench-{stamp}.json"
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    return path
+
+
+def load_latest_benchmark() -> Optional[Dict[str, Any]]:
+    """Return the most recent saved benchmark report, if any."""
+    if not BENCH_RESULTS_DIR.is_dir():
+        return None
+    for path in sorted(BENCH_RESULTS_DIR.glob("bench-*.json"), reverse=True):
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            continue
+    return None
+
+
+def print_benchmark_report(
+    report: Dict[str, Any], previous: Optional[Dict[str, Any]] = None
+) -> None:
+    """Display benchmark results, with the change in MB/s against a previous run."""
+    baseline = {
+        (r["profile"], r["operation"]): r["mb_per_s"]
+        for r in (previous or {}).get("results", [])
+        if not r.get("failed")
+    }
+    table = Table(
+        title="Benchmark Results",
+        title_style=f"bold {NordColors.FROST_1}",
+        border_style=NordColors.FROST_3,
+    )
+    table.add_column("Profile", style=NordColors.FROST_2)
+    table.add_column("Operation", style=NordColors.SNOW_STORM_1)
+    table.add_column("Time", justify="right")
+    table.add_column("Throughput", style=NordColors.GREEN, justify="right")
+    table.add_column("Files/s", justify="right")
+    table.add_column("Peak RSS", justify="right")
+    table.add_column("vs Last", style=NordColors.FROST_1, justify="right")
+    for r in report["results"]:
+        if r.get("failed"):
+            table.add_row(
+                r["profile"], r["operation"], "-", f"[{NordColors.RED}]FAILED[/]"
+            )
+            continue
+        before = baseline.get((r["profile"], r["operation"]))
+        change = (
+            f"{(r['mb_per_s'] - before) / before * 100:+.1f}%" if before else "-"
+        )
+        table.add_row(
+            r["profile"],
+            r["operation"],
+            format_time(r["seconds"]),
+            f"{r['mb_per_s']:.1f} MB/s",
+            f"{r['files_per_s']:,.0f}",
+            format_size(r["peak_rss"]),
+            change,
+        )
+    console.print(table)
+
+
+def benchmark_suite_menu() -> None:
+    """Interactive front end for the file operation benchmark suite."""
+    clear_screen()
+    console.print(create_header())
+    print_section("Benchmark Suite")
+    names = ", ".join(BENCH_PROFILES)
+    selected = get_user_input(f"Profiles to run ({names})", names)
+    profiles = [p.strip() for p in selected.split(",") if p.strip() in BENCH_PROFILES]
+    if not profiles:
+        print_error("No valid profiles selected.")
+        return
+    try:
+        scale = float(get_user_input("Size scale factor", "1.0"))
+        repeats = int(get_user_input("Repeats per operation (best is kept)", "1"))
+    except ValueError:
+        print_warning("Invalid number; using defaults")
+        scale, repeats = 1.0, 1
+    workdir = get_user_input("Scratch directory", tempfile.gettempdir())
+    if not Path(workdir).is_dir():
+        print_error("Invalid scratch directory.")
+        return
+    drop_caches = os.geteuid() == 0 and get_user_confirmation(
+        "Drop the page cache before each run (cold cache)?"
+    )
+    previous = load_latest_benchmark()
+    scratch = tempfile.mkdtemp(prefix="ftk-bench-", dir=workdir)
+    try:
+        with Spinner("Running benchmarks"):
+            report = run_benchmark_suite(profiles, scratch, scale, repeats, drop_caches)
+    except Exception as e:
+        print_error(f"Benchmark failed: {e}")
+        return
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+    print_benchmark_report(report, previous)
+    path = save_benchmark_results(report)
+    print_success(f"Results saved to {path}")
 
 
 # ----------------------------------------------------------------
@@ -871,10 +4572,15 @@ def main_menu() -> None:
             ("6", "Calculate File Checksum"),
             ("7", "Analyze Disk Usage"),
             ("8", "Batch Operations"),
+            ("9", "Find Duplicate Files"),
+            ("10", "Checksum Manifests (Generate/Verify)"),
+            ("11", "Search File Contents"),
+            ("12", "Compare & Sync Directories"),
+            ("13", "Benchmark Suite"),
             ("0", "Exit"),
         ]
         console.print(create_menu_table("Main Menu", options))
-        choice = get_user_input("Enter your choice (0-8)", "0")
+        choice = get_user_input("Enter your choice (0-13)", "0")
         if choice == "1":
             copy_menu()
             pause()
@@ -888,7 +4594,7 @@ def main_menu() -> None:
             find_files()
             pause()
         elif choice == "5":
-            compress_files()
+            compress_menu()
             pause()
         elif choice == "6":
             calculate_checksum()
@@ -899,6 +4605,21 @@ def main_menu() -> None:
         elif choice == "8":
             batch_operation_menu()
             pause()
+        elif choice == "9":
+            duplicate_finder()
+            pause()
+        elif choice == "10":
+            checksum_manifest_menu()
+            pause()
+        elif choice == "11":
+            content_search()
+            pause()
+        elif choice == "12":
+            sync_menu()
+            pause()
+        elif choice == "13":
+            benchmark_suite_menu()
+            pause()
         elif choice == "0":
             clear_screen()
             farewell = Panel(
@@ -938,7 +4659,41 @@ def copy_menu() -> None:
     if Path(dest).is_dir():
         dest = str(Path(dest) / Path(src).name)
         console.print(f"[dim]Full destination: {dest}[/]")
-    if not copy_item(src, dest):
+    workers = DEFAULT_COPY_WORKERS
+    resumable = sparse = False
+    if Path(src).is_dir():
+        try:
+            workers = int(
+                get_user_input("Number of parallel copy workers", str(workers))
+            )
+        except ValueError:
+            print_warning(f"Invalid worker count; using default ({workers})")
+        resumable = get_user_confirmation(
+            "Use resumable copy (skip finished files, checkpoint large ones)?"
+        )
+        sparse = not resumable and get_user_confirmation(
+            "Use sparse-aware copy (keep holes in VM images)?"
+        )
+    elif resume_offset(dest):
+        print_message(
+            f"Resuming interrupted copy at {format_size(resume_offset(dest))}",
+            NordColors.FROST_3,
+            "➜",
+        )
+        resumable = True
+    elif is_sparse(src) or Path(src).suffix.lower() in VM_IMAGE_EXTENSIONS:
+        st = Path(src).stat()
+        print_message(
+            f"Allocated {format_size(st.st_blocks * 512)} of "
+            f"{format_size(st.st_size)} logical size",
+            NordColors.FROST_3,
+        )
+        sparse = get_user_confirmation("Use sparse-aware copy (keep holes)?")
+    else:
+        resumable = Path(src).stat().st_size >= LARGE_FILE_THRESHOLD and (
+            get_user_confirmation("Use resumable copy with checkpoints?")
+        )
+    if not copy_item(src, dest, workers, resumable, sparse):
         print_error("Copy operation failed.")
     else:
         print_success("Copy completed successfully.")
@@ -979,7 +4734,17 @@ def delete_menu() -> None:
         print_error("Invalid path.")
         return
     force = get_user_confirmation("Skip confirmation for deletion?")
-    if not delete_item(path, force):
+    workers = DEFAULT_DELETE_WORKERS
+    if Path(path).is_dir():
+        try:
+            workers = int(
+                get_user_input(
+                    "Number of parallel delete workers", str(DEFAULT_DELETE_WORKERS)
+                )
+            )
+        except ValueError:
+            workers = DEFAULT_DELETE_WORKERS
+    if not delete_item(path, force, workers):
         print_error("Deletion failed or cancelled.")
     else:
         print_success("Deletion completed successfully.")
@@ -14,24 +14,39 @@ Version: 2.0.0
 # ----------------------------------------------------------------
 # Imports & Dependency Check
 # ----------------------------------------------------------------
+import argparse
 import atexit
+import bisect
 import csv
+import gzip
+import heapq
 import json
 import logging
 import math
+import mmap
 import os
+import random
 import signal
 import socket
+import struct
 import subprocess
 import sys
 import threading
 import time
 import traceback
+from array import array
 from collections import deque
-from dataclasses import asdict, dataclass, field
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 # Third-party libraries
 try:
@@ -72,10 +87,69 @@ APP_NAME = "Enhanced System Monitor"
 APP_SUBTITLE = "Performance Analysis Suite"
 
 DEFAULT_BENCHMARK_DURATION = 10  # seconds
-DEFAULT_REFRESH_RATE = 2.0  # seconds between dashboard updates
+CPU_BENCH_SLICE = 0.5  # seconds of work per task handed to a benchmark worker
+CPU_BENCH_SIEVE_BASE = 10**9  # sieve segments start here, so base primes are fixed
+CPU_BENCH_SIEVE_SEGMENT = 1 << 18  # numbers sieved per work unit
+CPU_BENCH_NUMPY_SIZE = 1 << 15  # float64 elements per vectorized unit (fits in L2)
+CPU_BENCH_NUMPY_PASSES = 16
+CPU_BENCH_INTEGER_SPAN = 1000  # Collatz sequences walked per integer unit
+MEM_BENCH_MIN_ARRAY = 128 * 1024**2  # bytes per STREAM array, at least 4x the LLC
+MEM_BENCH_DEFAULT_LLC = 32 * 1024**2  # assumed last-level cache when sysfs is silent
+MEM_BENCH_REPEATS = 5  # STREAM reports the best of several passes
+MEM_BENCH_CHASE_STEPS = 1_000_000
+MEM_BENCH_CHASE_BASELINE = 4 * 1024  # in-L1 chain used to cancel interpreter cost
+MEM_BENCH_TRIAD_BLOCK = 8 * 1024  # elements per cache-resident triad sub-block
+CACHE_LINE_BYTES = 64
+DISK_BENCH_FILE_MB = 1024  # test file size; larger than the drive's own cache
+DISK_BENCH_SEQ_BLOCK = 1024 * 1024
+DISK_BENCH_RANDOM_BLOCK = 4096
+DISK_BENCH_QUEUE_DEPTH = 32  # threads issuing random IO concurrently
+DISK_BENCH_MIN_SECONDS = 2.0  # shortest random IO test
+DISK_BENCH_SEED = 1234
+DISK_BENCH_PERCENTILES = (50, 95, 99, 99.9)
+DEFAULT_REFRESH_RATE = 0.5  # seconds between sampler ticks (fast collectors)
+DEFAULT_DISK_INTERVAL = 15.0  # partitions and usage rarely change
+DEFAULT_PROCESS_INTERVAL = 3.0  # process enumeration is the most expensive collector
+TICK_BUDGET_FRACTION = 0.5  # share of each tick collectors may spend before deferring
+COLLECTOR_COST_SMOOTHING = 0.2  # weight of the newest cost in the moving average
+DEFAULT_FRAME_RATE = 4.0  # dashboard redraws per second, independent of sampling
+SAMPLER_DRIFT_WINDOW = 600  # recent sample timings kept for drift statistics
 DEFAULT_HISTORY_POINTS = 60  # history points for trend graphs
+HISTORY_RAW_POINTS = 1200  # raw samples per series (10 min at the default tick)
+# Downsampled tiers as (seconds per bucket, buckets kept): 6 h at 10 s, 48 h at 1 min
+HISTORY_TIERS = ((10.0, 2160), (60.0, 2880))
+DEFAULT_GRAPH_WINDOW = 300.0  # seconds of history drawn in dashboard trend lines
+SPARKLINE_WIDTH = 30
+SPARKLINE_CHARS = "▁▂▃▄▅▆▇█"
 DEFAULT_TOP_PROCESSES = 8  # top processes to display
+PROCESS_BACKEND = "auto"  # "proc" reads /proc directly, "psutil" everywhere else
+PROC_STATUS_NAMES = {
+    "R": "running",
+    "S": "sleeping",
+    "D": "disk-sleep",
+    "Z": "zombie",
+    "T": "stopped",
+    "t": "tracing-stop",
+    "X": "dead",
+    "I": "idle",
+    "W": "waking",
+    "K": "wake-kill",
+    "P": "parked",
+}
 EXPORT_DIR = os.path.expanduser("~/system_monitor_exports")
+BENCHMARK_RESULTS_DIR = os.path.join(EXPORT_DIR, "benchmarks")
+RECORDINGS_DIR = os.path.expanduser("~/system_monitor_recordings")
+RECORDER_FSYNC_INTERVAL = 5.0  # seconds between fsyncs of the recording file
+RECORDER_MAX_BYTES = 64 * 1024 * 1024  # rotate the recording file at this size
+RECORDER_MAX_FILES = 50  # oldest rotated recordings beyond this are deleted
+RECORDING_FORMAT_VERSION = 2
+REPLAY_MAX_GAP = 2.0  # longest pause (seconds) between replayed samples
+EXPORTER_HOST = "127.0.0.1"  # bind to localhost only unless asked otherwise
+EXPORTER_PORT = 9877
+EXPORTER_PREFIX = "system_monitor"
+OPENMETRICS_CONTENT_TYPE = (
+    "application/openmetrics-text; version=1.0.0; charset=utf-8"
+)
 LOG_FILE = os.path.join(Path.home(), ".system_monitor.log")
 OPERATION_TIMEOUT = 30  # seconds
 
@@ -259,6 +333,14 @@ def setup_logging() -> None:
 # ----------------------------------------------------------------
 # System Information Functions
 # ----------------------------------------------------------------
+def format_bytes(num_bytes: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(num_bytes) < 1024:
+            return f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} TB"
+
+
 def get_system_uptime() -> str:
     boot_time = psutil.boot_time()
     uptime = time.time() - boot_time
@@ -398,26 +480,147 @@ def get_load_average() -> Tuple[float, float, float]:
 # ----------------------------------------------------------------
 # Benchmark Functions
 # ----------------------------------------------------------------
-def is_prime(n: int) -> bool:
-    if n <= 1:
-        return False
-    if n <= 3:
-        return True
-    if n % 2 == 0 or n % 3 == 0:
-        return False
-    i = 5
-    while i * i <= n:
-        if n % i == 0 or n % (i + 2) == 0:
-            return False
-        i += 6
-    return True
-
-
-def cpu_prime_benchmark(duration_sec: int) -> Dict[str, Any]:
+_SIEVE_PRIMES: List[int] = []
+_NUMPY_BUFFERS: List[Any] = []
+
+
+def small_primes(limit: int) -> List[int]:
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[:2] = b"\x00\x00"
+    for i in range(2, math.isqrt(limit) + 1):
+        if sieve[i]:
+            sieve[i * i :: i] = bytes(len(range(i * i, limit + 1, i)))
+    return [i for i, flag in enumerate(sieve) if flag]
+
+
+def sieve_segment(low: int, size: int, primes: List[int]) -> int:
+    """Count primes in [low, low + size) using base primes up to sqrt(low + size)."""
+    segment = bytearray([1]) * size
+    high = low + size
+    for p in primes:
+        if p * p >= high:
+            break
+        first = max(p * p, -(-low // p) * p) - low
+        segment[first::p] = bytes(len(range(first, size, p)))
+    return segment.count(1)
+
+
+def _sieve_unit(n: int) -> int:
+    if not _SIEVE_PRIMES:
+        limit = CPU_BENCH_SIEVE_BASE + 16 * CPU_BENCH_SIEVE_SEGMENT
+        _SIEVE_PRIMES.extend(small_primes(math.isqrt(limit) + 1))
+    low = CPU_BENCH_SIEVE_BASE + (n % 16) * CPU_BENCH_SIEVE_SEGMENT
+    return sieve_segment(low, CPU_BENCH_SIEVE_SEGMENT, _SIEVE_PRIMES)
+
+
+def _numpy_unit(n: int) -> int:
+    if not _NUMPY_BUFFERS:
+        x = np.linspace(1.0, 2.0, CPU_BENCH_NUMPY_SIZE)
+        _NUMPY_BUFFERS.extend([x, np.empty_like(x)])
+    x, y = _NUMPY_BUFFERS
+    total = 0.0
+    for _ in range(CPU_BENCH_NUMPY_PASSES):
+        np.multiply(x, 1.5, out=y)
+        np.add(y, x, out=y)
+        np.multiply(y, x, out=y)
+        np.sqrt(y, out=y)
+        total += float(y.sum())
+    return int(total)
+
+
+def _integer_unit(n: int) -> int:
+    steps = 0
+    first = 1 + (n % 64) * CPU_BENCH_INTEGER_SPAN
+    for value in range(first, first + CPU_BENCH_INTEGER_SPAN):
+        while value != 1:
+            value = value >> 1 if value & 1 == 0 else 3 * value + 1
+            steps += 1
+    return steps
+
+
+# name: (label, unit function, work per unit, work label)
+CPU_BENCH_KERNELS = {
+    "sieve": ("Segmented sieve", _sieve_unit, CPU_BENCH_SIEVE_SEGMENT, "numbers"),
+    "numpy": (
+        "NumPy vectorized",
+        _numpy_unit,
+        CPU_BENCH_NUMPY_SIZE * CPU_BENCH_NUMPY_PASSES,
+        "elements",
+    ),
+    "integer": (
+        "Pure-Python integer",
+        _integer_unit,
+        CPU_BENCH_INTEGER_SPAN,
+        "sequences",
+    ),
+}
+
+
+def _cpu_bench_slice(kernel: str, seconds: float) -> Tuple[int, float]:
+    """Worker task: run whole units of a kernel for about `seconds`."""
+    unit = CPU_BENCH_KERNELS[kernel][1]
+    unit(0)  # build per-process tables outside the timed region
+    units = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while True:
+        unit(units)
+        units += 1
+        if time.perf_counter() >= deadline:
+            return units, time.perf_counter() - start
+
+
+def _run_cpu_phase(
+    executor: ProcessPoolExecutor,
+    kernel: str,
+    workers: int,
+    seconds: float,
+    on_slice: Callable[[float], None],
+) -> float:
+    """
+    Keep `workers` processes busy with one kernel for `seconds` and return the
+    aggregate rate in units per second. Each slice is timed inside the worker,
+    so pool dispatch and start-up don't count against the score.
+    """
+    start = time.perf_counter()
+    deadline = start + seconds
+    units = 0
+    busy = 0.0
+    pending = {
+        executor.submit(_cpu_bench_slice, kernel, CPU_BENCH_SLICE)
+        for _ in range(workers)
+    }
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            slice_units, slice_time = future.result()
+            units += slice_units
+            busy += slice_time
+            if time.perf_counter() + CPU_BENCH_SLICE / 2 < deadline:
+                pending.add(executor.submit(_cpu_bench_slice, kernel, CPU_BENCH_SLICE))
+        on_slice(min(time.perf_counter() - start, seconds))
+    return units / busy * workers if busy > 0 else 0.0
+
+
+def _geometric_mean(values: List[float]) -> float:
+    values = [v for v in values if v > 0]
+    if not values:
+        return 0.0
+    return math.exp(sum(math.log(v) for v in values) / len(values))
+
+
+def cpu_core_benchmark(duration_sec: int) -> Dict[str, Any]:
+    """
+    Score each kernel on one core and then on every logical core. Scores are
+    work units per second, where a unit is a fixed amount of work, so they can
+    be compared between machines.
+    """
+    workers = os.cpu_count() or 1
+    counts = (1, workers) if workers > 1 else (1,)
+    phases = [(name, count) for name in CPU_BENCH_KERNELS for count in counts]
+    phase_time = max(1.0, duration_sec / len(phases))
+    rates: Dict[str, Dict[str, float]] = {name: {} for name in CPU_BENCH_KERNELS}
     start = time.time()
-    end = start + duration_sec
-    prime_count = 0
-    num = 2
     with Progress(
         SpinnerColumn(style=f"bold {NordColors.CPU}"),
         TextColumn("[progress.description]{task.description}"),
@@ -428,21 +631,48 @@ def cpu_prime_benchmark(duration_sec: int) -> Dict[str, Any]:
         TimeRemainingColumn(),
         console=console,
     ) as progress:
-        task = progress.add_task(
-            f"Calculating primes for {duration_sec} seconds...", total=100
-        )
-        while time.time() < end:
-            if is_prime(num):
-                prime_count += 1
-            num += 1
-            elapsed = time.time() - start
-            progress.update(task, completed=min(100, (elapsed / duration_sec) * 100))
-    total_time = time.time() - start
+        task = progress.add_task("Starting workers...", total=len(phases) * phase_time)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for index, (name, count) in enumerate(phases):
+                label = CPU_BENCH_KERNELS[name][0]
+                scope = "1 core" if count == 1 else f"{count} cores"
+                progress.update(task, description=f"{label} ({scope})")
+                done_before = index * phase_time
+                rate = _run_cpu_phase(
+                    executor,
+                    name,
+                    count,
+                    phase_time,
+                    lambda elapsed: progress.update(
+                        task, completed=done_before + elapsed
+                    ),
+                )
+                rates[name]["single" if count == 1 else "multi"] = rate
+    kernels = {}
+    for name, (label, _, work, work_label) in CPU_BENCH_KERNELS.items():
+        single = rates[name].get("single", 0.0)
+        multi = rates[name].get("multi", single)
+        kernels[name] = {
+            "label": label,
+            "work_label": work_label,
+            "single_rate": single,
+            "multi_rate": multi,
+            "single_work_per_sec": single * work,
+            "multi_work_per_sec": multi * work,
+            "speedup": multi / single if single else 0.0,
+            "efficiency": multi / (single * workers) * 100 if single else 0.0,
+        }
+    single_score = _geometric_mean([k["single_rate"] for k in kernels.values()])
+    multi_score = _geometric_mean([k["multi_rate"] for k in kernels.values()])
     return {
-        "primes_per_sec": prime_count / total_time if total_time > 0 else 0,
-        "elapsed_time": total_time,
-        "prime_count": prime_count,
-        "highest_prime_checked": num - 1,
+        "workers": workers,
+        "elapsed_time": time.time() - start,
+        "kernels": kernels,
+        "single_score": single_score,
+        "multi_score": multi_score,
+        "scaling_efficiency": (
+            multi_score / (single_score * workers) * 100 if single_score else 0.0
+        ),
     }
 
 
@@ -450,15 +680,377 @@ def cpu_benchmark(duration_sec: int = DEFAULT_BENCHMARK_DURATION) -> Dict[str, A
     print_section("Running CPU Benchmark")
     print_step(f"Benchmarking for {duration_sec} seconds...")
     try:
-        prime_results = cpu_prime_benchmark(duration_sec)
+        core_results = cpu_core_benchmark(duration_sec)
         cpu_info = get_cpu_info()
-        return {**prime_results, **cpu_info}
+        return {**core_results, **cpu_info}
     except Exception as e:
         print_error(f"Error during CPU benchmark: {e}")
         logging.exception("CPU benchmark error")
         return {"error": str(e)}
 
 
+def get_llc_size() -> int:
+    """Largest CPU cache size reported by sysfs, in bytes."""
+    largest = 0
+    cache_dir = "/sys/devices/system/cpu/cpu0/cache"
+    try:
+        for entry in os.listdir(cache_dir):
+            if not entry.startswith("index"):
+                continue
+            with open(os.path.join(cache_dir, entry, "size")) as f:
+                size = f.read().strip()
+            multiplier = {"K": 1024, "M": 1024**2, "G": 1024**3}.get(size[-1:], 1)
+            largest = max(largest, int(size.rstrip("KMG")) * multiplier)
+    except (OSError, ValueError):
+        pass
+    return largest or MEM_BENCH_DEFAULT_LLC
+
+
+def _stream_pass(
+    kernel: str,
+    arrays: Tuple[Any, Any, Any],
+    chunks: List[Tuple[int, int]],
+    executor: ThreadPoolExecutor,
+) -> float:
+    """
+    Run one STREAM kernel across all chunks in parallel; returns seconds.
+    NumPy needs two ufunc calls for the triad, so it walks each chunk in
+    cache-sized sub-blocks: the intermediate written to `a` is re-read from
+    cache, and memory traffic stays at the three arrays STREAM counts.
+    """
+    scalar = 3.0
+
+    def work(bounds: Tuple[int, int]) -> None:
+        a, b, c = (x[bounds[0] : bounds[1]] for x in arrays)
+        if kernel == "copy":
+            np.copyto(c, a)
+        elif kernel == "scale":
+            np.multiply(c, scalar, out=b)
+        elif kernel == "add":
+            np.add(a, b, out=c)
+        else:
+            for start in range(0, len(a), MEM_BENCH_TRIAD_BLOCK):
+                end = start + MEM_BENCH_TRIAD_BLOCK
+                np.multiply(c[start:end], scalar, out=a[start:end])
+                np.add(a[start:end], b[start:end], out=a[start:end])
+
+    start = time.perf_counter()
+    list(executor.map(work, chunks))
+    return time.perf_counter() - start
+
+
+def _chase_chain(size: int, rng: Any) -> memoryview:
+    """
+    A random cyclic chain with one node per cache line, so every step is a
+    dependent load from an unpredictable line.
+    """
+    words = CACHE_LINE_BYTES // 8
+    lines = max(2, size // CACHE_LINE_BYTES)
+    order = rng.permutation(lines) * words
+    chain = np.zeros(lines * words, dtype=np.int64)
+    chain[order] = np.roll(order, -1)
+    return memoryview(chain)
+
+
+def _chase(chain: memoryview, steps: int) -> float:
+    i = 0
+    start = time.perf_counter()
+    for _ in range(steps):
+        i = chain[i]
+    return (time.perf_counter() - start) / steps
+
+
+def memory_benchmark() -> Dict[str, Any]:
+    """
+    STREAM-style copy/scale/add/triad bandwidth over arrays several times the
+    size of the last-level cache, measured at increasing thread counts (NumPy
+    releases the GIL inside the kernels), and pointer-chasing load latency for
+    working sets from L1 out to DRAM.
+    """
+    print_section("Running Memory Benchmark")
+    llc = get_llc_size()
+    available = psutil.virtual_memory().available
+    array_bytes = max(4 * llc, MEM_BENCH_MIN_ARRAY)
+    array_bytes = int(min(array_bytes, available // 8))
+    elements = array_bytes // 8
+    cpus = os.cpu_count() or 1
+    thread_counts = sorted({min(2**i, cpus) for i in range(cpus.bit_length() + 1)})
+    kernels = ["copy", "scale", "add", "triad"]
+    # STREAM convention: bytes counted once per array named in the kernel.
+    arrays_touched = {"copy": 2, "scale": 2, "add": 3, "triad": 3}
+    chase_sizes = sorted(
+        {32 * 1024, 256 * 1024, max(llc // 2, 64 * 1024), min(4 * llc, array_bytes)}
+    )
+    print_step(
+        f"Arrays: 3 x {array_bytes / 1024**2:.0f} MB (LLC {llc / 1024**2:.1f} MB), "
+        f"threads: {', '.join(map(str, thread_counts))}"
+    )
+    bandwidth: Dict[str, Dict[int, float]] = {k: {} for k in kernels}
+    latency: List[Dict[str, float]] = []
+    start = time.time()
+    with Progress(
+        SpinnerColumn(style=f"bold {NordColors.MEM}"),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(
+            bar_width=40, style=NordColors.MEM, complete_style=NordColors.FROST_2
+        ),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        console=console,
+    ) as progress:
+        total = len(thread_counts) * len(kernels) + len(chase_sizes) + 1
+        task = progress.add_task("Allocating arrays...", total=total)
+        arrays = (
+            np.full(elements, 1.0),
+            np.full(elements, 2.0),
+            np.zeros(elements),
+        )
+        for threads in thread_counts:
+            step = -(-elements // threads)
+            chunks = [(i, min(i + step, elements)) for i in range(0, elements, step)]
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                for kernel in kernels:
+                    progress.update(
+                        task, description=f"STREAM {kernel} ({threads} threads)"
+                    )
+                    best = min(
+                        _stream_pass(kernel, arrays, chunks, executor)
+                        for _ in range(MEM_BENCH_REPEATS)
+                    )
+                    moved = arrays_touched[kernel] * elements * 8
+                    bandwidth[kernel][threads] = moved / best / 1024**2
+                    progress.advance(task)
+        del arrays
+        rng = np.random.default_rng(0)
+        progress.update(task, description="Pointer chase (baseline)")
+        baseline_chain = _chase_chain(MEM_BENCH_CHASE_BASELINE, rng)
+        baseline = min(_chase(baseline_chain, MEM_BENCH_CHASE_STEPS) for _ in range(2))
+        progress.advance(task)
+        for size in chase_sizes:
+            progress.update(
+                task, description=f"Pointer chase ({size / 1024**2:.2f} MB)"
+            )
+            per_step = _chase(_chase_chain(size, rng), MEM_BENCH_CHASE_STEPS)
+            latency.append(
+                {
+                    "working_set": size,
+                    "ns_per_load": per_step * 1e9,
+                    "net_ns": max(0.0, per_step - baseline) * 1e9,
+                }
+            )
+            progress.advance(task)
+    single = bandwidth["triad"].get(1, 0.0)
+    widest = bandwidth["triad"].get(thread_counts[-1], 0.0)
+    return {
+        "elapsed_time": time.time() - start,
+        "array_bytes": array_bytes,
+        "llc_bytes": llc,
+        "threads": thread_counts,
+        "bandwidth_mb_s": bandwidth,
+        "best_mb_s": {k: max(v.values()) for k, v in bandwidth.items()},
+        "triad_scaling": widest / single if single else 0.0,
+        "chase_baseline_ns": baseline * 1e9,
+        "latency": latency,
+    }
+
+
+def _open_bench_file(path: str) -> Tuple[int, bool]:
+    """Open the test file with O_DIRECT if the filesystem allows it."""
+    flags = os.O_RDWR | os.O_CREAT
+    if hasattr(os, "O_DIRECT"):
+        try:
+            return os.open(path, flags | os.O_DIRECT, 0o600), True
+        except OSError:
+            pass
+    return os.open(path, flags, 0o600), False
+
+
+def _drop_file_cache(fd: int) -> None:
+    os.fsync(fd)
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def _disk_io_test(
+    fd: int,
+    file_size: int,
+    block: int,
+    queue_depth: int,
+    write: bool,
+    sequential: bool,
+    seconds: float,
+    on_progress: Callable[[float], None],
+) -> Dict[str, Any]:
+    """
+    Run one IO pattern with `queue_depth` threads, each keeping one request in
+    flight. Sequential tests make a single pass over the file; random tests run
+    for `seconds`. Buffers come from mmap so they are page aligned for
+    O_DIRECT. Write buffers are random and each write stamps a unique
+    (worker, sequence) header, so no two blocks can compress or dedupe.
+    Writes include the final fsync in the elapsed time.
+    """
+    blocks = file_size // block
+    stop = threading.Event()
+    latencies = [array("d") for _ in range(queue_depth)]
+    finished = [0.0] * queue_depth
+    errors: List[OSError] = []
+
+    def worker(index: int) -> None:
+        buf = mmap.mmap(-1, block)
+        if write:
+            buf.write(os.urandom(block))
+        rng = random.Random(DISK_BENCH_SEED + index)
+        io = os.pwritev if write else os.preadv
+        lat = latencies[index]
+        position = index
+        sequence = 0
+        try:
+            while not stop.is_set():
+                if sequential:
+                    if position >= blocks:
+                        break
+                    offset = position * block
+                    position += queue_depth
+                else:
+                    offset = rng.randrange(blocks) * block
+                if write:
+                    struct.pack_into("<IQ", buf, 0, index, sequence)
+                    sequence += 1
+                t0 = time.perf_counter()
+                io(fd, [buf], offset)
+                lat.append(time.perf_counter() - t0)
+        except OSError as e:
+            errors.append(e)
+            stop.set()
+        finally:
+            finished[index] = time.perf_counter()
+            buf.close()
+
+    threads = [
+        threading.Thread(target=worker, args=(i,), daemon=True)
+        for i in range(queue_depth)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    while any(thread.is_alive() for thread in threads):
+        elapsed = time.perf_counter() - start
+        if sequential:
+            on_progress(sum(len(lat) for lat in latencies) / blocks)
+        else:
+            on_progress(min(elapsed / seconds, 1.0))
+            if elapsed >= seconds:
+                stop.set()
+        threads[0].join(0.1)
+    if errors:
+        raise errors[0]
+    if write:
+        os.fsync(fd)
+        finished.append(time.perf_counter())
+    elapsed = max(finished) - start
+    ops = sum(len(lat) for lat in latencies)
+    merged = sorted(value for lat in latencies for value in lat) or [0.0]
+    percentiles = {
+        f"p{q:g}": merged[min(len(merged) - 1, int(len(merged) * q / 100))] * 1e6
+        for q in DISK_BENCH_PERCENTILES
+    }
+    return {
+        "block": block,
+        "queue_depth": queue_depth,
+        "ops": ops,
+        "bytes": ops * block,
+        "seconds": elapsed,
+        "mb_s": ops * block / elapsed / 1024**2 if elapsed > 0 else 0.0,
+        "iops": ops / elapsed if elapsed > 0 else 0.0,
+        "latency_us": {**percentiles, "max": merged[-1] * 1e6},
+    }
+
+
+def disk_benchmark(
+    directory: str,
+    file_mb: int = DISK_BENCH_FILE_MB,
+    queue_depth: int = DISK_BENCH_QUEUE_DEPTH,
+    duration_sec: int = DEFAULT_BENCHMARK_DURATION,
+) -> Dict[str, Any]:
+    """
+    Sequential 1 MiB and random 4 KiB reads and writes against a test file in
+    `directory`. Random patterns run at queue depth 1 and `queue_depth`.
+    """
+    print_section("Running Disk I/O Benchmark")
+    if not hasattr(os, "preadv"):
+        return {"error": "positional vectored IO (preadv) is not available here"}
+    file_size = file_mb * 1024 * 1024
+    try:
+        free = psutil.disk_usage(directory).free
+    except OSError as e:
+        return {"error": f"Cannot check free space in {directory}: {e}"}
+    if free < file_size * 1.1:
+        return {
+            "error": f"{directory} has {free / 1024**2:,.0f} MB free, "
+            f"need {file_size * 1.1 / 1024**2:,.0f} MB"
+        }
+    random_seconds = max(DISK_BENCH_MIN_SECONDS, duration_sec / 4)
+    tests = [
+        ("Sequential write", DISK_BENCH_SEQ_BLOCK, 1, True, True),
+        ("Sequential read", DISK_BENCH_SEQ_BLOCK, 1, False, True),
+        ("Random read", DISK_BENCH_RANDOM_BLOCK, 1, False, False),
+        ("Random read", DISK_BENCH_RANDOM_BLOCK, queue_depth, False, False),
+        ("Random write", DISK_BENCH_RANDOM_BLOCK, 1, True, False),
+        ("Random write", DISK_BENCH_RANDOM_BLOCK, queue_depth, True, False),
+    ]
+    path = os.path.join(directory, f".system_monitor_disk_bench_{os.getpid()}.tmp")
+    try:
+        fd, direct = _open_bench_file(path)
+    except OSError as e:
+        return {"error": f"Cannot create test file in {directory}: {e}"}
+    print_step(
+        f"Test file: {path} ({file_mb:,} MB, "
+        f"{'O_DIRECT' if direct else 'buffered; page cache dropped between tests'})"
+    )
+    results = []
+    start = time.time()
+    try:
+        with Progress(
+            SpinnerColumn(style=f"bold {NordColors.DISK}"),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(
+                bar_width=40, style=NordColors.DISK, complete_style=NordColors.FROST_2
+            ),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            console=console,
+        ) as progress:
+            for name, block, depth, write, sequential in tests:
+                task = progress.add_task(f"{name} (QD{depth})", total=1.0)
+                result = _disk_io_test(
+                    fd,
+                    file_size,
+                    block,
+                    depth,
+                    write,
+                    sequential,
+                    random_seconds,
+                    lambda done: progress.update(task, completed=done),
+                )
+                progress.update(task, completed=1.0)
+                results.append({"name": name, **result})
+                if not direct:
+                    _drop_file_cache(fd)
+    except OSError as e:
+        return {"error": f"IO failed on {path}: {e}"}
+    finally:
+        os.close(fd)
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    return {
+        "directory": directory,
+        "file_size": file_size,
+        "direct_io": direct,
+        "elapsed_time": time.time() - start,
+        "tests": results,
+    }
+
+
 def gpu_matrix_benchmark(duration_sec: int) -> Dict[str, Any]:
     gpu_info = get_gpu_info()
     matrix_size = 1024
@@ -543,19 +1135,53 @@ def display_cpu_results(results: Dict[str, Any]) -> None:
         table.add_row("Max Frequency", f"{results['frequency_max']:.2f} MHz")
     table.add_row("CPU Usage", f"{results['usage']:.2f}%")
     table.add_row("Benchmark Duration", f"{results['elapsed_time']:.2f} seconds")
-    table.add_row("Primes Found", f"{results['prime_count']:,}")
-    table.add_row("Highest Number Checked", f"{results['highest_prime_checked']:,}")
+    table.add_row("Worker Processes", str(results["workers"]))
     table.add_row(
-        "Primes/Second",
-        f"{results['primes_per_sec']:.2f}",
+        "Single-Core Score",
+        f"{results['single_score']:,.1f}",
         style=f"bold {NordColors.SUCCESS}",
     )
+    table.add_row(
+        "All-Core Score",
+        f"{results['multi_score']:,.1f}",
+        style=f"bold {NordColors.SUCCESS}",
+    )
+    table.add_row("Scaling Efficiency", f"{results['scaling_efficiency']:.1f}%")
     console.print(table)
+    kernel_table = Table(
+        show_header=True,
+        header_style=f"bold {NordColors.FROST_1}",
+        expand=True,
+        title=f"[bold {NordColors.CPU}]Kernels[/]",
+        border_style=NordColors.FROST_3,
+        title_justify="center",
+    )
+    kernel_table.add_column("Kernel", style=f"bold {NordColors.FROST_3}")
+    kernel_table.add_column("Single-Core", justify="right")
+    kernel_table.add_column(f"All-Core ({results['workers']})", justify="right")
+    kernel_table.add_column("Speedup", justify="right")
+    kernel_table.add_column("Efficiency", justify="right")
+    for kernel in results["kernels"].values():
+        kernel_table.add_row(
+            kernel["label"],
+            f"{kernel['single_work_per_sec']:,.0f} {kernel['work_label']}/s",
+            f"{kernel['multi_work_per_sec']:,.0f} {kernel['work_label']}/s",
+            f"{kernel['speedup']:.2f}x",
+            f"{kernel['efficiency']:.1f}%",
+        )
+    console.print(kernel_table)
     console.print("\n[bold {0}]Benchmark Explanation:[/{0}]".format(NordColors.FROST_2))
     console.print(
-        "• Prime calculations stress single-core performance and integer operations."
+        "• Each kernel runs a fixed unit of work: a sieve segment above 10^9, "
+        "in-cache NumPy arithmetic, and Python-level Collatz integer loops."
+    )
+    console.print(
+        "• Scores are the geometric mean of units/second, comparable across machines."
+    )
+    console.print(
+        "• Efficiency is all-core throughput divided by single-core throughput "
+        "times the worker count; SMT siblings and thermal limits lower it."
     )
-    console.print("• Higher primes/second indicate better CPU performance.")
 
 
 def display_gpu_results(results: Dict[str, Any]) -> None:
@@ -596,6 +1222,131 @@ def display_gpu_results(results: Dict[str, Any]) -> None:
     )
 
 
+def display_memory_results(results: Dict[str, Any]) -> None:
+    if "error" in results:
+        print_error(f"Benchmark Error: {results['error']}")
+        return
+    table = Table(
+        show_header=True,
+        header_style=f"bold {NordColors.FROST_1}",
+        expand=True,
+        title=f"[bold {NordColors.MEM}]Memory Bandwidth (STREAM, MB/s)[/]",
+        border_style=NordColors.FROST_3,
+        title_justify="center",
+    )
+    table.add_column("Kernel", style=f"bold {NordColors.FROST_3}")
+    for threads in results["threads"]:
+        table.add_column(f"{threads} thr", justify="right")
+    for kernel, by_threads in results["bandwidth_mb_s"].items():
+        table.add_row(
+            kernel.capitalize(),
+            *(f"{by_threads[t]:,.0f}" for t in results["threads"]),
+        )
+    console.print(table)
+    latency_table = Table(
+        show_header=True,
+        header_style=f"bold {NordColors.FROST_1}",
+        expand=True,
+        title=f"[bold {NordColors.MEM}]Load Latency (pointer chase)[/]",
+        border_style=NordColors.FROST_3,
+        title_justify="center",
+    )
+    latency_table.add_column("Working Set", style=f"bold {NordColors.FROST_3}")
+    latency_table.add_column("Per Load", justify="right")
+    latency_table.add_column("Net of Interpreter", justify="right")
+    for row in results["latency"]:
+        latency_table.add_row(
+            format_bytes(row["working_set"]),
+            f"{row['ns_per_load']:.1f} ns",
+            f"{row['net_ns']:.1f} ns",
+        )
+    console.print(latency_table)
+    console.print("\n[bold {0}]Benchmark Explanation:[/{0}]".format(NordColors.FROST_2))
+    console.print(
+        f"• Each STREAM array is {format_bytes(results['array_bytes'])} against a "
+        f"{format_bytes(results['llc_bytes'])} last-level cache; best of "
+        f"{MEM_BENCH_REPEATS} passes."
+    )
+    if results["array_bytes"] < 4 * results["llc_bytes"]:
+        print_warning(
+            "Arrays are smaller than 4x the LLC (limited by free memory); "
+            "bandwidth may include cache hits."
+        )
+    console.print(
+        f"• Triad scales {results['triad_scaling']:.2f}x from 1 to "
+        f"{results['threads'][-1]} threads; flat scaling means memory-bound."
+    )
+    console.print(
+        "• Latency is measured from Python, so the in-L1 chain cost "
+        f"({results['chase_baseline_ns']:.1f} ns) is subtracted to estimate the "
+        "memory component."
+    )
+
+
+def display_disk_results(results: Dict[str, Any]) -> None:
+    if "error" in results:
+        print_error(f"Benchmark Error: {results['error']}")
+        return
+    table = Table(
+        show_header=True,
+        header_style=f"bold {NordColors.FROST_1}",
+        expand=True,
+        title=f"[bold {NordColors.DISK}]Disk I/O Results ({results['directory']})[/]",
+        border_style=NordColors.FROST_3,
+        title_justify="center",
+    )
+    table.add_column("Test", style=f"bold {NordColors.FROST_3}")
+    table.add_column("Block", justify="right")
+    table.add_column("QD", justify="right")
+    table.add_column("MB/s", justify="right")
+    table.add_column("IOPS", justify="right")
+    for q in DISK_BENCH_PERCENTILES:
+        table.add_column(f"p{q:g}", justify="right")
+    table.add_column("Max", justify="right")
+    for test in results["tests"]:
+        latency = test["latency_us"]
+        table.add_row(
+            test["name"],
+            format_bytes(test["block"]),
+            str(test["queue_depth"]),
+            f"{test['mb_s']:,.1f}",
+            f"{test['iops']:,.0f}",
+            *(f"{latency[f'p{q:g}']:,.0f} µs" for q in DISK_BENCH_PERCENTILES),
+            f"{latency['max']:,.0f} µs",
+        )
+    console.print(table)
+    console.print("\n[bold {0}]Benchmark Explanation:[/{0}]".format(NordColors.FROST_2))
+    if results["direct_io"]:
+        console.print("• O_DIRECT was used, so the page cache is bypassed.")
+    else:
+        print_warning(
+            "O_DIRECT is not supported on this filesystem; buffered results may "
+            "include cache effects."
+        )
+    console.print(
+        "• Queue depth is emulated with one thread per outstanding request; "
+        "very fast NVMe devices may be limited by Python overhead at high IOPS."
+    )
+
+
+def save_benchmark_results(results: Dict[str, Dict[str, Any]]) -> Optional[str]:
+    """Write this session's benchmark results (cpu, memory, ...) to one JSON file."""
+    try:
+        os.makedirs(BENCHMARK_RESULTS_DIR, exist_ok=True)
+        started = results.setdefault(
+            "started", datetime.now().strftime("%Y%m%d_%H%M%S")
+        )
+        path = os.path.join(
+            BENCHMARK_RESULTS_DIR, f"benchmark_{socket.gethostname()}_{started}.json"
+        )
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, default=str)
+        return path
+    except OSError as e:
+        print_error(f"Could not save benchmark results: {e}")
+        return None
+
+
 # ----------------------------------------------------------------
 # Data Structures for Monitoring
 # ----------------------------------------------------------------
@@ -638,6 +1389,285 @@ class MemoryInfo:
     swap_percent: float = 0.0
 
 
+@dataclass
+class CollectorStats:
+    name: str
+    interval: float
+    last_cost: float = 0.0
+    avg_cost: float = 0.0
+    max_cost: float = 0.0
+    runs: int = 0
+    deferrals: int = 0
+    last_run: float = 0.0  # time.monotonic() of the last run
+
+    def record(self, cost: float, now: float) -> None:
+        if self.runs:
+            self.avg_cost += (cost - self.avg_cost) * COLLECTOR_COST_SMOOTHING
+        else:
+            self.avg_cost = cost
+        self.last_cost = cost
+        self.max_cost = max(self.max_cost, cost)
+        self.runs += 1
+        self.last_run = now
+
+
+@dataclass(frozen=True)
+class CpuSample:
+    usage_percent: float = 0.0
+    per_core: Tuple[float, ...] = ()
+    load_avg: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+    frequency: float = 0.0
+    temperature: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class MonitorSnapshot:
+    """
+    An immutable view of one sampling tick. The sampler thread publishes a new
+    snapshot per tick and never modifies it afterwards, so renderers and
+    exporters can read it without locking.
+    """
+
+    timestamp: float = 0.0
+    sequence: int = 0
+    cpu: CpuSample = field(default_factory=CpuSample)
+    memory: MemoryInfo = field(default_factory=MemoryInfo)
+    disks: Tuple[DiskInfo, ...] = ()
+    interfaces: Tuple[NetworkInfo, ...] = ()
+    processes: Tuple[Dict[str, Any], ...] = ()
+    cpu_history: Tuple[float, ...] = ()
+    memory_history: Tuple[float, ...] = ()
+    collectors: Tuple[CollectorStats, ...] = ()
+    tick_budget: float = 0.0
+    interval: float = 0.0  # actual seconds since the previous sample
+    drift: float = 0.0  # seconds the sample started after its scheduled time
+    duration: float = 0.0  # seconds spent collecting the sample
+    sections: Tuple[str, ...] = ()  # collectors that refreshed this tick
+
+
+# ----------------------------------------------------------------
+# Time-Series History
+# ----------------------------------------------------------------
+class RingBuffer:
+    """
+    Fixed-capacity columns of doubles backed by array('d'); once full, each
+    append overwrites the oldest row. Memory use is fixed at creation.
+    """
+
+    def __init__(self, capacity: int, columns: Tuple[str, ...]) -> None:
+        self.capacity = capacity
+        self.columns = {name: array("d", bytes(8 * capacity)) for name in columns}
+        self.head = 0
+        self.size = 0
+
+    def append(self, *values: float) -> None:
+        for column, value in zip(self.columns.values(), values):
+            column[self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def column(self, name: str) -> array:
+        """Return a column in chronological order (oldest first)."""
+        data = self.columns[name]
+        if self.size < self.capacity:
+            return data[: self.size]
+        return data[self.head :] + data[: self.head]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(c.itemsize * len(c) for c in self.columns.values())
+
+
+class _HistoryTier:
+    """One downsampled resolution: completed buckets plus the one being filled."""
+
+    def __init__(self, resolution: float, capacity: int) -> None:
+        self.resolution = resolution
+        self.buffer = RingBuffer(capacity, ("t", "avg", "min", "max"))
+        self.start = 0.0
+        self.total = 0.0
+        self.count = 0
+        self.low = 0.0
+        self.high = 0.0
+
+    def add(self, t: float, value: float) -> None:
+        bucket = t - t % self.resolution
+        if self.count and bucket != self.start:
+            self.buffer.append(self.start, self.total / self.count, self.low, self.high)
+            self.count = 0
+        if not self.count:
+            self.start, self.total, self.low, self.high = bucket, 0.0, value, value
+        self.total += value
+        self.count += 1
+        self.low = min(self.low, value)
+        self.high = max(self.high, value)
+
+    def rows(self) -> Tuple[array, array, array, array]:
+        """Return (t, avg, min, max), including the partial current bucket."""
+        rows = tuple(self.buffer.column(c) for c in ("t", "avg", "min", "max"))
+        if self.count:
+            for column, value in zip(
+                rows, (self.start, self.total / self.count, self.low, self.high)
+            ):
+                column.append(value)
+        return rows
+
+
+class MetricSeries:
+    """A single metric kept at raw resolution and in each HISTORY_TIERS tier."""
+
+    def __init__(self) -> None:
+        self.raw = RingBuffer(HISTORY_RAW_POINTS, ("t", "value"))
+        self.tiers = [_HistoryTier(res, n) for res, n in HISTORY_TIERS]
+
+    def add(self, t: float, value: float) -> None:
+        self.raw.append(t, value)
+        for tier in self.tiers:
+            tier.add(t, value)
+
+    def query(
+        self, since: float, max_points: Optional[int] = None
+    ) -> Dict[str, List[float]]:
+        """
+        Return points newer than since from the finest resolution that still
+        reaches back that far, reduced to at most max_points by averaging.
+        Returns:
+            Columns "t", "avg", "min" and "max" (equal for raw samples).
+        """
+        times = self.raw.column("t")
+        if self.raw.size < self.raw.capacity or (times and times[0] <= since):
+            values = self.raw.column("value")
+            rows = (times, values, values, values)
+        else:
+            rows = self.tiers[-1].rows()
+            for tier in self.tiers:
+                tier_rows = tier.rows()
+                if tier_rows[0] and tier_rows[0][0] <= since:
+                    rows = tier_rows
+                    break
+        first = bisect.bisect_left(rows[0], since)
+        t, avg, low, high = (list(column[first:]) for column in rows)
+        if max_points and len(t) > max_points:
+            step = len(t) / max_points
+            spans = [
+                (int(i * step), max(int((i + 1) * step), int(i * step) + 1))
+                for i in range(max_points)
+            ]
+            t = [t[b - 1] for a, b in spans]
+            avg = [sum(avg[a:b]) / (b - a) for a, b in spans]
+            low = [min(low[a:b]) for a, b in spans]
+            high = [max(high[a:b]) for a, b in spans]
+        return {"t": t, "avg": avg, "min": low, "max": high}
+
+    def recent(self, points: int) -> List[float]:
+        return list(self.raw.column("value")[-points:])
+
+    @property
+    def nbytes(self) -> int:
+        return self.raw.nbytes + sum(tier.buffer.nbytes for tier in self.tiers)
+
+
+class HistoryStore:
+    """
+    Named metric series (e.g. "cpu.core0", "net.eth0.rx", "disk.sda.read"),
+    created on first use. Writes come from the sampler thread and reads from
+    the renderer, so access is serialized with a lock.
+    """
+
+    def __init__(self) -> None:
+        self.series: Dict[str, MetricSeries] = {}
+        self.lock = threading.Lock()
+
+    def record(self, t: float, values: Dict[str, float]) -> None:
+        with self.lock:
+            for name, value in values.items():
+                series = self.series.get(name)
+                if series is None:
+                    series = self.series[name] = MetricSeries()
+                series.add(t, value)
+
+    def query(
+        self,
+        name: str,
+        window: float = DEFAULT_GRAPH_WINDOW,
+        max_points: Optional[int] = None,
+        now: Optional[float] = None,
+    ) -> Dict[str, List[float]]:
+        since = (now or time.time()) - window
+        with self.lock:
+            series = self.series.get(name)
+            if series is None:
+                return {"t": [], "avg": [], "min": [], "max": []}
+            return series.query(since, max_points)
+
+    def recent(self, name: str, points: int = DEFAULT_HISTORY_POINTS) -> List[float]:
+        with self.lock:
+            series = self.series.get(name)
+            return series.recent(points) if series else []
+
+    def names(self, prefix: str = "") -> List[str]:
+        with self.lock:
+            return sorted(n for n in self.series if n.startswith(prefix))
+
+    @property
+    def nbytes(self) -> int:
+        with self.lock:
+            return sum(series.nbytes for series in self.series.values())
+
+
+def sparkline(
+    values: List[float], low: float = 0.0, high: Optional[float] = None
+) -> str:
+    if not values:
+        return ""
+    top = max(values) if high is None else high
+    span = (top - low) or 1.0
+    last = len(SPARKLINE_CHARS) - 1
+    return "".join(
+        SPARKLINE_CHARS[max(0, min(last, int((v - low) / span * last + 0.5)))]
+        for v in values
+    )
+
+
+def snapshot_metrics(
+    snap: MonitorSnapshot,
+    sections: List[str],
+    last_disk_io: Dict[str, Tuple[float, int, int]],
+) -> Dict[str, float]:
+    """
+    Flatten a snapshot into named series values for the given collector
+    sections. Disk IO counters are turned into rates using (and updating)
+    last_disk_io, so sections must only name collectors that actually
+    refreshed for this snapshot; stale counters would read as zero IO.
+    """
+    now = snap.timestamp
+    values: Dict[str, float] = {}
+    if "cpu" in sections:
+        values["cpu.total"] = snap.cpu.usage_percent
+        for i, usage in enumerate(snap.cpu.per_core):
+            values[f"cpu.core{i}"] = usage
+    if "memory" in sections:
+        values["memory.percent"] = snap.memory.percent
+        values["swap.percent"] = snap.memory.swap_percent
+    if "network" in sections:
+        for iface in snap.interfaces:
+            values[f"net.{iface.name}.rx"] = iface.bytes_recv_rate
+            values[f"net.{iface.name}.tx"] = iface.bytes_sent_rate
+    if "disk" in sections:
+        for disk in snap.disks:
+            name = os.path.basename(disk.device)
+            values[f"disk.{name}.percent"] = disk.percent
+            if not disk.io_stats:
+                continue
+            read, write = disk.io_stats["read_bytes"], disk.io_stats["write_bytes"]
+            last = last_disk_io.get(name)
+            if last and now > last[0]:
+                values[f"disk.{name}.read"] = (read - last[1]) / (now - last[0])
+                values[f"disk.{name}.write"] = (write - last[2]) / (now - last[0])
+            last_disk_io[name] = (now, read, write)
+    return values
+
+
 # ----------------------------------------------------------------
 # Monitor Classes
 # ----------------------------------------------------------------
@@ -788,6 +1818,7 @@ class ProcessMonitor:
         self.limit = limit
         self.processes: List[Dict[str, Any]] = []
         self.last_update: float = 0.0
+        self.scanned = 0
 
     def update(self, sort_by: str = "cpu") -> None:
         self.last_update = time.time()
@@ -815,6 +1846,7 @@ class ProcessMonitor:
                     psutil.ZombieProcess,
                 ):
                     continue
+            self.scanned = len(procs)
             if sort_by.lower() == "memory":
                 procs.sort(key=lambda p: p.get("memory_percent", 0), reverse=True)
             else:
@@ -825,11 +1857,201 @@ class ProcessMonitor:
             print_error(f"Error updating process list: {e}")
 
 
+class ProcProcessMonitor:
+    """
+    Linux process collector that reads /proc/[pid]/stat directly instead of
+    going through psutil. Name, user and create time are cached per PID
+    (keyed with the start time, so a reused PID is treated as new) and CPU%
+    comes from the change in utime+stime jiffies since the previous tick.
+    Only the top `limit` processes are turned into dicts, picked with a heap.
+    """
+
+    def __init__(self, limit: int = DEFAULT_TOP_PROCESSES) -> None:
+        self.limit = limit
+        self.processes: List[Dict[str, Any]] = []
+        self.last_update: float = 0.0
+        self.scanned = 0
+        self.clock_ticks = os.sysconf("SC_CLK_TCK")
+        self.page_size = os.sysconf("SC_PAGE_SIZE")
+        self.boot_time = psutil.boot_time()
+        self.total_memory = psutil.virtual_memory().total
+        self.cache: Dict[int, Dict[str, Any]] = {}
+        self.users: Dict[int, str] = {}
+        self._last_tick = 0.0
+
+    @staticmethod
+    def available() -> bool:
+        return sys.platform.startswith("linux") and os.path.exists("/proc/self/stat")
+
+    def _username(self, uid: int) -> str:
+        if uid not in self.users:
+            try:
+                import pwd
+
+                self.users[uid] = pwd.getpwuid(uid).pw_name
+            except (ImportError, KeyError):
+                self.users[uid] = str(uid)
+        return self.users[uid]
+
+    def _static_info(self, pid: int, name: bytes, start_ticks: int) -> Dict[str, Any]:
+        # Real uid, as psutil reports; the owner of /proc/<pid> is the
+        # effective uid and differs for setuid programs.
+        uid = -1
+        try:
+            with open(f"/proc/{pid}/status", "rb") as f:
+                for line in f:
+                    if line.startswith(b"Uid:"):
+                        uid = int(line.split()[1])
+                        break
+        except (OSError, IndexError, ValueError):
+            pass
+        return {
+            "start": start_ticks,
+            "name": name.decode("utf-8", "replace"),
+            "username": self._username(uid) if uid >= 0 else "",
+            "create_time": self.boot_time + start_ticks / self.clock_ticks,
+            "ticks": None,
+        }
+
+    def update(self, sort_by: str = "cpu") -> None:
+        self.last_update = time.time()
+        now = time.monotonic()
+        elapsed = now - self._last_tick if self._last_tick else 0.0
+        self._last_tick = now
+        by_memory = sort_by.lower() == "memory"
+        scale = 100.0 / (self.clock_ticks * elapsed) if elapsed > 0 else 0.0
+        candidates = []
+        seen = set()
+        try:
+            pids = [int(name) for name in os.listdir("/proc") if name.isdigit()]
+            for pid in pids:
+                try:
+                    with open(f"/proc/{pid}/stat", "rb") as f:
+                        data = f.read()
+                    # comm may contain spaces and parentheses; it ends at the
+                    # last ")".
+                    end = data.rfind(b")")
+                    fields = data[end + 2 :].split()
+                    ticks = int(fields[11]) + int(fields[12])
+                    start_ticks = int(fields[19])
+                    rss = int(fields[21]) * self.page_size
+                except (OSError, IndexError, ValueError):
+                    # Gone, or a short read from a process being torn down.
+                    continue
+                entry = self.cache.get(pid)
+                if entry is None or entry["start"] != start_ticks:
+                    name = data[data.find(b"(") + 1 : end]
+                    entry = self._static_info(pid, name, start_ticks)
+                    self.cache[pid] = entry
+                last_ticks = entry["ticks"]
+                entry["ticks"] = ticks
+                seen.add(pid)
+                cpu = (ticks - last_ticks) * scale if last_ticks is not None else 0.0
+                key = rss if by_memory else cpu
+                candidates.append((key, pid, cpu, rss, fields[0]))
+            self.scanned = len(seen)
+            for pid in self.cache.keys() - seen:
+                del self.cache[pid]
+            procs = []
+            for _, pid, cpu, rss, state in heapq.nlargest(self.limit, candidates):
+                entry = self.cache[pid]
+                state = state.decode()
+                procs.append(
+                    {
+                        "pid": pid,
+                        "name": entry["name"],
+                        "username": entry["username"],
+                        "cpu_percent": cpu,
+                        "memory_percent": rss / self.total_memory * 100,
+                        "status": PROC_STATUS_NAMES.get(state, state),
+                        "create_time": entry["create_time"],
+                        "memory_mb": rss / (1024 * 1024),
+                    }
+                )
+            self.processes = procs
+        except Exception as e:
+            logging.error(f"Error updating process list: {e}")
+            print_error(f"Error updating process list: {e}")
+
+
+def make_process_monitor(
+    backend: str = PROCESS_BACKEND, limit: int = DEFAULT_TOP_PROCESSES
+) -> Union[ProcessMonitor, ProcProcessMonitor]:
+    if backend == "proc" or (backend == "auto" and ProcProcessMonitor.available()):
+        return ProcProcessMonitor(limit=limit)
+    return ProcessMonitor(limit=limit)
+
+
+def compare_process_backends(
+    rounds: int = 20, interval: float = DEFAULT_PROCESS_INTERVAL / 3
+) -> Dict[str, Dict[str, float]]:
+    """
+    Run the psutil and /proc process collectors side by side and measure the
+    wall and CPU time each update takes.
+    """
+    backends = {"psutil": ProcessMonitor()}
+    if ProcProcessMonitor.available():
+        backends["proc"] = ProcProcessMonitor()
+    timings: Dict[str, Dict[str, List[float]]] = {
+        name: {"wall": [], "cpu": []} for name in backends
+    }
+    for monitor in backends.values():
+        monitor.update()  # prime per-process CPU counters
+    for _ in range(rounds):
+        time.sleep(interval)
+        for name, monitor in backends.items():
+            wall, cpu = time.perf_counter(), time.process_time()
+            monitor.update()
+            timings[name]["cpu"].append(time.process_time() - cpu)
+            timings[name]["wall"].append(time.perf_counter() - wall)
+    results = {}
+    for name, monitor in backends.items():
+        wall = sorted(timings[name]["wall"])
+        results[name] = {
+            "processes": monitor.scanned,
+            "mean_ms": sum(wall) / len(wall) * 1000,
+            "p95_ms": wall[min(len(wall) - 1, int(len(wall) * 0.95))] * 1000,
+            "cpu_ms": sum(timings[name]["cpu"]) / len(wall) * 1000,
+        }
+    return results
+
+
+def display_process_backend_comparison(results: Dict[str, Dict[str, float]]) -> None:
+    table = Table(
+        show_header=True,
+        header_style=f"bold {NordColors.FROST_1}",
+        expand=False,
+        box=None,
+        title=f"[bold {NordColors.FROST_2}]Process Collector Overhead (per update)[/]",
+    )
+    table.add_column("Backend", style=f"bold {NordColors.FROST_3}")
+    table.add_column("Processes", justify="right")
+    table.add_column("Mean", justify="right")
+    table.add_column("p95", justify="right")
+    table.add_column("CPU time", justify="right")
+    for name, row in results.items():
+        table.add_row(
+            name,
+            f"{row['processes']:,}",
+            f"{row['mean_ms']:.1f} ms",
+            f"{row['p95_ms']:.1f} ms",
+            f"{row['cpu_ms']:.1f} ms",
+        )
+    console.print(table)
+    if "proc" in results and results["proc"]["mean_ms"] > 0:
+        speedup = results["psutil"]["mean_ms"] / results["proc"]["mean_ms"]
+        print_success(f"/proc backend is {speedup:.1f}x the speed of psutil")
+    elif "proc" not in results:
+        print_warning("/proc backend is not available on this platform")
+
+
 class UnifiedMonitor:
     def __init__(
         self,
         refresh_rate: float = DEFAULT_REFRESH_RATE,
         top_limit: int = DEFAULT_TOP_PROCESSES,
+        collector_intervals: Optional[Dict[str, float]] = None,
+        process_backend: str = PROCESS_BACKEND,
     ) -> None:
         self.refresh_rate = refresh_rate
         self.start_time = time.time()
@@ -838,18 +2060,99 @@ class UnifiedMonitor:
         self.network_monitor = NetworkMonitor()
         self.cpu_monitor = CpuMonitor()
         self.memory_monitor = MemoryMonitor()
-        self.process_monitor = ProcessMonitor(limit=top_limit)
-        self.cpu_history = deque(maxlen=DEFAULT_HISTORY_POINTS)
-        self.memory_history = deque(maxlen=DEFAULT_HISTORY_POINTS)
-
-    def update(self) -> None:
-        self.cpu_monitor.update()
-        self.memory_monitor.update()
-        self.disk_monitor.update()
-        self.network_monitor.update()
-        self.process_monitor.update()
-        self.cpu_history.append(self.cpu_monitor.usage_percent)
-        self.memory_history.append(self.memory_monitor.info.percent)
+        self.process_monitor = make_process_monitor(process_backend, top_limit)
+        self.history = HistoryStore()
+        self._last_disk_io: Dict[str, Tuple[float, int, int]] = {}
+        # Collectors in priority order; cheap, fast-changing metrics run first.
+        self.collectors = {
+            "cpu": self.cpu_monitor,
+            "memory": self.memory_monitor,
+            "network": self.network_monitor,
+            "disk": self.disk_monitor,
+            "processes": self.process_monitor,
+        }
+        intervals = {
+            "cpu": refresh_rate,
+            "memory": refresh_rate,
+            "network": refresh_rate,
+            "disk": max(refresh_rate, DEFAULT_DISK_INTERVAL),
+            "processes": max(refresh_rate, DEFAULT_PROCESS_INTERVAL),
+        }
+        intervals.update(collector_intervals or {})
+        self.collector_stats = {
+            name: CollectorStats(name, intervals[name]) for name in self.collectors
+        }
+        self.tick_budget = refresh_rate * TICK_BUDGET_FRACTION
+
+    def update(self, sort_by: str = "cpu", force: bool = False) -> List[str]:
+        """
+        Run the collectors that are due this tick and return their names.
+        A due collector is deferred to a later tick if its average cost would
+        push the tick past tick_budget, unless it is already a full interval
+        late (so an expensive collector can't starve). force runs everything.
+        History is not recorded here; the sampler records it from the snapshot
+        it publishes for the tick.
+        """
+        now = time.monotonic()
+        slack = self.refresh_rate / 2  # tolerate tick jitter when checking due
+        spent = 0.0
+        ran = []
+        for name, collector in self.collectors.items():
+            stats = self.collector_stats[name]
+            elapsed = now - stats.last_run
+            if not force and stats.runs and elapsed < stats.interval - slack:
+                continue
+            overdue = not stats.runs or elapsed >= 2 * stats.interval
+            if not (force or overdue) and spent + stats.avg_cost > self.tick_budget:
+                stats.deferrals += 1
+                continue
+            started = time.perf_counter()
+            if name == "processes":
+                collector.update(sort_by)
+            else:
+                collector.update()
+            cost = time.perf_counter() - started
+            stats.record(cost, now)
+            spent += cost
+            ran.append(name)
+        return ran
+
+    @property
+    def cpu_history(self) -> List[float]:
+        return self.history.recent("cpu.total")
+
+    @property
+    def memory_history(self) -> List[float]:
+        return self.history.recent("memory.percent")
+
+    def _record_history(self, ran: List[str], snap: MonitorSnapshot) -> None:
+        """Append fresh (or replayed) snapshot values to the history series."""
+        values = snapshot_metrics(snap, ran, self._last_disk_io)
+        if values:
+            self.history.record(snap.timestamp, values)
+
+    def snapshot(self, **timing: Any) -> MonitorSnapshot:
+        """Freeze the collectors' current state into a MonitorSnapshot."""
+        cpu = self.cpu_monitor
+        return MonitorSnapshot(
+            timestamp=time.time(),
+            cpu=CpuSample(
+                usage_percent=cpu.usage_percent,
+                per_core=tuple(cpu.per_core),
+                load_avg=tuple(cpu.load_avg),
+                frequency=cpu.frequency,
+                temperature=cpu.temperature,
+            ),
+            memory=replace(self.memory_monitor.info),
+            disks=tuple(self.disk_monitor.disks),
+            interfaces=tuple(self.network_monitor.interfaces),
+            processes=tuple(self.process_monitor.processes),
+            cpu_history=tuple(self.cpu_history),
+            memory_history=tuple(self.memory_history),
+            collectors=tuple(replace(s) for s in self.collector_stats.values()),
+            tick_budget=self.tick_budget,
+            **timing,
+        )
 
     def _create_bar(self, percentage: float, color: str) -> str:
         width = 20
@@ -883,15 +2186,67 @@ class UnifiedMonitor:
         else:
             return f"{bytes_per_sec:.1f} B/s"
 
-    def build_dashboard(self, sort_by: str = "cpu") -> Layout:
-        layout = Layout()
-        layout.split_column(
-            Layout(name="header", size=3),
-            Layout(name="body"),
-            Layout(name="footer", size=3),
+    def _build_debug_panel(self, snap: MonitorSnapshot) -> Panel:
+        table = Table(
+            show_header=True,
+            header_style=f"bold {NordColors.FROST_2}",
+            expand=True,
+            box=None,
         )
+        table.add_column("Collector", style=f"bold {NordColors.FROST_3}")
+        table.add_column("Interval", style=f"{NordColors.TEXT}", justify="right")
+        table.add_column("Last", style=f"{NordColors.TEXT}", justify="right")
+        table.add_column("Avg", style=f"{NordColors.TEXT}", justify="right")
+        table.add_column("Max", style=f"{NordColors.TEXT}", justify="right")
+        table.add_column("Runs", style=f"{NordColors.TEXT}", justify="right")
+        table.add_column("Deferred", style=f"{NordColors.TEXT}", justify="right")
+        table.add_column("Age", style=f"{NordColors.TEXT}", justify="right")
+        now = time.monotonic()
+        for stats in snap.collectors:
+            cost_color = (
+                NordColors.RED
+                if stats.avg_cost > snap.tick_budget
+                else NordColors.YELLOW
+                if stats.avg_cost > snap.tick_budget / 2
+                else NordColors.GREEN
+            )
+            table.add_row(
+                stats.name,
+                f"{stats.interval:.1f}s",
+                f"{stats.last_cost * 1000:.1f} ms",
+                f"[{cost_color}]{stats.avg_cost * 1000:.1f} ms[/]",
+                f"{stats.max_cost * 1000:.1f} ms",
+                str(stats.runs),
+                str(stats.deferrals),
+                f"{now - stats.last_run:.1f}s" if stats.runs else "-",
+            )
+        return Panel(
+            table,
+            title=f"[bold {NordColors.FROST_2}]Collector Cost "
+            f"(tick budget {snap.tick_budget * 1000:.0f} ms, "
+            f"last tick {snap.duration * 1000:.0f} ms)[/]",
+            border_style=NordColors.FROST_2,
+        )
+
+    def build_dashboard(
+        self,
+        sort_by: str = "cpu",
+        snapshot: Optional[MonitorSnapshot] = None,
+        debug: bool = False,
+    ) -> Layout:
+        snap = snapshot or self.snapshot()
+        layout = Layout()
+        sections = [Layout(name="header", size=3), Layout(name="body")]
+        if debug:
+            sections.append(Layout(name="debug", size=len(snap.collectors) + 3))
+        sections.append(Layout(name="footer", size=3))
+        layout.split_column(*sections)
+        if debug:
+            layout["debug"].update(self._build_debug_panel(snap))
         hostname = socket.gethostname()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        current_time = datetime.fromtimestamp(snap.timestamp or time.time()).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
         uptime = get_system_uptime()
         header_text = f"[bold {NordColors.HEADER}]Hostname: {hostname} | Time: {current_time} | Uptime: {uptime}[/]"
         layout["header"].update(Panel(header_text, style=NordColors.HEADER))
@@ -908,7 +2263,7 @@ class UnifiedMonitor:
             Layout(name="processes", ratio=2), Layout(name="network", ratio=1)
         )
         # CPU Panel
-        cpu_info = self.cpu_monitor
+        cpu_info = snap.cpu
         cpu_table = Table(
             show_header=True,
             header_style=f"bold {NordColors.CPU}",
@@ -935,6 +2290,13 @@ class UnifiedMonitor:
         cpu_stats.add_column("Metric", style=f"bold {NordColors.FROST_3}")
         cpu_stats.add_column("Value", style=f"{NordColors.TEXT}")
         cpu_stats.add_row("Frequency", f"{cpu_info.frequency:.1f} MHz")
+        cpu_trend = self.history.query(
+            "cpu.total", DEFAULT_GRAPH_WINDOW, SPARKLINE_WIDTH, snap.timestamp
+        )
+        cpu_stats.add_row(
+            f"Trend ({DEFAULT_GRAPH_WINDOW / 60:.0f}m)",
+            f"[{NordColors.CPU}]{sparkline(cpu_trend['avg'], 0, 100)}[/]",
+        )
         cpu_stats.add_row(
             "Load Avg",
             f"{cpu_info.load_avg[0]:.2f}, {cpu_info.load_avg[1]:.2f}, {cpu_info.load_avg[2]:.2f}",
@@ -949,7 +2311,7 @@ class UnifiedMonitor:
         )
         body["left"]["cpu"].update(cpu_panel)
         # Memory Panel
-        mem_info = self.memory_monitor.info
+        mem_info = snap.memory
         mem_table = Table(box=None, expand=True)
         mem_table.add_column("Memory", style=f"bold {NordColors.MEM}")
         mem_table.add_column("Usage", style=f"{NordColors.TEXT}")
@@ -969,6 +2331,14 @@ class UnifiedMonitor:
                 f"{mem_info.swap_percent:.1f}% ({swap_used_gb:.1f}/{swap_total_gb:.1f} GB)",
                 self._create_bar(mem_info.swap_percent, NordColors.MEM),
             )
+        mem_trend = self.history.query(
+            "memory.percent", DEFAULT_GRAPH_WINDOW, SPARKLINE_WIDTH, snap.timestamp
+        )
+        mem_table.add_row(
+            "Trend",
+            f"{DEFAULT_GRAPH_WINDOW / 60:.0f} min",
+            f"[{NordColors.MEM}]{sparkline(mem_trend['avg'], 0, 100)}[/]",
+        )
         mem_panel = Panel(
             mem_table,
             title=f"[bold {NordColors.MEM}]Memory Usage[/]",
@@ -989,7 +2359,7 @@ class UnifiedMonitor:
         disk_table.add_column(
             "Usage", style=f"{NordColors.TEXT}", justify="center", ratio=2
         )
-        for disk in self.disk_monitor.disks[:4]:
+        for disk in snap.disks[:4]:
             disk_table.add_row(
                 disk.mountpoint,
                 f"{disk.total / (1024**3):.1f} GB",
@@ -1019,7 +2389,7 @@ class UnifiedMonitor:
         proc_table.add_column("MEM", style=f"{NordColors.TEXT}", justify="right")
         proc_table.add_column("User", style=f"{NordColors.TEXT}")
         proc_table.add_column("Status", style=f"{NordColors.TEXT}")
-        for proc in self.process_monitor.processes:
+        for proc in snap.processes:
             status_color = {
                 "running": NordColors.GREEN,
                 "sleeping": NordColors.FROST_3,
@@ -1055,13 +2425,13 @@ class UnifiedMonitor:
         net_table.add_column("Status", style=f"{NordColors.TEXT}", justify="center")
         active_ifaces = [
             iface
-            for iface in self.network_monitor.interfaces
+            for iface in snap.interfaces
             if iface.bytes_recv_rate > 0
             or iface.bytes_sent_rate > 0
             or iface.name.startswith(("en", "eth", "wl", "ww"))
         ]
         if not active_ifaces:
-            active_ifaces = self.network_monitor.interfaces
+            active_ifaces = list(snap.interfaces)
         for iface in active_ifaces[:4]:
             rx_rate = self._format_network_rate(iface.bytes_recv_rate)
             tx_rate = self._format_network_rate(iface.bytes_sent_rate)
@@ -1078,29 +2448,26 @@ class UnifiedMonitor:
         body["right"]["network"].update(net_panel)
         layout["body"].update(body)
         footer_text = f"[{NordColors.TEXT}]Press Ctrl+C to exit | r: refresh | q: quit | e: export data[/{NordColors.TEXT}]"
+        if snap.sequence:
+            footer_text += (
+                f"[dim] | sample #{snap.sequence}: every {snap.interval:.2f}s, "
+                f"drift {snap.drift * 1000:+.1f} ms, took {snap.duration * 1000:.0f} ms[/]"
+            )
         layout["footer"].update(Panel(footer_text, style=NordColors.HEADER))
         return layout
 
     def export_data(
-        self, export_format: str, output_file: Optional[str] = None
+        self,
+        export_format: str,
+        output_file: Optional[str] = None,
+        snapshot: Optional[MonitorSnapshot] = None,
     ) -> None:
-        data = {
-            "timestamp": datetime.now().isoformat(),
-            "system": {
-                "hostname": socket.gethostname(),
-                "uptime": get_system_uptime(),
-            },
-            "cpu": {
-                "usage_percent": self.cpu_monitor.usage_percent,
-                "per_core": self.cpu_monitor.per_core,
-                "load_avg": self.cpu_monitor.load_avg,
-                "frequency": self.cpu_monitor.frequency,
-                "temperature": self.cpu_monitor.temperature,
-            },
-            "memory": asdict(self.memory_monitor.info),
-            "disks": [asdict(d) for d in self.disk_monitor.disks],
-            "network": [asdict(n) for n in self.network_monitor.interfaces],
-            "processes": self.process_monitor.processes,
+        snap = snapshot or self.snapshot()
+        data = snapshot_to_dict(snap)
+        data["timestamp"] = datetime.fromtimestamp(snap.timestamp).isoformat()
+        data["system"] = {
+            "hostname": socket.gethostname(),
+            "uptime": get_system_uptime(),
         }
         os.makedirs(EXPORT_DIR, exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -1208,6 +2575,737 @@ class UnifiedMonitor:
             logging.exception("Error exporting data")
 
 
+# ----------------------------------------------------------------
+# Background Sampling
+# ----------------------------------------------------------------
+class BackgroundSampler:
+    """
+    Collects samples on a daemon thread at a fixed cadence, independent of
+    rendering. Ticks are scheduled on absolute monotonic deadlines so slow
+    samples don't push later ones back; if a sample overruns whole intervals,
+    the missed ticks are skipped and counted. Each tick publishes a new
+    MonitorSnapshot, and the lateness of every tick is recorded as drift.
+    """
+
+    def __init__(
+        self,
+        monitor: UnifiedMonitor,
+        interval: float = DEFAULT_REFRESH_RATE,
+        sort_by: str = "cpu",
+    ) -> None:
+        self.monitor = monitor
+        self.interval = interval
+        self.sort_by = sort_by
+        self.latest: MonitorSnapshot = MonitorSnapshot()
+        self.drifts: deque = deque(maxlen=SAMPLER_DRIFT_WINDOW)
+        self.intervals: deque = deque(maxlen=SAMPLER_DRIFT_WINDOW)
+        self.missed_ticks = 0
+        self.samples = 0
+        self.listeners: List[Callable[[MonitorSnapshot], None]] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "BackgroundSampler":
+        self._thread = threading.Thread(
+            target=self._run, name="monitor-sampler", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval + OPERATION_TIMEOUT)
+
+    def _run(self) -> None:
+        deadline = time.monotonic()
+        previous_start = 0.0
+        while not self._stop.is_set():
+            started = time.monotonic()
+            drift = started - deadline
+            ran: List[str] = []
+            try:
+                ran = self.monitor.update(self.sort_by)
+            except Exception as e:
+                logging.error(f"Sampler error: {e}")
+            duration = time.monotonic() - started
+            self.samples += 1
+            interval = started - previous_start if previous_start else 0.0
+            previous_start = started
+            self.drifts.append(drift)
+            if interval:
+                self.intervals.append(interval)
+            snap = self.monitor.snapshot(
+                sequence=self.samples,
+                interval=interval,
+                drift=drift,
+                duration=duration,
+                sections=tuple(ran),
+            )
+            self.monitor._record_history(ran, snap)
+            # Publishing is a single reference swap, so readers never see a
+            # half-built snapshot. Only the history tuples are refreshed to
+            # include this tick; the rest of the snapshot is shared.
+            self.latest = replace(
+                snap,
+                cpu_history=tuple(self.monitor.cpu_history),
+                memory_history=tuple(self.monitor.memory_history),
+            )
+            for listener in self.listeners:
+                try:
+                    listener(self.latest)
+                except Exception as e:
+                    logging.error(f"Sample listener error: {e}")
+            deadline += self.interval
+            now = time.monotonic()
+            if now > deadline:
+                skipped = int((now - deadline) // self.interval) + 1
+                self.missed_ticks += skipped
+                deadline += skipped * self.interval
+            self._stop.wait(max(0.0, deadline - time.monotonic()))
+
+    def drift_stats(self) -> Dict[str, float]:
+        """Summarize how far actual sampling strayed from the intended cadence."""
+        drifts = sorted(self.drifts)
+        intervals = list(self.intervals)
+        if not drifts:
+            return {"samples": 0}
+        p95 = drifts[min(len(drifts) - 1, int(len(drifts) * 0.95))]
+        return {
+            "samples": self.samples,
+            "target_interval": self.interval,
+            "mean_interval": sum(intervals) / len(intervals) if intervals else 0.0,
+            "mean_drift_ms": sum(drifts) / len(drifts) * 1000,
+            "p95_drift_ms": p95 * 1000,
+            "max_drift_ms": drifts[-1] * 1000,
+            "missed_ticks": self.missed_ticks,
+        }
+
+    def __enter__(self) -> "BackgroundSampler":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+
+def display_drift_stats(stats: Dict[str, float]) -> None:
+    if not stats.get("samples"):
+        return
+    table = Table(
+        show_header=False,
+        box=None,
+        expand=False,
+        title=f"[bold {NordColors.FROST_2}]Sampling Cadence[/]",
+    )
+    table.add_column("Metric", style=f"bold {NordColors.FROST_3}")
+    table.add_column("Value", style=f"{NordColors.TEXT}")
+    table.add_row("Samples", f"{stats['samples']:,}")
+    table.add_row(
+        "Interval (target / mean)",
+        f"{stats['target_interval']:.3f}s / {stats['mean_interval']:.3f}s",
+    )
+    table.add_row(
+        "Drift (mean / p95 / max)",
+        f"{stats['mean_drift_ms']:.1f} / {stats['p95_drift_ms']:.1f} / "
+        f"{stats['max_drift_ms']:.1f} ms",
+    )
+    table.add_row("Missed ticks", str(stats["missed_ticks"]))
+    console.print(table)
+
+
+# ----------------------------------------------------------------
+# Metrics Recording & Replay
+# ----------------------------------------------------------------
+def snapshot_to_dict(snap: MonitorSnapshot) -> Dict[str, Any]:
+    return {
+        "timestamp": snap.timestamp,
+        "sequence": snap.sequence,
+        "interval": snap.interval,
+        "drift": snap.drift,
+        "duration": snap.duration,
+        "sections": list(snap.sections),
+        "cpu": asdict(snap.cpu),
+        "memory": asdict(snap.memory),
+        "disks": [asdict(d) for d in snap.disks],
+        "network": [asdict(n) for n in snap.interfaces],
+        "processes": list(snap.processes),
+    }
+
+
+def record_to_snapshot(record: Dict[str, Any]) -> MonitorSnapshot:
+    cpu = record["cpu"]
+    return MonitorSnapshot(
+        timestamp=record["timestamp"],
+        sequence=record.get("sequence", 0),
+        cpu=CpuSample(
+            usage_percent=cpu["usage_percent"],
+            per_core=tuple(cpu["per_core"]),
+            load_avg=tuple(cpu["load_avg"]),
+            frequency=cpu["frequency"],
+            temperature=cpu["temperature"],
+        ),
+        memory=MemoryInfo(**record["memory"]),
+        disks=tuple(DiskInfo(**d) for d in record["disks"]),
+        interfaces=tuple(NetworkInfo(**n) for n in record["network"]),
+        processes=tuple(record["processes"]),
+        interval=record.get("interval", 0.0),
+        drift=record.get("drift", 0.0),
+        duration=record.get("duration", 0.0),
+        sections=tuple(record.get("sections", ())),
+    )
+
+
+class MetricsRecorder:
+    """
+    Appends every sample as one line of JSON to a recording file. Data is
+    flushed and fsynced every RECORDER_FSYNC_INTERVAL seconds (and on close),
+    so a crash loses at most that much; the file is rotated once it reaches
+    max_bytes, keeping the newest max_files recordings.
+    """
+
+    def __init__(
+        self,
+        directory: str = RECORDINGS_DIR,
+        max_bytes: int = RECORDER_MAX_BYTES,
+        fsync_interval: float = RECORDER_FSYNC_INTERVAL,
+        max_files: int = RECORDER_MAX_FILES,
+    ) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.fsync_interval = fsync_interval
+        self.max_files = max_files
+        self.lock = threading.Lock()
+        self.file: Optional[Any] = None
+        self.path = ""
+        self.bytes_written = 0
+        self.samples = 0
+        self.rotations = 0
+        self.last_sync = 0.0
+        os.makedirs(directory, exist_ok=True)
+        self._open()
+
+    def _open(self) -> None:
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.path = os.path.join(
+            self.directory,
+            f"monitor_{socket.gethostname()}_{stamp}_{self.rotations:03d}.ndjson",
+        )
+        self.file = open(self.path, "a", encoding="utf-8")
+        header = {
+            "type": "header",
+            "version": RECORDING_FORMAT_VERSION,
+            "hostname": socket.gethostname(),
+            "started": time.time(),
+        }
+        self.bytes_written = self.file.write(json.dumps(header) + "\n")
+        self.last_sync = time.monotonic()
+
+    def _sync(self) -> None:
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.last_sync = time.monotonic()
+
+    def _prune(self) -> None:
+        recordings = list_recordings(self.directory)
+        for old in recordings[: max(0, len(recordings) - self.max_files)]:
+            try:
+                os.remove(old)
+            except OSError:
+                pass
+
+    def write(self, snap: MonitorSnapshot) -> None:
+        line = json.dumps(snapshot_to_dict(snap), separators=(",", ":"), default=str)
+        with self.lock:
+            if self.file is None:
+                return
+            self.bytes_written += self.file.write(line + "\n")
+            self.samples += 1
+            if time.monotonic() - self.last_sync >= self.fsync_interval:
+                self._sync()
+            if self.bytes_written >= self.max_bytes:
+                self._sync()
+                self.file.close()
+                self.rotations += 1
+                self._open()
+                self._prune()
+
+    def close(self) -> None:
+        with self.lock:
+            if self.file is not None:
+                self._sync()
+                self.file.close()
+                self.file = None
+
+
+def list_recordings(path: str) -> List[str]:
+    """Return recording files for a file or directory path, oldest first."""
+    if os.path.isfile(path):
+        return [path]
+    if not os.path.isdir(path):
+        return []
+    return sorted(
+        os.path.join(path, name)
+        for name in os.listdir(path)
+        if name.endswith(".ndjson")
+    )
+
+
+def read_recording(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield sample records from a recording file or a directory of rotated
+    recordings. Header lines are skipped, as is a final line left incomplete
+    by a crash.
+    """
+    for file_path in list_recordings(path):
+        with open(file_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record.get("type") == "header":
+                    continue
+                yield record
+
+
+def convert_recording(path: str, output_dir: str, export_format: str) -> List[str]:
+    """
+    Convert a recording for analysis.
+    "csv" writes metrics.csv (one row per sample, one column per series) and
+    processes.csv (one row per process per sample). "npz" writes the same
+    per-series columns as a compressed NumPy archive, one array per series.
+    Returns:
+        The files written.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    # Recordings made before sections were stored: assume everything refreshed.
+    all_sections = ["cpu", "memory", "network", "disk"]
+    columns: Dict[str, int] = {}
+    rows: List[Tuple[float, Dict[str, float]]] = []
+    last_disk_io: Dict[str, Tuple[float, int, int]] = {}
+    base = os.path.splitext(os.path.basename(path.rstrip(os.sep)))[0]
+    written = []
+    process_file = None
+    writer = None
+    if export_format == "csv":
+        process_path = os.path.join(output_dir, f"{base}_processes.csv")
+        process_file = open(process_path, "w", newline="", encoding="utf-8")
+        writer = csv.writer(process_file)
+        writer.writerow(
+            [
+                "timestamp",
+                "pid",
+                "name",
+                "username",
+                "cpu_percent",
+                "memory_percent",
+                "memory_mb",
+                "status",
+            ]
+        )
+        written.append(process_path)
+    try:
+        for record in read_recording(path):
+            snap = record_to_snapshot(record)
+            sections = list(snap.sections) or all_sections
+            values = snapshot_metrics(snap, sections, last_disk_io)
+            for name in values:
+                columns.setdefault(name, len(columns))
+            rows.append((snap.timestamp, values))
+            if writer:
+                for proc in snap.processes:
+                    writer.writerow(
+                        [
+                            snap.timestamp,
+                            proc.get("pid"),
+                            proc.get("name"),
+                            proc.get("username"),
+                            proc.get("cpu_percent"),
+                            proc.get("memory_percent"),
+                            proc.get("memory_mb"),
+                            proc.get("status"),
+                        ]
+                    )
+    finally:
+        if process_file:
+            process_file.close()
+    names = list(columns)
+    if export_format == "csv":
+        metrics_path = os.path.join(output_dir, f"{base}_metrics.csv")
+        with open(metrics_path, "w", newline="", encoding="utf-8") as f:
+            metrics_writer = csv.writer(f)
+            metrics_writer.writerow(["timestamp"] + names)
+            for timestamp, values in rows:
+                metrics_writer.writerow(
+                    [timestamp] + [values.get(name, "") for name in names]
+                )
+        written.insert(0, metrics_path)
+    elif export_format == "npz":
+        npz_path = os.path.join(output_dir, f"{base}_metrics.npz")
+        data = {"timestamp": np.array([t for t, _ in rows], dtype=np.float64)}
+        for name in names:
+            data[name] = np.array(
+                [values.get(name, np.nan) for _, values in rows], dtype=np.float64
+            )
+        np.savez_compressed(npz_path, **data)
+        written.append(npz_path)
+    else:
+        raise ValueError(f"Unsupported conversion format: {export_format}")
+    return written
+
+
+def replay_recording(path: str, speed: float = 1.0, sort_by: str = "cpu") -> int:
+    """Play a recording back through the dashboard; returns samples shown."""
+    monitor = UnifiedMonitor()
+    shown = 0
+    previous = 0.0
+    all_sections = list(monitor.collectors)
+    try:
+        with Live(
+            monitor.build_dashboard(sort_by, MonitorSnapshot()),
+            refresh_per_second=DEFAULT_FRAME_RATE,
+            screen=True,
+        ) as live:
+            for record in read_recording(path):
+                snap = record_to_snapshot(record)
+                if previous:
+                    gap = (snap.timestamp - previous) / max(speed, 0.01)
+                    time.sleep(min(max(gap, 0.0), REPLAY_MAX_GAP))
+                previous = snap.timestamp
+                monitor._record_history(list(snap.sections) or all_sections, snap)
+                live.update(monitor.build_dashboard(sort_by, snap))
+                shown += 1
+    except KeyboardInterrupt:
+        pass
+    return shown
+
+
+def recordings_menu() -> None:
+    while True:
+        console.clear()
+        console.print(create_header())
+        print_section("Recorded Sessions")
+        recordings = list_recordings(RECORDINGS_DIR)
+        table = Table(
+            show_header=True,
+            header_style=f"bold {NordColors.FROST_1}",
+            expand=True,
+            box=None,
+        )
+        table.add_column("Recording", style=f"bold {NordColors.FROST_3}")
+        table.add_column("Size", style=f"{NordColors.TEXT}", justify="right")
+        for path in recordings[-10:]:
+            table.add_row(
+                os.path.basename(path), f"{os.path.getsize(path) / 1024**2:.1f} MB"
+            )
+        console.print(
+            Panel(
+                table if recordings else Text("No recordings yet"),
+                title=f"Recordings in {RECORDINGS_DIR}",
+                border_style=NordColors.FROST_2,
+            )
+        )
+        actions_table = Table(show_header=False, box=None, expand=True)
+        actions_table.add_column("Action", style=f"bold {NordColors.FROST_2}")
+        actions_table.add_column("Description", style=f"{NordColors.TEXT}")
+        actions_table.add_row("1", "Replay a recording in the dashboard")
+        actions_table.add_row("2", "Convert a recording to CSV")
+        actions_table.add_row("3", "Convert a recording to columnar NumPy (.npz)")
+        actions_table.add_row("4", "Return to Main Menu")
+        console.print(
+            Panel(actions_table, title="Actions", border_style=NordColors.FROST_3)
+        )
+        try:
+            choice = Prompt.ask(
+                f"[bold {NordColors.FROST_2}]Enter your choice[/]",
+                choices=["1", "2", "3", "4"],
+                default="1",
+            )
+            if choice == "4":
+                break
+            path = Prompt.ask(
+                "Recording file or directory",
+                default=recordings[-1] if recordings else RECORDINGS_DIR,
+            )
+            if not list_recordings(path):
+                print_error(f"No recordings found at {path}")
+            elif choice == "1":
+                speed = float(Prompt.ask("Playback speed multiplier", default="1.0"))
+                shown = replay_recording(path, speed)
+                print_success(f"Replayed {shown:,} samples")
+            else:
+                export_format = "csv" if choice == "2" else "npz"
+                output_dir = Prompt.ask("Output directory", default=EXPORT_DIR)
+                for written in convert_recording(path, output_dir, export_format):
+                    print_success(f"Wrote {written}")
+        except ValueError as e:
+            print_error(f"Invalid input: {e}")
+        except KeyboardInterrupt:
+            print_warning("Operation cancelled.")
+        Prompt.ask(f"[{NordColors.TEXT}]Press Enter to continue[/]", default="")
+
+
+# ----------------------------------------------------------------
+# OpenMetrics Exporter
+# ----------------------------------------------------------------
+def _openmetrics_labels(labels: Dict[str, Any]) -> str:
+    if not labels:
+        return ""
+    parts = []
+    for key, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"')
+        value = value.replace("\n", "\\n")
+        parts.append(f'{key}="{value}"')
+    return "{" + ",".join(parts) + "}"
+
+
+class _MetricFamily:
+    def __init__(self, name: str, metric_type: str, help_text: str) -> None:
+        self.name = f"{EXPORTER_PREFIX}_{name}"
+        self.metric_type = metric_type
+        self.help_text = help_text
+        self.samples: List[str] = []
+
+    def add(self, value: Optional[float], **labels: Any) -> None:
+        if value is None:
+            return
+        suffix = "_total" if self.metric_type == "counter" else ""
+        self.samples.append(
+            f"{self.name}{suffix}{_openmetrics_labels(labels)} {float(value)!r}"
+        )
+
+    def render(self) -> str:
+        return "\n".join(
+            [
+                f"# TYPE {self.name} {self.metric_type}",
+                f"# HELP {self.name} {self.help_text}",
+                *self.samples,
+            ]
+        )
+
+
+def render_openmetrics(snap: MonitorSnapshot) -> str:
+    """Serialize a snapshot in the OpenMetrics text exposition format."""
+    families: Dict[str, _MetricFamily] = {}
+
+    def family(name: str, metric_type: str, help_text: str) -> _MetricFamily:
+        if name not in families:
+            families[name] = _MetricFamily(name, metric_type, help_text)
+        return families[name]
+
+    info = family("sample", "gauge", "Sampler state for the exported snapshot.")
+    info.add(snap.sequence, field="sequence")
+    info.add(snap.timestamp, field="timestamp_seconds")
+    info.add(snap.interval, field="interval_seconds")
+    info.add(snap.drift, field="drift_seconds")
+    info.add(snap.duration, field="duration_seconds")
+
+    cpu = family("cpu_usage_percent", "gauge", "CPU utilisation in percent.")
+    cpu.add(snap.cpu.usage_percent, cpu="total")
+    for i, usage in enumerate(snap.cpu.per_core):
+        cpu.add(usage, cpu=i)
+    load = family("load_average", "gauge", "System load average.")
+    for period, value in zip(("1m", "5m", "15m"), snap.cpu.load_avg):
+        load.add(value, period=period)
+    if snap.cpu.frequency:
+        family("cpu_frequency_mhz", "gauge", "Current CPU frequency in MHz.").add(
+            snap.cpu.frequency
+        )
+    family("cpu_temperature_celsius", "gauge", "CPU temperature in Celsius.").add(
+        snap.cpu.temperature
+    )
+
+    memory = family("memory_bytes", "gauge", "Memory and swap usage in bytes.")
+    memory.add(snap.memory.total, kind="ram", state="total")
+    memory.add(snap.memory.used, kind="ram", state="used")
+    memory.add(snap.memory.available, kind="ram", state="available")
+    memory.add(snap.memory.swap_total, kind="swap", state="total")
+    memory.add(snap.memory.swap_used, kind="swap", state="used")
+    memory_percent = family("memory_usage_percent", "gauge", "Memory usage in percent.")
+    memory_percent.add(snap.memory.percent, kind="ram")
+    memory_percent.add(snap.memory.swap_percent, kind="swap")
+
+    seen_devices = set()
+    for disk in snap.disks:
+        labels = {
+            "device": disk.device,
+            "mountpoint": disk.mountpoint,
+            "fstype": disk.filesystem,
+        }
+        usage = family("disk_bytes", "gauge", "Filesystem size and usage in bytes.")
+        usage.add(disk.total, state="total", **labels)
+        usage.add(disk.used, state="used", **labels)
+        usage.add(disk.free, state="free", **labels)
+        family("disk_usage_percent", "gauge", "Filesystem usage in percent.").add(
+            disk.percent, **labels
+        )
+        device = os.path.basename(disk.device)
+        # Counters are per device; bind mounts and btrfs subvolumes share one.
+        if disk.io_stats and device not in seen_devices:
+            seen_devices.add(device)
+            family("disk_read_bytes", "counter", "Bytes read from the device.").add(
+                disk.io_stats.get("read_bytes"), device=device
+            )
+            family("disk_written_bytes", "counter", "Bytes written to the device.").add(
+                disk.io_stats.get("write_bytes"), device=device
+            )
+            family("disk_reads", "counter", "Read operations completed.").add(
+                disk.io_stats.get("read_count"), device=device
+            )
+            family("disk_writes", "counter", "Write operations completed.").add(
+                disk.io_stats.get("write_count"), device=device
+            )
+
+    for iface in snap.interfaces:
+        family("network_up", "gauge", "Whether the interface is up.").add(
+            int(iface.is_up), interface=iface.name
+        )
+        family("network_receive_bytes", "counter", "Bytes received.").add(
+            iface.bytes_recv, interface=iface.name
+        )
+        family("network_transmit_bytes", "counter", "Bytes transmitted.").add(
+            iface.bytes_sent, interface=iface.name
+        )
+        family(
+            "network_receive_bytes_per_second", "gauge", "Current receive rate."
+        ).add(iface.bytes_recv_rate, interface=iface.name)
+        family(
+            "network_transmit_bytes_per_second", "gauge", "Current transmit rate."
+        ).add(iface.bytes_sent_rate, interface=iface.name)
+
+    for rank, proc in enumerate(snap.processes, 1):
+        labels = {
+            "rank": rank,
+            "pid": proc.get("pid", ""),
+            "name": proc.get("name", ""),
+            "user": proc.get("username", "") or "",
+        }
+        family("process_cpu_percent", "gauge", "CPU usage of top processes.").add(
+            proc.get("cpu_percent"), **labels
+        )
+        family(
+            "process_memory_bytes", "gauge", "Resident memory of top processes."
+        ).add((proc.get("memory_mb") or 0.0) * 1024 * 1024, **labels)
+
+    body = "\n".join(f.render() for f in families.values() if f.samples)
+    return body + "\n# EOF\n"
+
+
+class MetricsExporter:
+    """
+    Serves the sampler's latest snapshot over HTTP at /metrics. The rendered
+    body (and its gzip encoding) is cached per sample sequence, so scrapes
+    between sampler ticks only copy bytes.
+    """
+
+    def __init__(
+        self,
+        sampler: "BackgroundSampler",
+        host: str = EXPORTER_HOST,
+        port: int = EXPORTER_PORT,
+    ) -> None:
+        self.sampler = sampler
+        self.lock = threading.Lock()
+        self.cached_sequence = -1
+        self.cached_body = b""
+        self.cached_gzip = b""
+        self.renders = 0
+        self.scrapes = 0
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                exporter.handle(self)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                logging.debug(f"Exporter {self.address_string()}: {format % args}")
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self.server.server_address[:2]
+
+    def payload(self) -> Tuple[bytes, bytes]:
+        snap = self.sampler.latest
+        with self.lock:
+            if snap.sequence != self.cached_sequence:
+                self.cached_body = render_openmetrics(snap).encode("utf-8")
+                self.cached_gzip = gzip.compress(self.cached_body, compresslevel=5)
+                self.cached_sequence = snap.sequence
+                self.renders += 1
+            self.scrapes += 1
+            return self.cached_body, self.cached_gzip
+
+    def handle(self, request: BaseHTTPRequestHandler) -> None:
+        path = request.path.split("?", 1)[0]
+        if path not in ("/", "/metrics"):
+            request.send_error(404, "Try /metrics")
+            return
+        body, compressed = self.payload()
+        request.send_response(200)
+        request.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE)
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            body = compressed
+            request.send_header("Content-Encoding", "gzip")
+        request.send_header("Content-Length", str(len(body)))
+        request.end_headers()
+        request.wfile.write(body)
+
+    def start(self) -> "MetricsExporter":
+        self._thread = threading.Thread(
+            target=self.server.serve_forever, name="metrics-exporter", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        if self._thread:
+            self._thread.join(timeout=OPERATION_TIMEOUT)
+
+
+def run_exporter(
+    host: str = EXPORTER_HOST,
+    port: int = EXPORTER_PORT,
+    refresh: float = DEFAULT_REFRESH_RATE,
+    duration: float = 0.0,
+) -> None:
+    """Headless mode: sample in the background and serve /metrics until stopped."""
+    monitor = UnifiedMonitor(refresh_rate=refresh, top_limit=DEFAULT_TOP_PROCESSES)
+    sampler = BackgroundSampler(monitor, refresh)
+    try:
+        exporter = MetricsExporter(sampler, host, port)
+    except OSError as e:
+        print_error(f"Cannot listen on {host}:{port}: {e}")
+        return
+    bound_host, bound_port = exporter.address
+    print_success(f"Serving OpenMetrics on http://{bound_host}:{bound_port}/metrics")
+    print_step("Press Ctrl+C to stop")
+    start_time = time.time()
+    # The module SIGINT handler exits the program; here Ctrl+C should only stop
+    # the exporter, so raise KeyboardInterrupt instead while it runs.
+    previous_handler = signal.signal(signal.SIGINT, signal.default_int_handler)
+    try:
+        with sampler:
+            exporter.start()
+            while duration <= 0 or time.time() - start_time < duration:
+                time.sleep(1.0)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
+        exporter.stop()
+        sampler.stop()
+        print_success(
+            f"Exporter stopped after {exporter.scrapes:,} scrapes "
+            f"({exporter.renders:,} renders)"
+        )
+
+
 # ----------------------------------------------------------------
 # Interactive Monitor Functions
 # ----------------------------------------------------------------
@@ -1218,6 +3316,8 @@ def run_monitor(
     export_interval: float = 0.0,
     output_file: Optional[str] = None,
     sort_by: str = "cpu",
+    debug: bool = False,
+    record: bool = False,
 ) -> None:
     setup_logging()
     if os.name == "posix" and os.geteuid() != 0:
@@ -1228,32 +3328,56 @@ def run_monitor(
     console.print(create_header())
     start_time = time.time()
     monitor = UnifiedMonitor(refresh_rate=refresh, top_limit=DEFAULT_TOP_PROCESSES)
+    sampler = BackgroundSampler(monitor, refresh, sort_by)
+    recorder = None
+    if record:
+        try:
+            recorder = MetricsRecorder()
+            sampler.listeners.append(recorder.write)
+        except OSError as e:
+            print_error(f"Cannot start recording: {e}")
     last_export_time = 0.0
+    frame_interval = 1 / DEFAULT_FRAME_RATE
     try:
-        with Live(
-            monitor.build_dashboard(sort_by),
-            refresh_per_second=1 / refresh,
+        with sampler, Live(
+            monitor.build_dashboard(sort_by, sampler.latest, debug),
+            refresh_per_second=DEFAULT_FRAME_RATE,
             screen=True,
         ) as live:
-            running = True
-            while running:
-                monitor.update()
-                live.update(monitor.build_dashboard(sort_by))
+            drawn = -1
+            last_draw = 0.0
+            while True:
+                snap = sampler.latest
                 now = time.time()
-                if export_format and export_interval > 0:
+                # Redraw on each new sample, and at least once a second for the clock.
+                if snap.sequence != drawn or now - last_draw >= 1.0:
+                    live.update(monitor.build_dashboard(sort_by, snap, debug))
+                    drawn, last_draw = snap.sequence, now
+                if export_format and export_interval > 0 and snap.sequence:
                     if now - last_export_time >= export_interval * 60:
-                        monitor.export_data(export_format, output_file)
+                        monitor.export_data(export_format, output_file, snap)
                         last_export_time = now
                 if duration > 0 and (now - start_time) >= duration:
                     break
-                time.sleep(refresh)
+                time.sleep(frame_interval)
     except KeyboardInterrupt:
         pass
     except Exception as e:
         print_error(f"Unexpected error: {e}")
         traceback.print_exc()
+    finally:
+        sampler.stop()
+        if recorder:
+            recorder.close()
+            print_success(
+                f"Recorded {recorder.samples:,} samples to {recorder.directory}"
+            )
     if export_format and not export_interval:
-        monitor.export_data(export_format, output_file)
+        monitor.export_data(export_format, output_file, sampler.latest)
+    stats = sampler.drift_stats()
+    if stats.get("samples"):
+        logging.info(f"Sampler cadence: {stats}")
+        display_drift_stats(stats)
     console.print(f"\n[bold {NordColors.SUCCESS}]Monitor session completed.[/]")
 
 
@@ -1264,6 +3388,8 @@ def monitor_menu() -> None:
     export_interval = 0.0
     output_file = None
     sort_by = "cpu"
+    debug = False
+    record = False
     while True:
         console.clear()
         console.print(create_header())
@@ -1278,7 +3404,9 @@ def monitor_menu() -> None:
         settings_table.add_column("Setting", style=f"{NordColors.TEXT}")
         settings_table.add_column("Description", style=f"dim {NordColors.TEXT}")
         settings_table.add_row(
-            "1. Refresh Rate", f"{refresh_rate} seconds", "Time between updates"
+            "1. Refresh Rate",
+            f"{refresh_rate} seconds",
+            "Time between CPU/memory/network samples",
         )
         settings_table.add_row(
             "2. Duration",
@@ -1303,6 +3431,16 @@ def monitor_menu() -> None:
         settings_table.add_row(
             "6. Sort Processes By", f"{sort_by.upper()}", "Sort criteria: CPU or Memory"
         )
+        settings_table.add_row(
+            "7. Debug Panel",
+            "On" if debug else "Off",
+            "Show per-collector cost and scheduling",
+        )
+        settings_table.add_row(
+            "8. Record Samples",
+            "On" if record else "Off",
+            f"Append every sample to {RECORDINGS_DIR}",
+        )
         console.print(
             Panel(
                 settings_table,
@@ -1313,16 +3451,16 @@ def monitor_menu() -> None:
         actions_table = Table(show_header=False, box=None, expand=True)
         actions_table.add_column("Action", style=f"bold {NordColors.FROST_2}")
         actions_table.add_column("Description", style=f"{NordColors.TEXT}")
-        actions_table.add_row("7", "[bold]Start Monitor[/]")
-        actions_table.add_row("8", "Return to Main Menu")
+        actions_table.add_row("9", "[bold]Start Monitor[/]")
+        actions_table.add_row("10", "Return to Main Menu")
         console.print(
             Panel(actions_table, title="Actions", border_style=NordColors.FROST_3)
         )
         try:
             choice = Prompt.ask(
                 f"[bold {NordColors.FROST_2}]Enter your choice[/]",
-                choices=["1", "2", "3", "4", "5", "6", "7", "8"],
-                default="7",
+                choices=["1", "2", "3", "4", "5", "6", "7", "8", "9", "10"],
+                default="9",
             )
             if choice == "1":
                 try:
@@ -1401,6 +3539,12 @@ def monitor_menu() -> None:
                 )
                 sort_by = "cpu" if sort_choice == "1" else "memory"
             elif choice == "7":
+                debug = not debug
+                print_success(f"Debug panel {'enabled' if debug else 'disabled'}")
+            elif choice == "8":
+                record = not record
+                print_success(f"Recording {'enabled' if record else 'disabled'}")
+            elif choice == "9":
                 run_monitor(
                     refresh=refresh_rate,
                     duration=duration,
@@ -1408,17 +3552,20 @@ def monitor_menu() -> None:
                     export_interval=export_interval,
                     output_file=output_file,
                     sort_by=sort_by,
+                    debug=debug,
+                    record=record,
                 )
-            elif choice == "8":
+            elif choice == "10":
                 break
         except KeyboardInterrupt:
             print_warning("Operation cancelled.")
-        if choice not in ["7", "8"]:
+        if choice not in ["9", "10"]:
             Prompt.ask(f"[{NordColors.TEXT}]Press Enter to continue[/]", default="")
 
 
 def benchmark_menu() -> None:
     duration = DEFAULT_BENCHMARK_DURATION
+    session: Dict[str, Dict[str, Any]] = {}
     while True:
         console.clear()
         console.print(create_header())
@@ -1441,7 +3588,10 @@ def benchmark_menu() -> None:
         actions_table.add_row("2", "Run CPU Benchmark")
         actions_table.add_row("3", "Run GPU Benchmark")
         actions_table.add_row("4", "Run Both CPU and GPU Benchmarks")
-        actions_table.add_row("5", "Return to Main Menu")
+        actions_table.add_row("5", "Compare Process Collector Overhead")
+        actions_table.add_row("6", "Run Memory Bandwidth & Latency Benchmark")
+        actions_table.add_row("7", "Run Disk I/O Benchmark")
+        actions_table.add_row("8", "Return to Main Menu")
         console.print(
             Panel(
                 actions_table,
@@ -1452,7 +3602,7 @@ def benchmark_menu() -> None:
         try:
             choice = Prompt.ask(
                 f"[bold {NordColors.FROST_2}]Enter your choice[/]",
-                choices=["1", "2", "3", "4", "5"],
+                choices=["1", "2", "3", "4", "5", "6", "7", "8"],
                 default="2",
             )
             if choice == "1":
@@ -1473,6 +3623,9 @@ def benchmark_menu() -> None:
                 console.print(create_header())
                 results = cpu_benchmark(duration)
                 display_cpu_results(results)
+                session["cpu"] = results
+                if "memory" in session:
+                    display_memory_results(session["memory"])
             elif choice == "3":
                 console.clear()
                 console.print(create_header())
@@ -1507,15 +3660,69 @@ def benchmark_menu() -> None:
                     gpu_thread.start()
                     cpu_thread.join()
                     gpu_thread.join()
+                results = cpu_results
+                session["cpu"] = results
                 display_cpu_results(cpu_results)
                 console.print()
                 display_gpu_results(gpu_results)
                 print_success("CPU and GPU Benchmarks Completed")
             elif choice == "5":
+                console.clear()
+                console.print(create_header())
+                with Progress(
+                    SpinnerColumn(style=f"bold {NordColors.FROST_1}"),
+                    TextColumn("[progress.description]{task.description}"),
+                    console=console,
+                ) as progress:
+                    progress.add_task("Timing process collectors...", total=None)
+                    results = compare_process_backends()
+                display_process_backend_comparison(results)
+            elif choice == "6":
+                console.clear()
+                console.print(create_header())
+                try:
+                    results = memory_benchmark()
+                except MemoryError as e:
+                    results = {"error": f"not enough memory: {e}"}
+                session["memory"] = results
+                if "cpu" in session:
+                    display_cpu_results(session["cpu"])
+                display_memory_results(results)
+            elif choice == "7":
+                directory = Prompt.ask(
+                    "Directory on the disk to test", default=os.path.expanduser("~")
+                )
+                file_mb = int(
+                    Prompt.ask("Test file size (MB)", default=str(DISK_BENCH_FILE_MB))
+                )
+                queue_depth = int(
+                    Prompt.ask(
+                        "Queue depth for random IO", default=str(DISK_BENCH_QUEUE_DEPTH)
+                    )
+                )
+                if not os.path.isdir(directory):
+                    print_error(f"{directory} is not a directory")
+                    results = {"error": "invalid directory"}
+                elif file_mb <= 0 or queue_depth <= 0:
+                    print_error("File size and queue depth must be > 0")
+                    results = {"error": "invalid settings"}
+                else:
+                    console.clear()
+                    console.print(create_header())
+                    results = disk_benchmark(directory, file_mb, queue_depth, duration)
+                    session["disk"] = results
+                    display_disk_results(results)
+            elif choice == "8":
                 break
+            if choice in ("2", "4", "6", "7") and "error" not in results:
+                path = save_benchmark_results(session)
+                if path:
+                    print_success(f"Results saved to {path}")
+        except ValueError:
+            print_error("Please enter a valid number")
         except KeyboardInterrupt:
             print_warning("Benchmark interrupted.")
-        if choice != "5":
+        if choice != "8":
             Prompt.ask(f"[{NordColors.TEXT}]Press Enter to continue[/]", default="")
 
 
@@ -1652,13 +3859,15 @@ def main_menu() -> None:
         menu_table.add_row("1", "System Monitor (Real-time Dashboard)")
         menu_table.add_row("2", "Run Performance Benchmarks")
         menu_table.add_row("3", "Quick CPU Status")
-        menu_table.add_row("4", "About This Tool")
-        menu_table.add_row("5", "Exit")
+        menu_table.add_row("4", "Recorded Sessions (Replay / Convert)")
+        menu_table.add_row("5", "Metrics Exporter (OpenMetrics over HTTP)")
+        menu_table.add_row("6", "About This Tool")
+        menu_table.add_row("7", "Exit")
         console.print(Panel(menu_table))
         try:
             choice = Prompt.ask(
                 f"[bold {NordColors.FROST_2}]Enter your choice[/]",
-                choices=["1", "2", "3", "4", "5"],
+                choices=["1", "2", "3", "4", "5", "6", "7"],
                 default="1",
             )
             if choice == "1":
@@ -1669,6 +3878,13 @@ def main_menu() -> None:
                 quick_cpu_status()
                 Prompt.ask(f"[{NordColors.TEXT}]Press Enter to continue[/]", default="")
             elif choice == "4":
+                recordings_menu()
+            elif choice == "5":
+                host = Prompt.ask("Listen address", default=EXPORTER_HOST)
+                port = int(Prompt.ask("Port", default=str(EXPORTER_PORT)))
+                run_exporter(host, port)
+                Prompt.ask(f"[{NordColors.TEXT}]Press Enter to continue[/]", default="")
+            elif choice == "6":
                 console.clear()
                 console.print(create_header())
                 about_text = f"""
@@ -1677,17 +3893,21 @@ def main_menu() -> None:
 A terminal application for monitoring system performance and running benchmarks.
 Key Features:
 • Real-time system resource monitoring with historical tracking
-• CPU benchmarking via prime number calculations
+• Single- and all-core CPU benchmarking with sieve, NumPy and integer kernels
+• STREAM-style memory bandwidth with thread scaling, plus load latency
+• Disk I/O benchmark: sequential and 4K random IO with queue depth and latency
 • GPU benchmarking via matrix multiplications
 • Process monitoring with sorting by CPU or memory usage
 • Data export in JSON or CSV format
+• Session recording with replay and CSV / NumPy conversion
+• Headless OpenMetrics exporter (--exporter) for Prometheus scraping
 • Fully interactive, menu-driven interface with Nord-themed styling
                 """
                 console.print(
                     Panel(about_text, title="About", border_style=NordColors.FROST_2)
                 )
                 Prompt.ask(f"[{NordColors.TEXT}]Press Enter to continue[/]", default="")
-            elif choice == "5":
+            elif choice == "7":
                 console.clear()
                 goodbye = Panel(
                     f"[bold {NordColors.FROST_2}]Thank you for using the Enhanced System Monitor![/]",
@@ -1696,17 +3916,38 @@ Key Features:
                 )
                 console.print(goodbye)
                 break
+        except ValueError as e:
+            print_error(f"Invalid input: {e}")
         except KeyboardInterrupt:
             print_warning("Operation cancelled.")
             continue
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Enhanced System Monitor")
+    parser.add_argument(
+        "--exporter",
+        action="store_true",
+        help="run headless, serving OpenMetrics at /metrics instead of the menu",
+    )
+    parser.add_argument("--host", default=EXPORTER_HOST, help="exporter listen address")
+    parser.add_argument("--port", type=int, default=EXPORTER_PORT, help="exporter port")
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=DEFAULT_REFRESH_RATE,
+        help="seconds between samples in exporter mode",
+    )
+    args = parser.parse_args()
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
     atexit.register(cleanup)
     try:
-        main_menu()
+        if args.exporter:
+            setup_logging()
+            run_exporter(args.host, args.port, args.interval)
+        else:
+            main_menu()
     except KeyboardInterrupt:
         print_warning("Program interrupted by user.")
         sys.exit(130)
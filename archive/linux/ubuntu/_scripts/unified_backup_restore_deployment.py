@@ -7,6 +7,8 @@ Features:
   • Fully interactive, numbered menu system using Rich and Pyfiglet
   • Restoration of VM Libvirt configurations and Plex Media Server data
   • Real-time progress tracking with Rich spinners and progress bars
+  • Kernel-side file copies (reflink, copy_file_range, sendfile) with buffered fallback
+  • Resumable restores: interrupted copies continue from verified checkpoints
   • Service control (stop/start) before and after restore operations
   • Detailed logging and error handling
 
@@ -14,6 +16,10 @@ Version: 1.2.0
 """
 
 import atexit
+import errno
+import fcntl
+import hashlib
+import json
 import os
 import shutil
 import signal
@@ -22,7 +28,7 @@ import sys
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
 
 # ----------------------------------------------------------------
 # Dependency Check and Imports
@@ -94,6 +100,25 @@ MAX_RETRIES: int = 3
 RETRY_DELAY: int = 2  # seconds (base delay; exponential backoff applied)
 OPERATION_TIMEOUT: int = 120  # seconds
 
+# Resumable copy settings
+RESUME_MARKER: str = ".restore-in-progress"  # Left in the target until a copy completes
+RESUME_SUFFIX: str = ".part"
+RESUME_CHECKPOINT_SUFFIX: str = ".part.json"
+RESUME_CHECKPOINT_INTERVAL: int = 64 * 1024 * 1024  # bytes between checkpoints
+RESUME_HASH_ALGORITHM: str = "sha256"
+
+# Kernel-side copy settings
+FICLONE: int = 0x40049409  # ioctl request for reflink clones (btrfs, xfs)
+FALLBACK_ERRNOS = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.ENOTTY,
+    errno.EBADF,
+    errno.EPERM,
+}
+
 
 # ----------------------------------------------------------------
 # Nord-Themed Colors & Console Setup
@@ -280,6 +305,195 @@ signal.signal(signal.SIGTERM, signal_handler)
 atexit.register(cleanup)
 
 
+# ----------------------------------------------------------------
+# File Transfer Helpers
+# ----------------------------------------------------------------
+def _kernel_copy(
+    copy_chunk: Callable[[], int], advance: Callable[[int], None]
+) -> Optional[int]:
+    """
+    Drive a kernel copy primitive until EOF.
+
+    Args:
+        copy_chunk: Callable copying up to BUFFER_SIZE bytes and returning the count.
+        advance: Progress callback receiving bytes copied per chunk.
+
+    Returns:
+        Bytes copied, or None if the primitive is unsupported and nothing was copied.
+    """
+    copied = 0
+    while True:
+        try:
+            n = copy_chunk()
+        except OSError as e:
+            if copied == 0 and e.errno in FALLBACK_ERRNOS:
+                return None
+            raise
+        if n == 0:
+            return copied
+        copied += n
+        advance(n)
+
+
+def transfer_file_data(
+    src: BinaryIO, dst: BinaryIO, advance: Callable[[int], None]
+) -> Tuple[int, str]:
+    """
+    Copy file data using the cheapest supported method: reflink clone,
+    copy_file_range, sendfile, and finally a buffered read/write loop.
+
+    Args:
+        src: Freshly opened source file (binary read).
+        dst: Freshly opened, empty destination file (binary write).
+        advance: Progress callback receiving bytes copied per chunk.
+
+    Returns:
+        A (bytes copied, method name) tuple.
+    """
+    in_fd, out_fd = src.fileno(), dst.fileno()
+    size = os.fstat(in_fd).st_size
+    # Empty files may be pseudo-files that only produce data through read().
+    if size > 0:
+        try:
+            fcntl.ioctl(out_fd, FICLONE, in_fd)
+            advance(size)
+            return size, "reflink"
+        except OSError as e:
+            if e.errno not in FALLBACK_ERRNOS:
+                raise
+        if hasattr(os, "copy_file_range"):
+            copied = _kernel_copy(
+                lambda: os.copy_file_range(in_fd, out_fd, BUFFER_SIZE), advance
+            )
+            if copied is not None:
+                return copied, "copy_file_range"
+        if hasattr(os, "sendfile"):
+            copied = _kernel_copy(
+                lambda: os.sendfile(out_fd, in_fd, None, BUFFER_SIZE), advance
+            )
+            if copied is not None:
+                return copied, "sendfile"
+    copied = 0
+    while True:
+        buf = src.read(BUFFER_SIZE)
+        if not buf:
+            break
+        dst.write(buf)
+        copied += len(buf)
+        advance(len(buf))
+    return copied, "buffered"
+
+
+def _load_checkpoint(
+    checkpoint: Path, partial: Path, src: str, src_stat: os.stat_result
+) -> Tuple[int, Any]:
+    """
+    Validate a resume checkpoint against the source and the partial file.
+
+    Args:
+        checkpoint: Checkpoint JSON path.
+        partial: Partially copied file.
+        src: Resolved path of the source file.
+        src_stat: Current stat of the source file.
+
+    Returns:
+        The offset to resume from and a hash primed with the verified prefix,
+        or (0, fresh hash) if the checkpoint is unusable.
+    """
+    hash_func = hashlib.new(RESUME_HASH_ALGORITHM)
+    try:
+        with open(checkpoint) as fin:
+            data = json.load(fin)
+        offset = int(data["offset"])
+        if (
+            data["src"] != src
+            or data["size"] != src_stat.st_size
+            or data["mtime_ns"] != src_stat.st_mtime_ns
+            or data["algorithm"] != RESUME_HASH_ALGORITHM
+            or partial.stat().st_size < offset
+        ):
+            return 0, hash_func
+        with open(partial, "rb") as fin:
+            remaining = offset
+            while remaining:
+                chunk = fin.read(min(BUFFER_SIZE, remaining))
+                if not chunk:
+                    break
+                hash_func.update(chunk)
+                remaining -= len(chunk)
+        if remaining or hash_func.hexdigest() != data["hash"]:
+            return 0, hashlib.new(RESUME_HASH_ALGORITHM)
+        return offset, hash_func
+    except (OSError, ValueError, KeyError, TypeError):
+        return 0, hashlib.new(RESUME_HASH_ALGORITHM)
+
+
+def resumable_copy_file(
+    src_file: Path, dst_file: Path, advance: Callable[[int], None]
+) -> int:
+    """
+    Copy a file through a checkpointed <dest>.part file so an interrupted copy
+    continues from the last verified offset, then rename it into place.
+
+    Args:
+        src_file: Source file.
+        dst_file: Final destination path.
+        advance: Progress callback; resumed bytes are reported up front.
+
+    Returns:
+        The number of bytes copied in this run.
+    """
+    partial = dst_file.with_name(dst_file.name + RESUME_SUFFIX)
+    checkpoint = dst_file.with_name(dst_file.name + RESUME_CHECKPOINT_SUFFIX)
+    src = str(src_file.resolve())
+    src_stat = src_file.stat()
+    offset, hash_func = 0, hashlib.new(RESUME_HASH_ALGORITHM)
+    if partial.exists() and checkpoint.exists():
+        offset, hash_func = _load_checkpoint(checkpoint, partial, src, src_stat)
+    if offset:
+        advance(offset)
+    copied = 0
+    since_checkpoint = 0
+    with open(src_file, "rb") as src, open(partial, "r+b" if offset else "wb") as dst:
+        src.seek(offset)
+        dst.seek(offset)
+        dst.truncate()
+        while True:
+            buf = src.read(BUFFER_SIZE)
+            if not buf:
+                break
+            dst.write(buf)
+            hash_func.update(buf)
+            copied += len(buf)
+            since_checkpoint += len(buf)
+            advance(len(buf))
+            if since_checkpoint >= RESUME_CHECKPOINT_INTERVAL:
+                dst.flush()
+                os.fsync(dst.fileno())
+                tmp = checkpoint.with_name(checkpoint.name + ".tmp")
+                with open(tmp, "w") as fout:
+                    json.dump(
+                        {
+                            "src": src,
+                            "size": src_stat.st_size,
+                            "mtime_ns": src_stat.st_mtime_ns,
+                            "algorithm": RESUME_HASH_ALGORITHM,
+                            "offset": offset + copied,
+                            "hash": hash_func.hexdigest(),
+                        },
+                        fout,
+                    )
+                os.replace(tmp, checkpoint)
+                since_checkpoint = 0
+        dst.flush()
+        os.fsync(dst.fileno())
+    shutil.copystat(src_file, partial)
+    os.replace(partial, dst_file)
+    if checkpoint.exists():
+        checkpoint.unlink()
+    return copied
+
+
 # ----------------------------------------------------------------
 # Core Restore Functions
 # ----------------------------------------------------------------
@@ -382,6 +596,10 @@ def copy_directory(source_path: str, target_path: str) -> bool:
     """
     Recursively copy files from source to target with progress feedback.
 
+    The target is replaced unless it holds a RESUME_MARKER from an interrupted
+    run of the same source; in that case files already restored are skipped
+    and large files continue from their last checkpoint.
+
     Args:
         source_path: Source directory.
         target_path: Destination directory.
@@ -400,7 +618,17 @@ def copy_directory(source_path: str, target_path: str) -> bool:
         f"Preparing to copy from '{source}' to '{target}'", NordColors.FROST_3
     )
     log_message(f"Starting copy from '{source}' to '{target}'")
-    if target.exists():
+    marker = target / RESUME_MARKER
+    try:
+        resuming = marker.read_text().strip() == str(source.resolve())
+    except OSError:
+        resuming = False
+    if resuming:
+        print_message(
+            f"Resuming interrupted restore into {target}", NordColors.FROST_3
+        )
+        log_message(f"Resuming interrupted restore into {target}")
+    elif target.exists():
         try:
             shutil.rmtree(target)
             print_message(
@@ -411,7 +639,8 @@ def copy_directory(source_path: str, target_path: str) -> bool:
             log_message(f"Failed to remove target directory: {e}", "ERROR")
             return False
 
-    target.parent.mkdir(parents=True, exist_ok=True)
+    target.mkdir(parents=True, exist_ok=True)
+    marker.write_text(f"{source.resolve()}\n")
     file_paths: List[Path] = []
     total_size = 0
     for f in source.rglob("*"):
@@ -445,7 +674,17 @@ def copy_directory(source_path: str, target_path: str) -> bool:
         for f in file_paths:
             rel_path = f.relative_to(source)
             dest = target / rel_path
-            file_size = f.stat().st_size
+            src_stat = f.stat()
+            file_size = src_stat.st_size
+            if resuming and dest.exists():
+                dst_stat = dest.stat()
+                if (
+                    dst_stat.st_size == file_size
+                    and dst_stat.st_mtime_ns == src_stat.st_mtime_ns
+                ):
+                    copied_size += file_size
+                    progress.update(overall_task, completed=copied_size)
+                    continue
             progress.update(
                 current_task,
                 total=file_size,
@@ -454,19 +693,22 @@ def copy_directory(source_path: str, target_path: str) -> bool:
                 description=f"Copying {rel_path}",
             )
             for attempt in range(MAX_RETRIES):
+                copied = 0
+
+                def advance(n: int) -> None:
+                    nonlocal copied
+                    copied += n
+                    progress.update(current_task, completed=copied)
+                    progress.update(overall_task, completed=copied_size + copied)
+
                 try:
-                    with open(f, "rb") as src, open(dest, "wb") as dst:
-                        copied = 0
-                        while True:
-                            buf = src.read(BUFFER_SIZE)
-                            if not buf:
-                                break
-                            dst.write(buf)
-                            copied += len(buf)
-                            copied_size += len(buf)
-                            progress.update(current_task, completed=copied)
-                            progress.update(overall_task, completed=copied_size)
-                    shutil.copystat(f, dest)
+                    if file_size >= RESUME_CHECKPOINT_INTERVAL:
+                        resumable_copy_file(f, dest, advance)
+                    else:
+                        with open(f, "rb") as src, open(dest, "wb") as dst:
+                            transfer_file_data(src, dst, advance)
+                        shutil.copystat(f, dest)
+                    copied_size += copied
                     break
                 except Exception as e:
                     if attempt < MAX_RETRIES - 1:
@@ -488,6 +730,7 @@ def copy_directory(source_path: str, target_path: str) -> bool:
             print_warning(f"...and {len(errors) - 5} more errors")
         return False
     else:
+        marker.unlink(missing_ok=True)
         print_success("Files copied successfully")
         log_message("Copy completed successfully")
         return True